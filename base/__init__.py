@@ -1,4 +1,18 @@
-from .base_extractor import BaseExtractor
 from .constants import *
 
-__all__ = ["BaseExtractor"]
+# 提取器基类和网格在首次访问时才导入（网格依赖关键词索引，导入时会构建自动机）
+_LAZY_EXPORTS = {
+    "BaseExtractor": ".base_extractor",
+    "SheetGrid": ".sheet_grid",
+}
+
+__all__ = ["BaseExtractor", "SheetGrid"]
+
+
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        import importlib
+
+        module = importlib.import_module(_LAZY_EXPORTS[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -3,12 +3,17 @@
 
 from abc import ABC, abstractmethod
 from typing import List, Dict, Any, Optional
-import pandas as pd
+
+from .sheet_grid import SheetGrid
 
 
 class BaseExtractor(ABC):
     """所有提取器的基类"""
 
+    # 提取时需要读取的行数（None 表示整张sheet）
+    # 流式读取时只解析到所有提取器中最大的行数，不会用到的行不解析
+    row_horizon: Optional[int] = None
+
     def __init__(self):
         """初始化基础提取器"""
         # 全角转半角的转换表
@@ -27,12 +32,12 @@ class BaseExtractor(ABC):
         pass
 
     def has_nearby_keyword(
-        self, df: pd.DataFrame, row: int, col: int, keywords: List[str], radius: int = 5
+        self, grid: SheetGrid, row: int, col: int, keywords: List[str], radius: int = 5
     ) -> bool:
         """检查附近是否有关键词
 
         Args:
-            df: DataFrame对象
+            grid: SheetGrid对象
             row: 行索引
             col: 列索引
             keywords: 关键词列表
@@ -41,22 +46,18 @@ class BaseExtractor(ABC):
         Returns:
             是否找到关键词
         """
-        for r in range(max(0, row - radius), min(len(df), row + radius + 1)):
-            for c in range(
-                max(0, col - radius), min(len(df.columns), col + radius + 1)
-            ):
-                cell = df.iloc[r, c]
-                if pd.notna(cell) and any(k in str(cell) for k in keywords):
-                    return True
-        return False
+        count = grid.keyword_index.window_count(
+            keywords, row - radius, row + radius, col - radius, col + radius
+        )
+        return count > 0
 
     def get_context_score(
-        self, df: pd.DataFrame, row: int, col: int, context_keywords: List[str]
+        self, grid: SheetGrid, row: int, col: int, context_keywords: List[str]
     ) -> float:
         """计算上下文评分
 
         Args:
-            df: DataFrame对象
+            grid: SheetGrid对象
             row: 行索引
             col: 列索引
             context_keywords: 上下文关键词
@@ -64,15 +65,7 @@ class BaseExtractor(ABC):
         Returns:
             上下文评分
         """
-        score = 0.0
-
-        for r in range(max(0, row - 3), min(len(df), row + 4)):
-            for c in range(max(0, col - 5), min(len(df.columns), col + 6)):
-                cell = df.iloc[r, c]
-                if pd.notna(cell):
-                    cell_str = str(cell)
-                    for keyword in context_keywords:
-                        if keyword in cell_str:
-                            score += 1.0
-
-        return score
+        hits = grid.keyword_index.window_count(
+            context_keywords, row - 3, row + 3, col - 5, col + 5, mode="hits"
+        )
+        return float(hits)
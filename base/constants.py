@@ -251,6 +251,120 @@ VALID_SKILLS = {
     "JAVASCRIPT",
 }
 
+# 不应该被空格分割的技能（保持完整性）
+NO_SPLIT_SKILLS = {
+    "VS Code",
+    "Visual Studio",
+    "Android Studio",
+    "IntelliJ IDEA",
+    "SQL Server",
+    "Azure SQL Database",
+    "Azure SQL DB",
+    "React Native",
+    "Node.js",
+    "Vue.js",
+    "React.js",
+    "TeraTerm",
+    "Tera Term",
+    "Win95/98",
+    "Finance and Operations",
+    "Dynamics 365",
+    "AWS Glue",
+    "AWS S3",
+    "AWS Lambda",
+    "AWS EC2",
+    "AWS IAM",
+    "AWS CodeCommit",
+}
+
+# 技能名称映射
+SKILL_NAME_MAPPING = {
+    # 编程语言
+    "JAVA": "Java",
+    "java": "Java",
+    "Javascript": "JavaScript",
+    "javascript": "JavaScript",
+    "JAVASCRIPT": "JavaScript",
+    "typescript": "TypeScript",
+    "TYPESCRIPT": "TypeScript",
+    "python": "Python",
+    "PYTHON": "Python",
+    # 数据库
+    "MySql": "MySQL",
+    "mysql": "MySQL",
+    "mybatis": "MyBatis",
+    "Mybatis": "MyBatis",
+    "MYBATIS": "MyBatis",
+    "PostgreSQL": "PostgreSQL",
+    "Postgre SQL": "PostgreSQL",
+    "SqlServer": "SQL Server",
+    "SQLServer": "SQL Server",
+    "sqlserver": "SQL Server",
+    "SQL SERVER": "SQL Server",
+    # 框架
+    "spring": "Spring",
+    "springboot": "SpringBoot",
+    "SpringBoot": "SpringBoot",
+    "node.js": "Node.js",
+    "Node.JS": "Node.js",
+    "nodejs": "Node.js",
+    "vue.js": "Vue",
+    "react.js": "React",
+    "thymeleaf": "Thymeleaf",
+    # IDE和工具
+    "eclipse": "Eclipse",
+    "eclipes": "Eclipse",  # 常见拼写错误
+    "ECLIPSE": "Eclipse",
+    "vscode": "VS Code",
+    "Vscode": "VS Code",
+    "VSCode": "VS Code",
+    "VScode": "VS Code",
+    "VS Code": "VS Code",
+    "VS code": "VS Code",
+    "vs code": "VS Code",
+    "Visual Studio Code": "VS Code",
+    "junit": "JUnit",
+    "Junit": "JUnit",
+    "JUNIT": "JUnit",
+    "github": "GitHub",
+    "GITHUB": "GitHub",
+    "svn": "SVN",
+    "Svn": "SVN",
+    "TortoiseSVN": "TortoiseSVN",
+    "Tortoise SVN": "TortoiseSVN",
+    "winmerge": "WinMerge",
+    "WINMERGE": "WinMerge",
+    "teraterm": "TeraTerm",
+    "TERATERM": "TeraTerm",
+    "Tera Term": "TeraTerm",
+    # 协作工具
+    "slack": "Slack",
+    "SLACK": "Slack",
+    "teams": "Teams",
+    "TEAMS": "Teams",
+    "ovice": "oVice",
+    "Ovice": "oVice",
+    # 云服务
+    "aws": "AWS",
+    "Aws": "AWS",
+    "azure": "Azure",
+    "AZURE": "Azure",
+    "Azure SQL DB": "Azure SQL Database",
+    # AWS服务标准化
+    "glue": "AWS Glue",
+    "S3": "AWS S3",
+    "Lambda": "AWS Lambda",
+    "EC2": "AWS EC2",
+    "IAM": "AWS IAM",
+    "codecommit": "AWS CodeCommit",
+    # 其他
+    "dynamics365": "Dynamics 365",
+    "Dynamics365": "Dynamics 365",
+    "FO": "Finance and Operations",
+    "JP1": "JP1",
+    "jp1": "JP1",
+}
+
 # 需要排除的非技能内容模式
 EXCLUDE_PATTERNS = [
     r"^\d{4}[-/]\d{2}[-/]\d{2}",
@@ -275,3 +389,101 @@ EXCLUDE_PATTERNS = [
     r"^携帯$",
     r"^E-mail$",
 ]
+
+# 生年月日关键词
+BIRTHDATE_KEYWORDS = [
+    "生年月日",
+    "生年月",
+    "生年",
+    "誕生日",
+    "出生日期",
+    "出生年月日",
+    "Birth Date",
+    "Birthday",
+    "DOB",
+    "Date of Birth",
+]
+
+# 性别值
+GENDER_VALUES = ["男", "男性", "女", "女性"]
+
+# 工程阶段关键词（技能提取：用于定位右侧列）
+SKILL_DESIGN_KEYWORDS = [
+    "基本設計",
+    "詳細設計",
+    "製造",
+    "単体テスト",
+    "結合テスト",
+    "総合テスト",
+    "運用保守",
+    "要件定義",
+    "基本设计",
+    "详细设计",
+    # "No.",  # 添加 No. 作为工程阶段标题
+]
+
+# 工程阶段关键词（作业范围提取）
+WORK_SCOPE_DESIGN_KEYWORDS = [
+    "基本設計",
+    "詳細設計",
+    "製造",
+    "単体テスト",
+    "結合テスト",
+    "総合テスト",
+    "運用保守",
+    "要件定義",
+    "基本设计",
+    "详细设计",
+    "単体試験",
+    "結合試験",
+    "総合試験",
+    "運用",
+    "保守",
+    "要件",
+    "定義",
+]
+
+# 工程阶段关键词（角色提取：用于定位作业范围）
+ROLE_DESIGN_KEYWORDS = [
+    "基本設計",
+    "詳細設計",
+    "製造",
+    "単体テスト",
+    "結合テスト",
+    "総合テスト",
+    "運用保守",
+    "要件定義",
+    "作業範囲",
+]
+
+# 技术列标题关键词（用于识别技术列）
+TECH_COLUMN_KEYWORDS = [
+    "言語",
+    "ツール",
+    "技術",
+    "スキル",
+    "DB",
+    "OS",
+    "フレームワーク",
+    "開発環境",
+    "プログラミング",
+    "機種",
+    "Git",
+    "SVN",
+    "バージョン管理",
+]
+
+# 角色关键词
+ROLE_KEYWORDS = ["PM", "PL", "SL", "TL", "BSE", "SE", "PG"]
+
+# 角色列标题关键词
+ROLE_COLUMN_KEYWORDS = [
+    "役割",
+    "役　割",
+    "担当",
+    "ポジション",
+    "Position",
+    "Role",
+    "職種",
+    "職位",
+]
@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+"""日期候选索引 - 每个sheet只扫描一次日期类单元格
+
+生年月日、年龄、来日年份、经验的提取器原先各自遍历sheet开头的单元格，
+分别寻找日期对象、Excel序列日期和"yyyy年mm月"形式的文本。
+这里一次扫描生成带类型的候选列表，各提取器只按行数、类型和年份范围筛选：
+
+- datetime: 日期类型的单元格（读取时已是datetime/Timestamp）
+- serial:   18000～50000的数字，批量按Excel序列日期转换后在1950～2030年之间
+- text:     单元格文本中的19xx/20xx年份（后接月份时一并解析）
+
+相邻标签等上下文判断仍由各提取器进行（各自的关键词和范围不同，
+且关键词索引上的窗口计数已经是常数时间）。
+"""
+
+from datetime import datetime
+from typing import Any, Iterable, List, NamedTuple, Optional, Union
+
+from utils.date_utils import convert_excel_serials_to_dates
+from .patterns import DATE_TEXT_CANDIDATE
+
+# 只索引前50行（使用日期候选的提取器中，范围最大的是经验的前50行）
+DATE_INDEX_MAX_ROWS = 50
+
+# 可能是Excel序列日期的数值范围（约1949～2036年）
+SERIAL_MIN = 18000
+SERIAL_MAX = 50000
+
+
+class DateCandidate(NamedTuple):
+    """日期候选
+
+    Attributes:
+        row: 行
+        col: 列
+        kind: 来源类型（"datetime" / "serial" / "text"）
+        date: 解析出的日期（text只有年月，缺少的部分为1）
+        value: 单元格的原始值
+    """
+
+    row: int
+    col: int
+    kind: str
+    date: datetime
+    value: Any
+
+
+class DateIndex:
+    """sheet开头的日期候选（按行优先顺序排列）"""
+
+    def __init__(self, grid, max_rows: int = DATE_INDEX_MAX_ROWS):
+        """扫描网格
+
+        Args:
+            grid: SheetGrid对象
+            max_rows: 扫描的行数
+        """
+        n_rows = min(max_rows, grid.n_rows)
+        candidates = []
+        numeric = []
+
+        for row in range(n_rows):
+            for col, (value, present) in enumerate(
+                zip(grid.values[row], grid.mask[row])
+            ):
+                if not present:
+                    continue
+                if isinstance(value, datetime):
+                    candidates.append(DateCandidate(row, col, "datetime", value, value))
+                elif (
+                    isinstance(value, (int, float))
+                    and SERIAL_MIN <= value <= SERIAL_MAX
+                ):
+                    numeric.append((row, col, value))
+
+        # 序列日期批量转换
+        dates = convert_excel_serials_to_dates([value for _, _, value in numeric])
+        for (row, col, value), date in zip(numeric, dates):
+            if date is not None:
+                candidates.append(DateCandidate(row, col, "serial", date, value))
+
+        # 文本中的年份：对每行的文本执行一次正则，匹配位置还原为单元格
+        row_texts = grid.row_texts
+        for row in range(n_rows):
+            row_text = row_texts.rows[row]
+            if not row_text:
+                continue
+            for match in DATE_TEXT_CANDIDATE.finditer(row_text):
+                month = int(match.group(2)) if match.group(2) else 1
+                col = row_texts.row_locate(row, match.start())
+                date = datetime(
+                    int(match.group(1)), month if 1 <= month <= 12 else 1, 1
+                )
+                candidates.append(
+                    DateCandidate(row, col, "text", date, grid.values[row][col])
+                )
+
+        candidates.sort(key=lambda candidate: (candidate.row, candidate.col))
+        self.candidates: List[DateCandidate] = candidates
+        self.n_rows = n_rows
+
+    def select(
+        self,
+        kinds: Union[str, Iterable[str]],
+        max_row: Optional[int] = None,
+        min_year: Optional[int] = None,
+        max_year: Optional[int] = None,
+    ) -> List[DateCandidate]:
+        """筛选候选
+
+        Args:
+            kinds: 来源类型（一个或多个）
+            max_row: 只要前max_row行（不超过 DATE_INDEX_MAX_ROWS）
+            min_year: 最小年份（含）
+            max_year: 最大年份（含）
+
+        Returns:
+            行优先顺序的候选列表
+        """
+        kinds = {kinds} if isinstance(kinds, str) else set(kinds)
+        return [
+            candidate
+            for candidate in self.candidates
+            if candidate.kind in kinds
+            and (max_row is None or candidate.row < max_row)
+            and (min_year is None or candidate.date.year >= min_year)
+            and (max_year is None or candidate.date.year <= max_year)
+        ]
+
+    def cells(self, max_row: Optional[int] = None) -> List[tuple]:
+        """包含任意日期候选的单元格 (行, 列)，行优先顺序、不重复"""
+        cells = []
+        for candidate in self.candidates:
+            if max_row is not None and candidate.row >= max_row:
+                break
+            cell = (candidate.row, candidate.col)
+            if not cells or cells[-1] != cell:
+                cells.append(cell)
+        return cells
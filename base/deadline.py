@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+"""提取的时间预算 - 各提取器在循环中检查，超时后放弃当前字段
+
+个别工作簿（上千列的技能矩阵、带格式的6万行sheet等）会让窗口搜索的耗时
+随表格大小成倍增长。ResumeExtractor 在执行每个字段时设置截止时间，
+提取器和各索引在逐行循环中调用 check_deadline()，超过截止时间时抛出
+DeadlineExceeded，该字段和之后的字段作为超时字段返回None。
+"""
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+# 当前字段的截止时间（time.monotonic() 的值，None 表示不限制）
+_current_deadline: ContextVar[Optional[float]] = ContextVar(
+    "extraction_deadline", default=None
+)
+
+
+class DeadlineExceeded(TimeoutError):
+    """超过了提取的时间预算"""
+
+
+def deadline_after(seconds: Optional[float]) -> Optional[float]:
+    """从现在开始经过seconds秒的截止时间（seconds为None时不限制）"""
+    if seconds is None:
+        return None
+    return time.monotonic() + seconds
+
+
+@contextmanager
+def deadline_scope(deadline: Optional[float]) -> Iterator[None]:
+    """在当前线程（上下文）中设置截止时间"""
+    token = _current_deadline.set(deadline)
+    try:
+        yield
+    finally:
+        _current_deadline.reset(token)
+
+
+def check_deadline():
+    """超过当前截止时间时抛出 DeadlineExceeded（未设置截止时间时什么都不做）
+
+    Raises:
+        DeadlineExceeded: 已超过截止时间
+    """
+    deadline = _current_deadline.get()
+    if deadline is not None and time.monotonic() >= deadline:
+        raise DeadlineExceeded("超过了提取的时间预算")
@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+"""字段调度器 - 按字段依赖关系（DAG）执行各提取器"""
+
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, List, Sequence, Tuple
+
+
+class FieldNode:
+    """调度图中的一个字段
+
+    Attributes:
+        name: 字段名（结果字典的键）
+        func: 提取函数，调用方式为 func(*args, *依赖字段的结果)
+        deps: 依赖的字段名（按func参数顺序）
+    """
+
+    __slots__ = ("name", "func", "deps")
+
+    def __init__(self, name: str, func: Callable[..., Any], deps: Sequence[str] = ()):
+        self.name = name
+        self.func = func
+        self.deps = tuple(deps)
+
+    def __repr__(self) -> str:
+        return f"FieldNode({self.name!r}, deps={self.deps!r})"
+
+
+class FieldScheduler:
+    """按依赖关系执行字段提取
+
+    没有依赖关系的字段互不影响，可以在线程池中并发执行；
+    有依赖的字段等所依赖的字段完成后再提交。
+    各字段共享同一份sheet数据（DataFrame、SheetGrid及其索引），
+    因此使用线程池而不是进程池，避免每个字段都序列化整个工作簿。
+    """
+
+    def __init__(self, nodes: Sequence[FieldNode]):
+        """初始化调度器并检查依赖图
+
+        Args:
+            nodes: 字段节点（声明顺序即顺序执行时的优先顺序）
+
+        Raises:
+            ValueError: 字段名重复、依赖了未声明的字段或存在循环依赖
+        """
+        self.nodes: Dict[str, FieldNode] = {}
+        for node in nodes:
+            if node.name in self.nodes:
+                raise ValueError(f"字段重复: {node.name}")
+            self.nodes[node.name] = node
+
+        for node in self.nodes.values():
+            for dep in node.deps:
+                if dep not in self.nodes:
+                    raise ValueError(f"字段 {node.name} 依赖了未声明的字段 {dep}")
+
+        self.order = self._topological_order()
+
+    def _topological_order(self) -> List[str]:
+        """在满足依赖的前提下尽量保持声明顺序的拓扑序"""
+        order = []
+        done = set()
+        pending = list(self.nodes)
+        while pending:
+            for name in pending:
+                if all(dep in done for dep in self.nodes[name].deps):
+                    break
+            else:
+                raise ValueError(f"字段之间存在循环依赖: {', '.join(pending)}")
+            pending.remove(name)
+            done.add(name)
+            order.append(name)
+        return order
+
+    def run(
+        self, *args: Any, max_workers: int = 1
+    ) -> Tuple[Dict[str, Any], Dict[str, float]]:
+        """执行所有字段
+
+        Args:
+            *args: 传给每个字段提取函数的公共参数
+            max_workers: 线程数（1 表示按拓扑序在当前线程中顺序执行）
+
+        Returns:
+            (字段名 -> 结果, 字段名 -> 耗时毫秒)
+
+        任一字段抛出异常时，不再提交新的字段，等已开始的字段结束后重新抛出。
+        """
+        results: Dict[str, Any] = {}
+        timings: Dict[str, float] = {}
+
+        if max_workers <= 1:
+            for name in self.order:
+                results[name], timings[name] = self._run_node(
+                    self.nodes[name], args, results
+                )
+            return results, timings
+
+        remaining = {name: set(node.deps) for name, node in self.nodes.items()}
+        with ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="field"
+        ) as executor:
+            running = {}
+
+            def submit_ready():
+                for name in self.order:
+                    if name in remaining and not remaining[name]:
+                        del remaining[name]
+                        future = executor.submit(
+                            self._run_node, self.nodes[name], args, dict(results)
+                        )
+                        running[future] = name
+
+            submit_ready()
+            while running:
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    name = running.pop(future)
+                    try:
+                        results[name], timings[name] = future.result()
+                    except BaseException:
+                        for other in running:
+                            other.cancel()
+                        raise
+                    for deps in remaining.values():
+                        deps.discard(name)
+                submit_ready()
+
+        return results, timings
+
+    @staticmethod
+    def _run_node(
+        node: FieldNode, args: Tuple[Any, ...], results: Dict[str, Any]
+    ) -> Tuple[Any, float]:
+        """执行单个字段并计时"""
+        start = time.perf_counter()
+        value = node.func(*args, *(results[dep] for dep in node.deps))
+        return value, (time.perf_counter() - start) * 1000
@@ -0,0 +1,222 @@
+# -*- coding: utf-8 -*-
+"""关键词位置索引 - 每个sheet只扫描一次所有关键词组"""
+
+from collections import defaultdict
+from typing import Dict, FrozenSet, List, Optional, Sequence, Tuple
+
+from utils.aho_corasick import AhoCorasick
+from .constants import (
+    KEYWORDS,
+    VALID_NATIONALITIES,
+    BIRTHDATE_KEYWORDS,
+    GENDER_VALUES,
+    SKILL_DESIGN_KEYWORDS,
+    WORK_SCOPE_DESIGN_KEYWORDS,
+    ROLE_DESIGN_KEYWORDS,
+    TECH_COLUMN_KEYWORDS,
+    ROLE_COLUMN_KEYWORDS,
+)
+from .deadline import check_deadline
+
+# 所有关键词组：组名 -> 关键词列表
+KEYWORD_GROUPS: Dict[str, List[str]] = {
+    **KEYWORDS,
+    "nationality_values": VALID_NATIONALITIES,
+    "birthdate": BIRTHDATE_KEYWORDS,
+    "gender_values": GENDER_VALUES,
+    "skill_design": SKILL_DESIGN_KEYWORDS,
+    "work_scope_design": WORK_SCOPE_DESIGN_KEYWORDS,
+    "role_design": ROLE_DESIGN_KEYWORDS,
+    "tech_column": TECH_COLUMN_KEYWORDS,
+    "role_column": ROLE_COLUMN_KEYWORDS,
+}
+
+# 关键词 -> 所属的组
+_KEYWORD_TO_GROUPS: Dict[str, List[str]] = defaultdict(list)
+for _group, _keywords in KEYWORD_GROUPS.items():
+    for _keyword in _keywords:
+        if _group not in _KEYWORD_TO_GROUPS[_keyword]:
+            _KEYWORD_TO_GROUPS[_keyword].append(_group)
+
+# 组名 -> 去重后的关键词（保持定义顺序，部分组中有重复定义的关键词）
+_GROUP_ORDER: Dict[str, Tuple[str, ...]] = {
+    _group: tuple(dict.fromkeys(_keywords))
+    for _group, _keywords in KEYWORD_GROUPS.items()
+}
+
+# 导入时编译一次，所有sheet共享
+KEYWORD_AUTOMATON = AhoCorasick(_KEYWORD_TO_GROUPS)
+
+_EMPTY: FrozenSet[str] = frozenset()
+
+
+class KeywordIndex:
+    """单个sheet的关键词位置索引
+
+    用一个多模式自动机扫描每个单元格一次，记录所有关键词组的命中位置，
+    提取器直接按组查询位置，不再各自重复扫描整张表。
+
+    同时按关键词列表缓存二维前缀和（summed-area table），
+    任意矩形窗口内的关键词命中数可以O(1)得到。
+    """
+
+    def __init__(self, grid):
+        """扫描网格建立索引
+
+        Args:
+            grid: SheetGrid对象
+        """
+        # (row, col) -> 该单元格命中的所有关键词
+        self.cell_keywords: Dict[Tuple[int, int], FrozenSet[str]] = {}
+        # 组名 -> [(row, col, 命中的关键词), ...]（行优先顺序）
+        self.positions: Dict[str, List[Tuple[int, int, str]]] = defaultdict(list)
+        # 组名 -> {(row, col): 命中的该组关键词}
+        self._group_cells: Dict[str, Dict[Tuple[int, int], FrozenSet[str]]] = (
+            defaultdict(dict)
+        )
+
+        self._grid = grid
+        # (关键词元组, 模式) -> 前缀和表
+        self._tables: Dict[Tuple[Tuple[str, ...], str], List[List[int]]] = {}
+
+        find_all = KEYWORD_AUTOMATON.find_all
+        for row in range(grid.n_rows):
+            check_deadline()
+            row_strings = grid.strings[row]
+            row_mask = grid.mask[row]
+            for col in range(grid.n_cols):
+                if not row_mask[col] or not row_strings[col]:
+                    continue
+                matched = find_all(row_strings[col])
+                if not matched:
+                    continue
+
+                self.cell_keywords[(row, col)] = matched
+                by_group = defaultdict(set)
+                for keyword in matched:
+                    for group in _KEYWORD_TO_GROUPS[keyword]:
+                        by_group[group].add(keyword)
+
+                for group, keywords in by_group.items():
+                    self._group_cells[group][(row, col)] = frozenset(keywords)
+                    # 按组内关键词的定义顺序记录，保证结果确定
+                    for keyword in _GROUP_ORDER[group]:
+                        if keyword in keywords:
+                            self.positions[group].append((row, col, keyword))
+
+    def cells(self, group: str, max_row: Optional[int] = None) -> List[Tuple[int, int]]:
+        """获取命中某个关键词组的单元格（行优先，去重）
+
+        Args:
+            group: 关键词组名
+            max_row: 只返回行号小于该值的单元格
+
+        Returns:
+            [(row, col), ...]
+        """
+        cells = self._group_cells.get(group, {})
+        if max_row is None:
+            return list(cells)
+        return [pos for pos in cells if pos[0] < max_row]
+
+    def keywords_at(self, group: str, row: int, col: int) -> FrozenSet[str]:
+        """获取单元格命中的某组关键词"""
+        return self._group_cells.get(group, {}).get((row, col), _EMPTY)
+
+    def has(self, group: str, row: int, col: int) -> bool:
+        """单元格是否命中某个关键词组"""
+        return (row, col) in self._group_cells.get(group, {})
+
+    def first_keyword(self, group: str, row: int, col: int) -> Optional[str]:
+        """按组内定义顺序返回单元格命中的第一个关键词"""
+        matched = self.keywords_at(group, row, col)
+        if matched:
+            for keyword in KEYWORD_GROUPS[group]:
+                if keyword in matched:
+                    return keyword
+        return None
+
+    def window_count(
+        self,
+        keywords: Sequence[str],
+        row_start: int,
+        row_end: int,
+        col_start: int,
+        col_end: int,
+        mode: str = "any",
+    ) -> int:
+        """统计矩形窗口内的关键词命中（O(1)）
+
+        窗口为闭区间，超出表格的部分会被裁剪。
+
+        Args:
+            keywords: 关键词列表
+            row_start: 起始行
+            row_end: 结束行（含）
+            col_start: 起始列
+            col_end: 结束列（含）
+            mode: "any" 统计包含任一关键词的单元格数；
+                  "hits" 统计每个单元格命中的关键词个数之和
+
+        Returns:
+            命中数
+        """
+        row_start = max(0, row_start)
+        col_start = max(0, col_start)
+        row_end = min(self._grid.n_rows - 1, row_end)
+        col_end = min(self._grid.n_cols - 1, col_end)
+        if row_start > row_end or col_start > col_end:
+            return 0
+
+        table = self._get_table(keywords, mode)
+        return (
+            table[row_end + 1][col_end + 1]
+            - table[row_start][col_end + 1]
+            - table[row_end + 1][col_start]
+            + table[row_start][col_start]
+        )
+
+    def _get_table(self, keywords: Sequence[str], mode: str) -> List[List[int]]:
+        """获取（必要时构建）关键词列表对应的前缀和表"""
+        key = (tuple(keywords), mode)
+        table = self._tables.get(key)
+        if table is None:
+            table = self._build_table(key[0], mode)
+            self._tables[key] = table
+        return table
+
+    def _build_table(self, keywords: Tuple[str, ...], mode: str) -> List[List[int]]:
+        """构建前缀和表"""
+        import numpy as np
+
+        grid = self._grid
+        weights = np.zeros((grid.n_rows, grid.n_cols), dtype=np.int64)
+
+        if all(keyword in KEYWORD_AUTOMATON.patterns for keyword in keywords):
+            # 所有关键词都已在索引中，直接复用扫描结果
+            matched_cells = self.cell_keywords.items()
+        else:
+            # 索引外的关键词：为该列表单独扫描一次
+            find_all = AhoCorasick(keywords).find_all
+            matched_cells = []
+            for row in range(grid.n_rows):
+                check_deadline()
+                row_strings = grid.strings[row]
+                row_mask = grid.mask[row]
+                for col in range(grid.n_cols):
+                    if row_mask[col] and row_strings[col]:
+                        matched = find_all(row_strings[col])
+                        if matched:
+                            matched_cells.append(((row, col), matched))
+
+        for (row, col), matched in matched_cells:
+            if mode == "hits":
+                # 与逐个关键词累加一致：列表中重复的关键词重复计数
+                weight = sum(1 for keyword in keywords if keyword in matched)
+            else:
+                weight = 1 if any(keyword in matched for keyword in keywords) else 0
+            weights[row, col] = weight
+
+        table = np.zeros((grid.n_rows + 1, grid.n_cols + 1), dtype=np.int64)
+        table[1:, 1:] = weights.cumsum(axis=0).cumsum(axis=1)
+        return table.tolist()
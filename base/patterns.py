@@ -0,0 +1,307 @@
+# -*- coding: utf-8 -*-
+"""正则表达式注册表 - 所有模式在导入时编译一次
+
+提取器在逐单元格的循环中直接使用这里的预编译对象，
+不再每次调用时重新构建模式列表、查询re模块的编译缓存。
+
+只做"是否匹配"判断的模式列表合并为一个交替正则（结果与逐个判断一致）；
+按列表顺序取第一个匹配、或每个模式各自产生候选的列表保持为有序列表。
+"""
+
+import re
+from typing import Dict, List, Pattern, Tuple
+
+from .constants import EXCLUDE_PATTERNS, ROLE_KEYWORDS, VALID_SKILLS
+
+
+def _combine(patterns: List[str], flags: int = 0) -> Pattern:
+    """将多个模式合并为一个交替正则
+
+    仅用于 any(re.search/re.match(p, s) for p in patterns) 这种布尔判断，
+    合并后的 search/match 结果与逐个判断完全一致。
+    """
+    return re.compile("|".join(f"(?:{pattern})" for pattern in patterns), flags)
+
+
+class _LazyPatterns(dict):
+    """按键首次访问时才编译的模式表
+
+    键很多而每次只用到其中少数时使用，避免导入时编译全部模式。
+    """
+
+    def __init__(self, keys, build):
+        super().__init__()
+        self._keys = frozenset(keys)
+        self._build = build
+
+    def __missing__(self, key):
+        if key not in self._keys:
+            raise KeyError(key)
+        pattern = self[key] = self._build(key)
+        return pattern
+
+
+# ========== 通用 ==========
+
+# 连续空白
+WHITESPACE = re.compile(r"\s+")
+
+# 包含汉字
+KANJI = re.compile(r"[一-龥]")
+
+# 包含文字字符（汉字、假名、英文字母）
+NAME_CHARS = re.compile(r"[一-龥ぁ-んァ-ンa-zA-Z]")
+
+# 包含英文字母
+LATIN_LETTER = re.compile(r"[a-zA-Z]")
+
+# 项目期间开头的日期（"2020年4月"、"2020/04/"），表示新项目开始
+PROJECT_DATE_PREFIX = re.compile(r"^\d{4}[年/]\d{1,2}[月/]")
+
+# 小数或整数
+DECIMAL_NUMBER = re.compile(r"(\d+(?:\.\d+)?)")
+
+# ========== 年龄 ==========
+
+# 1-2位纯数字
+AGE_NUMBER = re.compile(r"^(\d{1,2})$")
+
+# 数字+年龄单位（"30歳"）
+AGE_WITH_UNIT = re.compile(r"(\d{1,2})\s*[歳才歲]")
+
+# 行文本中的年龄模式（每个模式各自产生候选）
+AGE_ROW_PATTERNS: List[Tuple[Pattern, float]] = [
+    (re.compile(r"満\s*(\d{1,2})\s*[才歳歲]"), 3.5),  # "満 30 才"
+    (re.compile(r"満\s*(\d{1,2})(?:\s|$)"), 3.0),  # "満 30"
+    (re.compile(r"(\d{1,2})\s*[才歳歲]"), 2.5),  # "30 才"
+    (re.compile(r"年齢[：:]\s*(\d{1,2})"), 2.5),  # "年齢：30"
+    (re.compile(r"年齢\s*(\d{1,2})"), 2.0),  # "年齢 30"
+    (re.compile(r"(?:^|\s)(\d{1,2})(?:\s|$)"), 1.0),  # 独立的数字
+]
+
+# 单元格年龄值的解析模式（按顺序取第一个有效结果）
+AGE_VALUE_PATTERNS: List[Pattern] = [
+    re.compile(r"満\s*(\d{1,2})\s*[歳才歲]"),  # "満 30 歳"
+    re.compile(r"満\s*(\d{1,2})(?:\s|$)"),  # "満 30"
+    re.compile(r"(\d{1,2})\s*[歳才歲]"),  # "30歳"
+    re.compile(r"^(\d{1,2})$"),  # 纯数字
+]
+
+# ========== 生年月日 ==========
+
+# "1994年"
+BIRTH_YEAR_NEN = re.compile(r"(19[5-9]\d|20[0-1]\d)年")
+
+# 单元格文本中的年份（及其后的月份），日期候选索引用。
+# 生年月日的文本模式都包含4位的19xx/20xx年份，没有该子串的单元格不会匹配
+DATE_TEXT_CANDIDATE = re.compile(r"((?:19|20)\d{2})(?:\s*[年/.\-]\s*(\d{1,2})(?!\d))?")
+
+# yyyy年mm月dd日
+BIRTH_FULL_DATE = re.compile(
+    r"(19[5-9]\d|20[0-1]\d)[年/](0?[1-9]|1[0-2])[月/](0?[1-9]|[12]\d|3[01])日?"
+)
+
+# yyyy.mm.dd
+BIRTH_NUMERIC_DATE = re.compile(
+    r"(19[5-9]\d|20[0-1]\d)[\.\-/](0?[1-9]|1[0-2])[\.\-/](0?[1-9]|[12]\d|3[01])"
+)
+
+# 只有年份
+BIRTH_YEAR_ONLY = re.compile(r"\b(19[5-9]\d|20[0-1]\d)\b")
+
+# 月、日
+MONTH_NUMBER = re.compile(r"(\d{1,2})月")
+DAY_NUMBER = re.compile(r"(\d{1,2})日")
+
+# ========== 来日年份 ==========
+
+# "来日XX年"、"在日XX年"等表述（每个模式各自产生候选，均包含"年"字）
+ARRIVAL_YEARS_PATTERNS: List[Tuple[Pattern, float]] = [
+    (re.compile(r"来日\s*(\d{1,2})\s*年"), 4.0),
+    (re.compile(r"在日\s*(\d{1,2})\s*年"), 4.0),
+    (re.compile(r"日本滞在\s*(\d{1,2})\s*年"), 3.5),
+    (re.compile(r"滞在年数\s*(\d{1,2})\s*年?"), 3.5),
+    (re.compile(r"日本.*?(\d{1,2})\s*年"), 2.0),
+    (re.compile(r"(\d{1,2})\s*年.*?日本"), 2.0),
+]
+
+# 2000年代的年份
+YEAR_2000S = re.compile(r"^20\d{2}$")
+YEAR_2000S_WITH_UNIT = re.compile(r"(20\d{2})[年/月]")
+YEAR_2000S_YEAR_MONTH = re.compile(r"(20\d{2})年\d+月")
+
+# 和暦
+HEISEI_YEAR = re.compile(r"平成\s*(\d+)")
+REIWA_YEAR = re.compile(r"令和\s*(\d+)")
+
+# ========== 经验年数 ==========
+
+EXPERIENCE_YEAR_MONTH_EXACT = re.compile(r"^(\d+)\s*年\s*(\d+)\s*ヶ月$")
+EXPERIENCE_YEARS_EXACT = re.compile(r"^(\d+(?:\.\d+)?)\s*年$")
+EXPERIENCE_NUMBER_EXACT = re.compile(r"^(\d+(?:\.\d+)?)\s*$")
+EXPERIENCE_YEAR_MONTH = re.compile(r"(\d+)\s*年\s*(\d+)\s*ヶ月")
+EXPERIENCE_YEARS = re.compile(r"(\d+)\s*年")
+
+# ========== 日语水平 ==========
+
+# N级别数字
+JLPT_LEVEL = re.compile(r"[NnＮ]([1-5１-５])")
+
+# JLPT等级模式（每个模式各自产生候选）
+JLPT_PATTERNS: List[Tuple[Pattern, float]] = [
+    # 高置信度模式 - 包含流暢等描述
+    (
+        re.compile(
+            r"[NnＮ]([1-5１-５])\s*(?:かなり|とても|非常に)?\s*(?:流暢|流暢)",
+            re.IGNORECASE | re.MULTILINE,
+        ),
+        4.0,
+    ),
+    (
+        re.compile(
+            r"JLPT\s*[NnＮ]([1-5１-５])\s*(?:かなり|とても|非常に)?\s*(?:流暢|流暢)",
+            re.IGNORECASE | re.MULTILINE,
+        ),
+        4.5,
+    ),
+    # 标准JLPT模式
+    (re.compile(r"JLPT\s*[NnＮ]([1-5１-５])", re.IGNORECASE | re.MULTILINE), 2.0),
+    (
+        re.compile(
+            r"[NnＮ]([1-5１-５])\s*(?:合格|取得|レベル|級)",
+            re.IGNORECASE | re.MULTILINE,
+        ),
+        1.8,
+    ),
+    (
+        re.compile(
+            r"日本語能力試験\s*[NnＮ]?([1-5１-５])\s*級?",
+            re.IGNORECASE | re.MULTILINE,
+        ),
+        1.5,
+    ),
+    (
+        re.compile(
+            r"(?:^|\s)[NnＮ]([1-5１-５])(?:\s|$|[\(（])",
+            re.IGNORECASE | re.MULTILINE,
+        ),
+        1.0,
+    ),
+    (re.compile(r"日本語.*?([一二三四五])級", re.IGNORECASE | re.MULTILINE), 1.3),
+    (re.compile(r"([一二三四五])級.*?日本語", re.IGNORECASE | re.MULTILINE), 1.3),
+]
+
+# 流暢等描述（每个模式各自产生候选）
+FLUENCY_PATTERNS: List[Tuple[Pattern, float]] = [
+    # N级别+流暢组合
+    (
+        re.compile(
+            r"[NnＮ]([1-5１-５])\s*(かなり|とても|非常に)?\s*(流暢|流暢)", re.IGNORECASE
+        ),
+        3.5,
+    ),
+    # 日本語+流暢
+    (re.compile(r"日本語\s*(かなり|とても|非常に)\s*(流暢|流暢)", re.IGNORECASE), 2.5),
+    (
+        re.compile(r"日本語.*?(かなり|とても|非常に).*?(流暢|流暢)", re.IGNORECASE),
+        2.0,
+    ),
+    # 其他级别描述
+    (re.compile(r"(ビジネス|商务)\s*レベル", re.IGNORECASE), 2.0),
+    (re.compile(r"(母語|母国語|ネイティブ)\s*レベル", re.IGNORECASE), 3.0),
+    (re.compile(r"(上級|中級|初級)\s*(レベル)?", re.IGNORECASE), 1.5),
+]
+
+# 其他日语水平描述（每个模式各自产生候选）
+OTHER_LEVEL_PATTERNS: List[Tuple[Pattern, float]] = [
+    (re.compile(r"日本語.*?(ビジネス)", re.IGNORECASE), 1.0),
+    (re.compile(r"日本語.*?(上級)", re.IGNORECASE), 0.8),
+    (re.compile(r"日本語.*?(中級)", re.IGNORECASE), 0.7),
+    (re.compile(r"日本語.*?(初級)", re.IGNORECASE), 0.5),
+    (re.compile(r"(JLPT|日本語能力)", re.IGNORECASE), 0.5),  # 只提到但没有具体级别
+]
+
+# ========== 技能 ==========
+
+# 常见技术关键词（合并为一个正则）
+TECH_CONTENT = _combine(
+    [
+        r"\b(Java|Python|JavaScript|PHP|Ruby|C\+\+|C#|Go|VB|COBOL)\b",
+        r"\b(Spring|React|Vue|Angular|Django|Rails|Node\.js|\.NET)\b",
+        r"\b(MySQL|PostgreSQL|Oracle|MongoDB|Redis|SQL\s*Server|DB2)\b",
+        r"\b(AWS|Azure|GCP|Docker|Kubernetes)\b",
+        r"\b(Git|SVN|Jenkins|Maven|TortoiseSVN|GitHub)\b",
+        r"\b(Windows|Linux|Unix|Ubuntu|CentOS|win\d+)\b",
+        r"\b(Eclipse|IntelliJ|VS\s*Code|Visual\s*Studio|NetBeans)\b",
+        r"(HTML|CSS|SQL|XML|JSON|TeraTerm)",
+    ],
+    re.IGNORECASE,
+)
+
+# 需要排除的非技能内容（合并 EXCLUDE_PATTERNS，配合 match 使用）
+SKILL_EXCLUDE = _combine(EXCLUDE_PATTERNS, re.IGNORECASE)
+
+# 技能前的标记符号
+SKILL_MARK_PREFIX = re.compile(r"^[◎○△×★●◯▲※・\-\s]+")
+
+# "Python AWS (glue/S3/Lambda)" 形式
+SKILL_BRACKET = re.compile(r"([^(]+)\s*\(([^)]+)\)")
+
+# 技能分隔符
+SKILL_SEPARATORS = re.compile(r"[、,，/／\s\|｜]+")
+
+# 操作系统
+WIN_VERSION = re.compile(r"^win\d+$")
+WINDOWS_VERSION = re.compile(r"^Windows\s*\d+$", re.IGNORECASE)
+
+# 全文搜索时每个预定义技能的匹配模式（单词边界或分隔符包围）
+# 只有文本中出现的技能才会被查询，按需编译
+SKILL_FALLBACK_PATTERNS: Dict[str, Pattern] = _LazyPatterns(
+    VALID_SKILLS,
+    lambda skill: _combine(
+        [
+            rf"\b{re.escape(skill)}\b",
+            rf"(?:^|\s|[、,，/]){re.escape(skill)}(?:$|\s|[、,，/])",
+        ],
+        re.IGNORECASE,
+    ),
+)
+
+# ========== 角色 ==========
+
+# 角色前的标记符号
+ROLE_MARK_PREFIX = re.compile(r"^[●○◎△×・\-\s]+")
+
+# 包含角色缩写的技术术语（PL/SQL等）
+ROLE_TECH_COMBINATION = _combine(
+    [
+        r"SQL[・\s]*PL",  # SQL・PL
+        r"PL[・\s]*SQL",  # PL・SQL
+        r"\bPL/",  # PL/开头的技术术语
+        r"/PL\b",  # /PL结尾的技术术语
+    ],
+    re.IGNORECASE,
+)
+
+# "角色名：说明"格式
+ROLE_LABEL = re.compile(r"(PM|PL|SL|TL|BSE|SE|PG)[：:]")
+
+# 独立的角色词（完全匹配、以角色开头/结尾都是该模式的特例）
+ROLE_WORD_PATTERNS: Dict[str, Pattern] = {
+    role: re.compile(rf"(?:^|[^A-Za-z]){role}(?:[^A-Za-z]|$)", re.IGNORECASE)
+    for role in ROLE_KEYWORDS
+}
+
+# ========== 姓名 ==========
+
+# 英文缩写名
+UPPER_ABBREVIATION = re.compile(r"^[A-Z]{2,4}$")
+
+# 姓名各部分的分隔
+NAME_PART_SEPARATOR = re.compile(r"[\s　]+")
+
+# 学校名称（原 ".*大学.*" 等十个模式合并；"."不匹配换行，只看第一行）
+SCHOOL_NAME = re.compile(
+    r".*(?:大学|学院|研究科|学校|専門|高等|University|College|Institute|School)",
+    re.IGNORECASE,
+)
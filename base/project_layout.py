@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+"""项目经历表的布局索引 - 每个sheet只分析一次表头和项目分隔
+
+技能、作业范围、角色提取器原先各自从关键词位置重新找出同一个项目表头，
+再各自向下逐格用日期正则判断项目分隔。这里在第一次被请求时统一分析：
+
+- design_columns:  每列最上方的工程阶段关键词（技能提取器用，从右向左）
+- scope_positions: 所有作业范围关键词单元格及命中的关键词（作业范围提取器用）
+- header_rows:     包含3个以上工程阶段关键词的表头行（角色提取器用）
+- role_columns:    前30行中的角色列标题（角色提取器用）
+- separators:      以项目期间日期开头的单元格（"2020年4月"、"2020/04/"）
+- project_blocks:  按分隔行切分的项目行范围
+
+技术列的判定依赖技能词典和列内容的评分，仍由技能提取器负责。
+"""
+
+from typing import Dict, List, Set, Tuple
+
+from .deadline import check_deadline
+from .patterns import PROJECT_DATE_PREFIX
+
+# 表头行至少包含的工程阶段关键词数
+HEADER_MIN_DESIGN_KEYWORDS = 3
+
+# 角色列标题只在前30行中查找，超过该长度的视为说明文字
+ROLE_HEADER_MAX_ROW = 30
+ROLE_HEADER_MAX_LENGTH = 20
+
+
+class ProjectLayout:
+    """sheet中项目经历表的布局
+
+    Attributes:
+        design_columns: [{"row", "col", "value"}, ...]，每列最上方的工程阶段关键词，从右向左
+        scope_positions: [{"row", "col", "value", "keyword"}, ...]，行优先顺序
+        header_rows: [{"row", "design_cols", "count"}, ...]，表头行
+        role_columns: [{"row", "col", "header"}, ...]，角色列标题
+        separator_rows: 包含项目分隔单元格的行（升序）
+    """
+
+    def __init__(self, grid):
+        """分析网格
+
+        Args:
+            grid: SheetGrid对象
+        """
+        index = grid.keyword_index
+        strings = grid.strings
+
+        # 技能：每列只取最上方的工程阶段关键词单元格，从右向左排列
+        first_rows: Dict[int, int] = {}
+        for row, col in index.cells("skill_design"):
+            first_rows.setdefault(col, row)
+        self.design_columns: List[Dict] = [
+            {"row": first_rows[col], "col": col, "value": strings[first_rows[col]][col]}
+            for col in sorted(first_rows, reverse=True)
+        ]
+
+        # 作业范围：所有关键词单元格
+        self.scope_positions: List[Dict] = [
+            {
+                "row": row,
+                "col": col,
+                "value": strings[row][col],
+                "keyword": index.first_keyword("work_scope_design", row, col),
+            }
+            for row, col in index.cells("work_scope_design")
+        ]
+
+        # 角色：按行汇总工程阶段关键词，多个关键词所在的行视为表头
+        design_cols_by_row: Dict[int, List[int]] = {}
+        for row, col in index.cells("role_design"):
+            design_cols_by_row.setdefault(row, []).append(col)
+        self.header_rows: List[Dict] = [
+            {"row": row, "design_cols": design_cols, "count": len(design_cols)}
+            for row, design_cols in design_cols_by_row.items()
+            if len(design_cols) >= HEADER_MIN_DESIGN_KEYWORDS
+        ]
+
+        self.role_columns: List[Dict] = [
+            {"row": row, "col": col, "header": strings[row][col]}
+            for row, col in index.cells("role_column", max_row=ROLE_HEADER_MAX_ROW)
+            if len(strings[row][col]) < ROLE_HEADER_MAX_LENGTH
+        ]
+
+        # 项目分隔：只对数字开头的单元格执行正则
+        self._separators: Set[Tuple[int, int]] = set()
+        separator_rows = []
+        for row, (row_strings, row_mask) in enumerate(zip(strings, grid.mask)):
+            check_deadline()
+            found = False
+            for col, (cell_str, present) in enumerate(zip(row_strings, row_mask)):
+                if (
+                    present
+                    and cell_str[:1].isdigit()
+                    and PROJECT_DATE_PREFIX.match(cell_str)
+                ):
+                    self._separators.add((row, col))
+                    found = True
+            if found:
+                separator_rows.append(row)
+        self.separator_rows: List[int] = separator_rows
+        self._n_rows = grid.n_rows
+
+    def is_separator(self, row: int, col: int) -> bool:
+        """单元格是否以项目期间日期开头（新项目开始）"""
+        return (row, col) in self._separators
+
+    @property
+    def project_blocks(self) -> List[Tuple[int, int]]:
+        """各项目的行范围 [(起始行, 结束行), ...]（左闭右开）
+
+        每个分隔行开始一个项目，到下一个分隔行之前结束；
+        第一个分隔行之前的部分（表头、个人信息）不包括在内。
+        """
+        bounds = self.separator_rows + [self._n_rows]
+        return list(zip(bounds[:-1], bounds[1:]))
@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+"""Sheet逐行文本 - 每个sheet只拼接一次，并记录字符偏移到单元格的映射
+
+各提取器原先各自拼接行文本（DataFrame.iterrows、逐单元格字符串相加、
+全文搜索前再拼一次），这里在第一次被请求时统一构建，缓存在网格上共享。
+正则在行文本或全文上的匹配位置可以通过 locate 还原为 (行, 列)。
+"""
+
+from bisect import bisect_left, bisect_right
+from itertools import accumulate
+from typing import List, Optional, Tuple
+
+from .deadline import check_deadline
+
+
+class RowText:
+    """sheet的逐行文本
+
+    Attributes:
+        rows: 每行非空单元格的字符串（SheetGrid.strings）用空格拼接，空行为""
+        text: 去掉空白行后用换行拼接的全文
+    """
+
+    def __init__(self, grid):
+        """构建逐行文本
+
+        Args:
+            grid: SheetGrid对象
+        """
+        self.rows: List[str] = []
+        # 每行中各单元格文本的起始偏移和对应的列
+        self._cell_starts: List[List[int]] = []
+        self._cell_cols: List[List[int]] = []
+
+        for row_strings, row_mask in zip(grid.strings, grid.mask):
+            check_deadline()
+            cols = [col for col, present in enumerate(row_mask) if present]
+            parts = [row_strings[col] for col in cols]
+            # 第i个单元格的起始偏移 = 前面各单元格长度之和 + 分隔空格数
+            starts = list(accumulate((len(part) + 1 for part in parts[:-1]), initial=0))
+            self.rows.append(" ".join(parts))
+            self._cell_starts.append(starts if parts else [])
+            self._cell_cols.append(cols)
+
+        # 全文中各行的起始偏移（只包括非空白行）
+        self._line_rows = [row for row, text in enumerate(self.rows) if text.strip()]
+        self._line_starts = list(
+            accumulate(
+                (len(self.rows[row]) + 1 for row in self._line_rows[:-1]), initial=0
+            )
+        )
+        self.text = "\n".join(self.rows[row] for row in self._line_rows)
+
+    def row_locate(self, row: int, offset: int) -> Optional[int]:
+        """行文本中的字符偏移对应的列
+
+        Args:
+            row: 行号
+            offset: rows[row] 中的字符偏移（落在分隔空格上时返回前一个单元格）
+
+        Returns:
+            列号，该行没有非空单元格时返回None
+        """
+        starts = self._cell_starts[row]
+        if not starts:
+            return None
+        index = max(bisect_right(starts, offset) - 1, 0)
+        return self._cell_cols[row][index]
+
+    def locate(self, offset: int) -> Optional[Tuple[int, int]]:
+        """全文中的字符偏移对应的单元格
+
+        Args:
+            offset: text 中的字符偏移
+
+        Returns:
+            (行, 列)，全文为空时返回None
+        """
+        if not self._line_rows:
+            return None
+        index = max(bisect_right(self._line_starts, offset) - 1, 0)
+        row = self._line_rows[index]
+        return row, self.row_locate(row, offset - self._line_starts[index])
+
+    def text_from(self, row: int) -> str:
+        """第row行及之后的全文（与只拼接这些行得到的文本相同）"""
+        index = bisect_left(self._line_rows, row)
+        if index == len(self._line_rows):
+            return ""
+        return self.text[self._line_starts[index] :]
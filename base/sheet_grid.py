@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+"""Sheet单元格网格 - 每个sheet只做一次单元格物化"""
+
+import threading
+from typing import Any, Callable, Dict, List
+
+from .date_index import DateIndex
+from .keyword_index import KeywordIndex
+from .project_layout import ProjectLayout
+from .row_text import RowText
+
+
+class SheetGrid:
+    """预先物化的sheet单元格网格
+
+    各提取器原先对同一单元格反复执行 df.iloc / pd.notna / str().strip()，
+    这里在读取时一次性完成，之后所有提取器共享同一份结果。
+
+    Attributes:
+        values: 原始类型的单元格值（行优先，空单元格为None）
+        mask: 非空掩码（等价于 pd.notna(cell)）
+        strings: 标准化后的字符串矩阵（str(cell).strip()，空单元格为""）
+        n_rows: 行数
+        n_cols: 列数
+
+    基于网格派生的索引（关键词索引等）在首次使用时构建并缓存在网格上，
+    同一sheet的所有提取器共享。字段并发提取时同一索引也只构建一次。
+    """
+
+    def __init__(self, values: List[List[Any]], mask: List[List[bool]]):
+        """初始化网格
+
+        Args:
+            values: 行优先的原始单元格值
+            mask: 与values形状一致的非空掩码
+        """
+        self.values = values
+        self.mask = mask
+        self.n_rows = len(values)
+        self.n_cols = len(values[0]) if values else 0
+        self.strings = [
+            [
+                str(value).strip() if present else ""
+                for value, present in zip(row, row_mask)
+            ]
+            for row, row_mask in zip(values, mask)
+        ]
+        self._cache: Dict[str, Any] = {}
+        self._cache_lock = threading.RLock()
+
+    @classmethod
+    def from_dataframe(cls, df) -> "SheetGrid":
+        """从DataFrame构建网格
+
+        Args:
+            df: pandas DataFrame对象
+
+        Returns:
+            SheetGrid对象
+        """
+        n_cols = len(df.columns)
+        mask_columns = df.notna().to_numpy().T.tolist()
+        value_columns = [df.iloc[:, col].tolist() for col in range(n_cols)]
+
+        values = []
+        for row_values, row_mask in zip(zip(*value_columns), zip(*mask_columns)):
+            values.append(
+                [
+                    value if present else None
+                    for value, present in zip(row_values, row_mask)
+                ]
+            )
+        mask = [list(row_mask) for row_mask in zip(*mask_columns)]
+
+        return cls(values, mask)
+
+    @property
+    def shape(self):
+        """网格大小 (行数, 列数)"""
+        return self.n_rows, self.n_cols
+
+    def __len__(self) -> int:
+        return self.n_rows
+
+    def cached(self, key: str, factory: Callable[["SheetGrid"], Any]) -> Any:
+        """获取缓存在网格上的派生数据，不存在时调用factory构建
+
+        Args:
+            key: 缓存键
+            factory: 以网格为参数的构建函数
+
+        Returns:
+            派生数据
+        """
+        try:
+            return self._cache[key]
+        except KeyError:
+            pass
+        with self._cache_lock:
+            if key not in self._cache:
+                self._cache[key] = factory(self)
+            return self._cache[key]
+
+    @property
+    def keyword_index(self):
+        """关键词位置索引（首次访问时构建）"""
+        return self.cached("keyword_index", KeywordIndex)
+
+    @property
+    def date_index(self) -> DateIndex:
+        """开头若干行的日期候选索引（首次访问时构建）"""
+        return self.cached("date_index", DateIndex)
+
+    @property
+    def project_layout(self) -> ProjectLayout:
+        """项目经历表的表头、列和分隔行（首次访问时构建）"""
+        return self.cached("project_layout", ProjectLayout)
+
+    @property
+    def row_texts(self) -> RowText:
+        """逐行文本和全文（首次访问时构建）"""
+        return self.cached("row_text", RowText)
+
+    @property
+    def text(self) -> str:
+        """去掉空白行后用换行拼接的全文"""
+        return self.row_texts.text
+
+    def row_text(self, row: int) -> str:
+        """将一行的非空单元格用空格拼接为文本"""
+        return self.row_texts.rows[row]
@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+"""Sheet筛选 - 用少量抽样单元格判断sheet是否像简历
+
+封面、填写说明、隐藏的模板sheet等与简历无关的sheet，
+只读取左上角有限范围的单元格做关键词判断，不交给提取器扫描。
+native/streaming读取方式下这些sheet也不完整解析；pandas读取方式下
+抽样时xlrd/openpyxl已经解析了整张sheet，只省去DataFrame和网格的构建。
+"""
+
+import math
+from typing import Any, Iterable, Optional, Sequence, Tuple
+
+from .keyword_index import KEYWORD_AUTOMATON, _KEYWORD_TO_GROUPS
+
+# 抽样范围：前60行 x 前30列
+TRIAGE_MAX_ROWS = 60
+TRIAGE_MAX_COLS = 30
+
+# 判断简历内容的关键词组：姓名、个人信息标签、技能、设计工程
+# （个人信息单独放在一个sheet的简历也要保留；年龄组含"歳""才""満"等单字，不作为依据）
+TRIAGE_GROUPS = frozenset(
+    [
+        "name",
+        "gender",
+        "birthdate",
+        "nationality",
+        "arrival",
+        "experience",
+        "japanese",
+        "skills",
+        "tech_column",
+        "skill_design",
+        "work_scope_design",
+        "role_design",
+    ]
+)
+
+
+def _is_blank(value: Any) -> bool:
+    """空单元格（None、NaN、空字符串）"""
+    if value is None:
+        return True
+    if isinstance(value, float) and math.isnan(value):
+        return True
+    return isinstance(value, str) and not value.strip()
+
+
+def triage_score(rows: Iterable[Sequence[Any]]) -> Tuple[int, int]:
+    """计算抽样单元格中命中简历关键词的单元格数
+
+    Args:
+        rows: 行优先的单元格值（只使用前 TRIAGE_MAX_ROWS 行、前 TRIAGE_MAX_COLS 列）
+
+    Returns:
+        (命中 TRIAGE_GROUPS 关键词的单元格数, 非空单元格数)
+    """
+    score = 0
+    filled = 0
+    for index, row in enumerate(rows):
+        if index >= TRIAGE_MAX_ROWS:
+            break
+        for value in list(row)[:TRIAGE_MAX_COLS]:
+            if _is_blank(value):
+                continue
+            filled += 1
+            for keyword in KEYWORD_AUTOMATON.find_all(str(value).strip()):
+                if TRIAGE_GROUPS.intersection(_KEYWORD_TO_GROUPS[keyword]):
+                    score += 1
+                    break
+    return score, filled
+
+
+def triage_sheet(rows: Iterable[Sequence[Any]]) -> Optional[str]:
+    """判断sheet是否需要跳过
+
+    Args:
+        rows: sheet开头的单元格值
+
+    Returns:
+        跳过的原因，需要提取时返回None
+    """
+    score, filled = triage_score(rows)
+    if filled == 0:
+        return f"前{TRIAGE_MAX_ROWS}行x{TRIAGE_MAX_COLS}列中没有内容"
+    if score == 0:
+        return (
+            f"前{TRIAGE_MAX_ROWS}行x{TRIAGE_MAX_COLS}列中"
+            f"没有姓名、个人信息、技能或设计工程关键词"
+        )
+    return None
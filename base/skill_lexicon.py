@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+"""技能词典 - 导入时构建的大小写无关查找表
+
+技能表规模从一百多个扩大到数千个后，逐个遍历 VALID_SKILLS 比较大小写的方式
+会随词表线性变慢。这里一次性构建哈希表和多模式自动机，
+每个候选词的有效性判断和标准名查找都是O(1)。
+"""
+
+import re
+from typing import Dict, FrozenSet, Optional, Pattern
+
+from utils.aho_corasick import AhoCorasick
+from .constants import VALID_SKILLS, NO_SPLIT_SKILLS, SKILL_NAME_MAPPING
+
+
+def _first_by_key(values, key) -> Dict[str, str]:
+    """按key建立查找表，同一key保留迭代中最先出现的值（与逐个遍历取第一个一致）"""
+    table: Dict[str, str] = {}
+    for value in values:
+        table.setdefault(key(value), value)
+    return table
+
+
+# 有效技能（大写）
+VALID_SKILLS_UPPER: FrozenSet[str] = frozenset(skill.upper() for skill in VALID_SKILLS)
+
+# 小写 -> 有效技能的标准写法
+CANONICAL_SKILLS: Dict[str, str] = _first_by_key(VALID_SKILLS, str.lower)
+
+# 小写 -> 技能名称映射结果
+SKILL_NAME_MAPPING_LOWER: Dict[str, str] = {
+    key: SKILL_NAME_MAPPING[original]
+    for key, original in _first_by_key(SKILL_NAME_MAPPING, str.lower).items()
+}
+
+# 在大写文本中查找任一有效技能
+VALID_SKILL_MATCHER = AhoCorasick(VALID_SKILLS_UPPER)
+
+# 在小写文本中查找出现的有效技能（全文搜索的预筛选）
+VALID_SKILL_LOWER_MATCHER = AhoCorasick(CANONICAL_SKILLS)
+
+# 小写 -> 不可分割技能
+NO_SPLIT_SKILLS_LOWER: Dict[str, str] = _first_by_key(NO_SPLIT_SKILLS, str.lower)
+
+# 所有不可分割技能合并为一个正则，长的优先，一次扫描找出全部
+NO_SPLIT_SKILL_PATTERN: Pattern = re.compile(
+    "|".join(
+        re.escape(skill) for skill in sorted(NO_SPLIT_SKILLS, key=len, reverse=True)
+    ),
+    re.IGNORECASE,
+)
+
+
+def canonical_skill(skill: str) -> Optional[str]:
+    """大小写无关地查找有效技能的标准写法"""
+    return CANONICAL_SKILLS.get(skill.lower())
+
+
+def no_split_skill(text: str) -> Optional[str]:
+    """大小写无关地查找匹配的不可分割技能"""
+    return NO_SPLIT_SKILLS_LOWER.get(text.lower())
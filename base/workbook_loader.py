@@ -0,0 +1,328 @@
+# -*- coding: utf-8 -*-
+"""工作簿读取 - 不经过pandas，直接把单元格读成行优先的原始网格
+
+pandas.read_excel 会把第一行当作列名（提取器看不到第0行）、跳过整行为空的行，
+并做类型推断、构建完整的DataFrame，而提取器只逐个单元格访问。
+这里用 xlrd（.xls）/ openpyxl（.xlsx）直接读取单元格：
+
+- 保留单元格类型：日期为datetime（纯时间为time），整数值的数字为int，其余为float
+- 不消耗表头行，也不删除空行，行列位置与Excel中一致
+- 空单元格、空字符串和错误值为None
+"""
+
+import datetime
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from .sheet_grid import SheetGrid
+
+
+def _normalize_number(value: float) -> Any:
+    """整数值的数字转为int（与pandas一致）"""
+    if value.is_integer():
+        return int(value)
+    return value
+
+
+def _convert_xls_cell(xlrd, cell_type: int, value: Any, datemode: int) -> Any:
+    """xlrd单元格值转为Python原生类型"""
+    if cell_type == xlrd.XL_CELL_TEXT:
+        return value if value != "" else None
+    if cell_type == xlrd.XL_CELL_NUMBER:
+        return _normalize_number(value)
+    if cell_type == xlrd.XL_CELL_DATE:
+        try:
+            date = xlrd.xldate.xldate_as_datetime(value, datemode)
+        except (OverflowError, ValueError, xlrd.xldate.XLDateError):
+            return _normalize_number(value)
+        # 只有时间部分的单元格（日期为纪元起点）
+        epoch = (1904, 1, 1) if datemode else (1899, 12, 31)
+        if (date.year, date.month, date.day) == epoch:
+            return date.time()
+        return date
+    if cell_type == xlrd.XL_CELL_BOOLEAN:
+        return bool(value)
+    # 空白、错误值
+    return None
+
+
+def _convert_xlsx_cell(value: Any) -> Any:
+    """openpyxl单元格值标准化"""
+    if isinstance(value, float):
+        return _normalize_number(value)
+    if isinstance(value, str) and value == "":
+        return None
+    if isinstance(value, datetime.timedelta):
+        return (datetime.datetime.min + value).time()
+    return value
+
+
+def _trim(rows: List[List[Any]]) -> List[List[Any]]:
+    """去掉末尾的空行、空列（只读模式下的used range经常偏大），并补齐行宽"""
+    n_rows = 0
+    n_cols = 0
+    for index, row in enumerate(rows):
+        for col in range(len(row) - 1, -1, -1):
+            if row[col] is not None:
+                n_rows = index + 1
+                n_cols = max(n_cols, col + 1)
+                break
+
+    trimmed = []
+    for row in rows[:n_rows]:
+        row = list(row[:n_cols])
+        if len(row) < n_cols:
+            row.extend([None] * (n_cols - len(row)))
+        trimmed.append(row)
+    return trimmed
+
+
+class WorkbookSheet:
+    """按需读取的sheet
+
+    打开工作簿时不读取任何sheet，sample() 只转换开头的几行（用于筛选），
+    grid() 才读取整张sheet。
+    """
+
+    def __init__(
+        self,
+        name: str,
+        read_rows: Callable[[Optional[int]], List[List[Any]]],
+        release: Optional[Callable[[], None]] = None,
+    ):
+        """初始化
+
+        Args:
+            name: sheet名
+            read_rows: 读取前n行（None 表示全部）的函数，返回转换后的单元格值
+            release: 释放sheet资源的函数
+        """
+        self.name = name
+        self._read_rows = read_rows
+        self._release = release
+
+    def sample(self, n_rows: int) -> List[List[Any]]:
+        """读取开头n_rows行的单元格值"""
+        return self._read_rows(n_rows)
+
+    def grid(self) -> SheetGrid:
+        """读取整张sheet为网格（去掉末尾的空行、空列）"""
+        values = _trim(self._read_rows(None))
+        mask = [[value is not None for value in row] for row in values]
+        return SheetGrid(values, mask)
+
+    def release(self):
+        """释放sheet占用的资源（不再需要时调用）"""
+        if self._release is not None:
+            self._release()
+            self._release = None
+
+
+def _open_xls(file_path: str) -> Tuple[List[WorkbookSheet], Callable[[], None]]:
+    """用xlrd按需打开.xls（on_demand，sheet在访问时才解析）"""
+    import xlrd
+
+    book = xlrd.open_workbook(file_path, on_demand=True)
+
+    def reader(name: str) -> Callable[[Optional[int]], List[List[Any]]]:
+        def read_rows(n_rows: Optional[int]) -> List[List[Any]]:
+            sheet = book.sheet_by_name(name)
+            n_rows = sheet.nrows if n_rows is None else min(n_rows, sheet.nrows)
+            return [
+                [
+                    _convert_xls_cell(xlrd, cell_type, value, book.datemode)
+                    for cell_type, value in zip(
+                        sheet.row_types(row), sheet.row_values(row)
+                    )
+                ]
+                for row in range(n_rows)
+            ]
+
+        return read_rows
+
+    sheets = [
+        WorkbookSheet(name, reader(name), lambda name=name: book.unload_sheet(name))
+        for name in book.sheet_names()
+    ]
+    return sheets, book.release_resources
+
+
+def _open_xlsx(file_path: str) -> Tuple[List[WorkbookSheet], Callable[[], None]]:
+    """用openpyxl只读模式打开.xlsx（取公式的计算结果，sheet在迭代时才解析）"""
+    import openpyxl
+
+    book = openpyxl.load_workbook(file_path, read_only=True, data_only=True)
+
+    def reader(worksheet) -> Callable[[Optional[int]], List[List[Any]]]:
+        def read_rows(n_rows: Optional[int]) -> List[List[Any]]:
+            return [
+                [_convert_xlsx_cell(value) for value in row]
+                for row in worksheet.iter_rows(max_row=n_rows, values_only=True)
+            ]
+
+        return read_rows
+
+    sheets = [
+        WorkbookSheet(worksheet.title, reader(worksheet))
+        for worksheet in book.worksheets
+    ]
+    return sheets, book.close
+
+
+def open_workbook_sheets(
+    file_path: str, file_ext: Optional[str] = None
+) -> Tuple[List[WorkbookSheet], Callable[[], None]]:
+    """打开工作簿，返回按需读取的sheet列表
+
+    Args:
+        file_path: Excel文件路径
+        file_ext: 扩展名（默认根据路径判断）
+
+    Returns:
+        (WorkbookSheet列表, 关闭工作簿的函数)
+
+    Raises:
+        ValueError: 不支持的文件格式
+        ImportError: 缺少xlrd/openpyxl
+    """
+    file_ext = (file_ext or Path(file_path).suffix).lower()
+    if file_ext == ".xls":
+        return _open_xls(file_path)
+    if file_ext in (".xlsx", ".xlsm"):
+        return _open_xlsx(file_path)
+    raise ValueError(f"不支持的文件格式: {file_ext}")
+
+
+def load_workbook_grids(
+    file_path: str, file_ext: Optional[str] = None
+) -> List[Tuple[str, SheetGrid]]:
+    """读取工作簿的所有sheet为原始单元格网格
+
+    Args:
+        file_path: Excel文件路径
+        file_ext: 扩展名（默认根据路径判断）
+
+    Returns:
+        [(sheet名, 网格)]，没有任何非空单元格的sheet返回空网格
+
+    Raises:
+        ValueError: 不支持的文件格式
+        ImportError: 缺少xlrd/openpyxl
+    """
+    sheets, close = open_workbook_sheets(file_path, file_ext)
+    try:
+        return [(sheet.name, sheet.grid()) for sheet in sheets]
+    finally:
+        close()
+
+
+class StreamingSheet:
+    """按需解析行的sheet（openpyxl只读模式）
+
+    行在第一次被请求时才从XML中解析，grid(horizon) 只解析到第horizon行为止。
+    模板中格式化过但没有内容的大量空行，只要没有提取器需要整张sheet就不会被解析。
+    """
+
+    def __init__(self, name: str, rows: Iterator[Tuple[Any, ...]], book=None):
+        """初始化
+
+        Args:
+            name: sheet名
+            rows: 行迭代器（iter_rows(values_only=True)）
+            book: 所属工作簿（close时关闭）
+        """
+        self.name = name
+        self._rows = rows
+        self._book = book
+        # 已解析的行（去掉行尾空单元格，末尾的空行只计数不保存）
+        self._values: List[List[Any]] = []
+        self._pending_empty = 0
+        self._exhausted = False
+        self._grids: Dict[int, SheetGrid] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def rows_parsed(self) -> int:
+        """已解析的行数（包括末尾的空行）"""
+        return len(self._values) + self._pending_empty
+
+    def _read_until(self, n_rows: Optional[int]):
+        """解析到第n_rows行为止（None 表示全部）"""
+        while not self._exhausted and (n_rows is None or self.rows_parsed < n_rows):
+            try:
+                row = next(self._rows)
+            except StopIteration:
+                self._exhausted = True
+                break
+
+            # 格式化过的空行很多，先用C层面的计数跳过，不逐个单元格转换
+            if row.count(None) == len(row):
+                self._pending_empty += 1
+                continue
+
+            values = [_convert_xlsx_cell(value) for value in row]
+            while values and values[-1] is None:
+                values.pop()
+            if not values:
+                self._pending_empty += 1
+                continue
+
+            self._values.extend([] for _ in range(self._pending_empty))
+            self._pending_empty = 0
+            self._values.append(values)
+
+    def is_empty(self) -> bool:
+        """sheet是否没有任何非空单元格（只解析到第一个非空行）"""
+        with self._lock:
+            while not self._values and not self._exhausted:
+                self._read_until(self.rows_parsed + 1)
+            return not self._values
+
+    def grid(self, horizon: Optional[int] = None) -> SheetGrid:
+        """获取前horizon行的网格
+
+        Args:
+            horizon: 行数（None 表示整张sheet）
+
+        Returns:
+            SheetGrid对象（行数相同的请求共享同一个网格及其索引）
+        """
+        with self._lock:
+            self._read_until(horizon)
+            rows = self._values if horizon is None else self._values[:horizon]
+            grid = self._grids.get(len(rows))
+            if grid is None:
+                n_cols = max((len(row) for row in rows), default=0)
+                values = [row + [None] * (n_cols - len(row)) for row in rows]
+                mask = [[value is not None for value in row] for row in values]
+                grid = SheetGrid(values, mask)
+                self._grids[len(rows)] = grid
+            return grid
+
+    def close(self):
+        """关闭所属工作簿"""
+        if self._book is not None:
+            self._book.close()
+            self._book = None
+
+
+def open_streaming_sheets(file_path: str) -> List[StreamingSheet]:
+    """以只读流式方式打开.xlsx的所有sheet（不解析任何行）
+
+    Args:
+        file_path: .xlsx文件路径
+
+    Returns:
+        StreamingSheet列表，使用完毕后需要调用close
+
+    Raises:
+        ImportError: 缺少openpyxl
+    """
+    import openpyxl
+
+    book = openpyxl.load_workbook(file_path, read_only=True, data_only=True)
+    return [
+        StreamingSheet(sheet.title, sheet.iter_rows(values_only=True), book)
+        for sheet in book.worksheets
+    ]
@@ -0,0 +1,385 @@
+# -*- coding: utf-8 -*-
+"""批量处理 - 多进程提取大量简历并逐行输出JSON"""
+
+import argparse
+import glob
+import json
+import math
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+SUPPORTED_SUFFIXES = (".xls", ".xlsx")
+
+# 每个工作进程持有一个提取器实例，避免每个文件重复初始化
+_worker_extractor = None
+
+
+def _is_excel_file(path: Path) -> bool:
+    """是否为支持的Excel文件（排除Office的临时锁文件 ~$xxx.xlsx）"""
+    return (
+        path.is_file()
+        and path.suffix.lower() in SUPPORTED_SUFFIXES
+        and not path.name.startswith("~$")
+    )
+
+
+def collect_files(inputs: Iterable[str], files_from: Optional[str] = None) -> List[str]:
+    """展开输入为Excel文件列表
+
+    Args:
+        inputs: 文件、目录（递归）或glob模式
+        files_from: 每行一个路径的文件列表（"-" 表示标准输入）
+
+    Returns:
+        去重后的文件路径列表（保持输入顺序）
+    """
+    candidates = list(inputs)
+    if files_from:
+        if files_from == "-":
+            lines = sys.stdin.read().splitlines()
+        else:
+            lines = Path(files_from).read_text(encoding="utf-8").splitlines()
+        candidates.extend(line.strip() for line in lines if line.strip())
+
+    files = []
+    seen = set()
+
+    def add(path: Path):
+        key = str(path)
+        if key not in seen and _is_excel_file(path):
+            seen.add(key)
+            files.append(key)
+
+    for item in candidates:
+        path = Path(item)
+        if path.is_dir():
+            for child in sorted(path.rglob("*")):
+                add(child)
+        elif glob.has_magic(item):
+            for match in sorted(glob.glob(item, recursive=True)):
+                match_path = Path(match)
+                if match_path.is_dir():
+                    for child in sorted(match_path.rglob("*")):
+                        add(child)
+                else:
+                    add(match_path)
+        elif path.exists():
+            add(path)
+        else:
+            print(f"文件不存在: {item}", file=sys.stderr)
+
+    return files
+
+
+def _init_worker(
+    cache_path: Optional[str] = None,
+    cache_max_bytes: int = 0,
+    loader: str = "pandas",
+    timings: bool = False,
+    profile_dir: Optional[str] = None,
+    warm_up: bool = False,
+    time_budget: Optional[float] = None,
+    triage: bool = True,
+    skill_cache_size: Optional[int] = None,
+):
+    """工作进程初始化：导入依赖并创建提取器
+
+    Args:
+        cache_path: 结果缓存路径（None 表示不使用缓存）
+        cache_max_bytes: 缓存大小上限（字节）
+        loader: 工作簿读取方式（"pandas"、"native" 或 "streaming"）
+        timings: 在结果的 _meta.timings 中附加各阶段耗时
+        profile_dir: cProfile分析结果的输出目录（None 表示不分析）
+        warm_up: 立即导入依赖并创建全部提取器（默认在处理第一个文件时进行）
+        time_budget: 每个文件的时间预算（秒，None 表示不限制）
+        triage: 跳过不像简历的sheet
+        skill_cache_size: 技能文本缓存的容量（条目数，None 表示使用默认值）
+    """
+    global _worker_extractor
+    from extractor import ResumeExtractor
+    from utils.result_cache import ResultCache
+
+    cache = None
+    if cache_path is not None:
+        cache = ResultCache(cache_path or None, max_bytes=cache_max_bytes)
+    # 静默模式：诊断信息不做任何格式化，保证标准输出只有JSON行
+    _worker_extractor = ResumeExtractor(
+        cache=cache,
+        quiet=True,
+        loader=loader,
+        timings=timings,
+        profile_dir=profile_dir,
+        time_budget=time_budget,
+        triage=triage,
+        skill_cache_size=skill_cache_size,
+    )
+    if warm_up:
+        _worker_extractor.warm_up()
+
+
+def process_file(file_path: str) -> Dict:
+    """处理单个文件（在工作进程中执行）
+
+    Args:
+        file_path: Excel文件路径
+
+    Returns:
+        {"file", "ok", "elapsed_ms", "result" 或 "error"}
+    """
+    if _worker_extractor is None:
+        _init_worker()
+
+    start = time.perf_counter()
+    try:
+        result = _worker_extractor.extract_from_excel(file_path)
+    except Exception as e:
+        result = {"error": str(e)}
+    elapsed_ms = (time.perf_counter() - start) * 1000
+
+    record = {"file": file_path, "elapsed_ms": round(elapsed_ms, 1)}
+    if "error" in result:
+        record["ok"] = False
+        record["error"] = result["error"]
+    else:
+        record["ok"] = True
+        record["result"] = result
+    return record
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """计算百分位数（最近秩法）"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = min(max(1, math.ceil(pct / 100 * len(ordered))), len(ordered))
+    return ordered[rank - 1]
+
+
+def run_batch(
+    files: List[str],
+    workers: int = 1,
+    out=None,
+    cache_path: Optional[str] = None,
+    cache_max_bytes: int = 0,
+    loader: str = "pandas",
+    timings: bool = False,
+    profile_dir: Optional[str] = None,
+    time_budget: Optional[float] = None,
+    triage: bool = True,
+    skill_cache_size: Optional[int] = None,
+) -> Dict:
+    """批量处理文件，每完成一个输出一行JSON
+
+    Args:
+        files: 文件路径列表
+        workers: 工作进程数（1 表示在当前进程中顺序处理）
+        out: JSON行的输出流（默认标准输出）
+        cache_path: 结果缓存路径（None 不使用缓存，"" 使用默认路径）
+        cache_max_bytes: 缓存大小上限（字节）
+        loader: 工作簿读取方式
+        timings: 在结果的 _meta.timings 中附加各阶段耗时
+        profile_dir: cProfile分析结果的输出目录
+        time_budget: 每个文件的时间预算（秒），超时的文件返回已完成的字段
+        triage: 跳过不像简历的sheet
+        skill_cache_size: 每个工作进程的技能文本缓存容量（条目数）
+
+    Returns:
+        汇总统计
+    """
+    out = out or sys.stdout
+    latencies = []
+    failures = 0
+
+    def emit(record: Dict):
+        nonlocal failures
+        if not record["ok"]:
+            failures += 1
+        if "elapsed_ms" in record:
+            latencies.append(record["elapsed_ms"])
+        out.write(json.dumps(record, ensure_ascii=False, separators=(",", ":")))
+        out.write("\n")
+        out.flush()
+
+    start = time.perf_counter()
+    if workers <= 1:
+        _init_worker(
+            cache_path,
+            cache_max_bytes,
+            loader,
+            timings,
+            profile_dir,
+            time_budget=time_budget,
+            triage=triage,
+            skill_cache_size=skill_cache_size,
+        )
+        for file_path in files:
+            emit(process_file(file_path))
+    else:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(
+                cache_path,
+                cache_max_bytes,
+                loader,
+                timings,
+                profile_dir,
+                False,
+                time_budget,
+                triage,
+                skill_cache_size,
+            ),
+        ) as executor:
+            futures = {
+                executor.submit(process_file, file_path): file_path
+                for file_path in files
+            }
+            for future in as_completed(futures):
+                try:
+                    record = future.result()
+                except Exception as e:
+                    # 工作进程崩溃等情况
+                    record = {"file": futures[future], "ok": False, "error": str(e)}
+                emit(record)
+    elapsed = time.perf_counter() - start
+
+    return {
+        "files": len(files),
+        "succeeded": len(files) - failures,
+        "failed": failures,
+        "elapsed_s": round(elapsed, 3),
+        "files_per_s": round(len(files) / elapsed, 2) if elapsed > 0 else 0.0,
+        "p50_ms": percentile(latencies, 50),
+        "p95_ms": percentile(latencies, 95),
+    }
+
+
+def format_summary(summary: Dict) -> str:
+    """格式化汇总信息"""
+    return (
+        f"处理完成: {summary['files']} 个文件, "
+        f"成功 {summary['succeeded']}, 失败 {summary['failed']}, "
+        f"耗时 {summary['elapsed_s']:.2f}s, "
+        f"吞吐 {summary['files_per_s']:.2f} 文件/s, "
+        f"p50 {summary['p50_ms']:.1f}ms, p95 {summary['p95_ms']:.1f}ms"
+    )
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """构建批量模式的命令行参数"""
+    parser = argparse.ArgumentParser(
+        prog="python main.py batch",
+        description="批量提取简历信息，每个文件输出一行JSON",
+    )
+    parser.add_argument("inputs", nargs="*", help="Excel文件、目录或glob模式")
+    parser.add_argument(
+        "-f",
+        "--files-from",
+        help="从文件读取路径列表（每行一个，'-' 表示标准输入）",
+    )
+    parser.add_argument(
+        "-j",
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="工作进程数（默认CPU核数，1 表示不使用进程池）",
+    )
+    parser.add_argument("-o", "--output", help="JSON行输出文件（默认标准输出）")
+    parser.add_argument(
+        "--cache",
+        nargs="?",
+        const="",
+        default=None,
+        metavar="PATH",
+        help="启用结果缓存（可指定数据库路径，默认 ~/.cache/skills_extractor/）",
+    )
+    parser.add_argument(
+        "--cache-size",
+        type=int,
+        default=256,
+        metavar="MB",
+        help="缓存大小上限（MB，默认256）",
+    )
+    parser.add_argument(
+        "--skill-cache-size",
+        type=int,
+        metavar="N",
+        help="每个工作进程的技能文本缓存容量（条目数，0 表示不缓存，默认16384）",
+    )
+    parser.add_argument(
+        "--loader",
+        choices=("pandas", "native", "streaming"),
+        default="pandas",
+        help=(
+            "工作簿读取方式（native: xlrd/openpyxl直接读取原始单元格，"
+            "streaming: .xlsx按需流式读取，默认pandas）"
+        ),
+    )
+    parser.add_argument(
+        "--timings",
+        action="store_true",
+        help="在每个结果的 _meta.timings 中附加读取、构建和各字段的耗时",
+    )
+    parser.add_argument(
+        "--time-budget",
+        type=float,
+        metavar="SECONDS",
+        help="每个文件的时间预算（秒），超时后输出已完成的字段，"
+        "未完成的字段列在 _meta.timed_out_fields 中",
+    )
+    parser.add_argument(
+        "--no-triage",
+        dest="triage",
+        action="store_false",
+        help="不跳过任何sheet（默认先抽样判断，跳过封面、说明等不像简历的sheet）",
+    )
+    parser.add_argument(
+        "--profile",
+        metavar="DIR",
+        help="用cProfile分析每个文件，pstats和折叠栈（火焰图用）输出到该目录",
+    )
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """批量模式入口
+
+    JSON行输出到标准输出（或 --output），汇总信息输出到标准错误。
+
+    Returns:
+        退出码：全部成功为0，有失败为1，没有可处理文件为2
+    """
+    args = build_parser().parse_args(argv)
+
+    files = collect_files(args.inputs, args.files_from)
+    if not files:
+        print("没有找到可处理的 .xls/.xlsx 文件", file=sys.stderr)
+        return 2
+
+    workers = max(1, min(args.workers, len(files)))
+    worker_options = {
+        "cache_path": args.cache,
+        "cache_max_bytes": args.cache_size * 1024 * 1024,
+        "loader": args.loader,
+        "timings": args.timings,
+        "profile_dir": args.profile,
+        "time_budget": args.time_budget,
+        "triage": args.triage,
+        "skill_cache_size": args.skill_cache_size,
+    }
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as out:
+            summary = run_batch(files, workers, out, **worker_options)
+    else:
+        summary = run_batch(files, workers, **worker_options)
+
+    print(format_summary(summary), file=sys.stderr)
+    return 1 if summary["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+"""正则注册表微基准：比较逐次传入原始字符串与使用预编译对象的单元格耗时
+
+用法: python benchmarks/regex_registry.py [--cells N]
+"""
+
+import argparse
+import re
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from base.constants import EXCLUDE_PATTERNS
+from base.patterns import ARRIVAL_YEARS_PATTERNS, SKILL_EXCLUDE, TECH_CONTENT
+
+# 典型的简历单元格内容
+SAMPLE_CELLS = [
+    "Java",
+    "Spring Boot",
+    "基本設計",
+    "2019年4月～2020年3月",
+    "在日5年",
+    "MySQL / Oracle",
+    "要件定義",
+    "○",
+    "5人",
+    "Windows 10",
+    "顧客管理システムの開発",
+    "PL",
+]
+
+
+def raw_tech(cell):
+    """改造前：每次调用重建模式列表并逐个 re.search"""
+    tech_patterns = [
+        r"\b(Java|Python|JavaScript|PHP|Ruby|C\+\+|C#|Go|VB|COBOL)\b",
+        r"\b(Spring|React|Vue|Angular|Django|Rails|Node\.js|\.NET)\b",
+        r"\b(MySQL|PostgreSQL|Oracle|MongoDB|Redis|SQL\s*Server|DB2)\b",
+        r"\b(AWS|Azure|GCP|Docker|Kubernetes)\b",
+        r"\b(Git|SVN|Jenkins|Maven|TortoiseSVN|GitHub)\b",
+        r"\b(Windows|Linux|Unix|Ubuntu|CentOS|win\d+)\b",
+        r"\b(Eclipse|IntelliJ|VS\s*Code|Visual\s*Studio|NetBeans)\b",
+        r"(HTML|CSS|SQL|XML|JSON|TeraTerm)",
+    ]
+    for pattern in tech_patterns:
+        if re.search(pattern, cell, re.IGNORECASE):
+            return True
+    return False
+
+
+def compiled_tech(cell):
+    """改造后：一个合并的预编译正则"""
+    return bool(TECH_CONTENT.search(cell))
+
+
+def raw_exclude(cell):
+    for pattern in EXCLUDE_PATTERNS:
+        if re.match(pattern, cell, re.IGNORECASE):
+            return True
+    return False
+
+
+def compiled_exclude(cell):
+    return bool(SKILL_EXCLUDE.match(cell))
+
+
+def raw_arrival(cell):
+    patterns = [
+        (r"来日\s*(\d{1,2})\s*年", 4.0),
+        (r"在日\s*(\d{1,2})\s*年", 4.0),
+        (r"日本滞在\s*(\d{1,2})\s*年", 3.5),
+        (r"滞在年数\s*(\d{1,2})\s*年?", 3.5),
+        (r"日本.*?(\d{1,2})\s*年", 2.0),
+        (r"(\d{1,2})\s*年.*?日本", 2.0),
+    ]
+    return [c for p, c in patterns if re.search(p, cell)]
+
+
+def compiled_arrival(cell):
+    if "年" not in cell:
+        return []
+    return [c for p, c in ARRIVAL_YEARS_PATTERNS if p.search(cell)]
+
+
+CASES = [
+    ("技术内容判断", raw_tech, compiled_tech),
+    ("排除模式判断", raw_exclude, compiled_exclude),
+    ("来日年数表述", raw_arrival, compiled_arrival),
+]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="正则注册表微基准")
+    parser.add_argument("--cells", type=int, default=200000, help="每组测试的单元格数")
+    args = parser.parse_args()
+
+    cells = (SAMPLE_CELLS * (args.cells // len(SAMPLE_CELLS) + 1))[: args.cells]
+
+    print(
+        f"{'场景':<12}{'原始字符串(ns/单元格)':>22}{'预编译(ns/单元格)':>20}{'加速':>8}"
+    )
+    for name, raw, compiled in CASES:
+        # 结果必须一致
+        assert [raw(c) for c in SAMPLE_CELLS] == [compiled(c) for c in SAMPLE_CELLS]
+
+        raw_time = min(
+            timeit.repeat(lambda: [raw(c) for c in cells], number=1, repeat=3)
+        )
+        compiled_time = min(
+            timeit.repeat(lambda: [compiled(c) for c in cells], number=1, repeat=3)
+        )
+        raw_ns = raw_time / len(cells) * 1e9
+        compiled_ns = compiled_time / len(cells) * 1e9
+        print(
+            f"{name:<12}{raw_ns:>22.0f}{compiled_ns:>20.0f}"
+            f"{raw_ns / compiled_ns:>8.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,199 @@
+# -*- coding: utf-8 -*-
+"""基准测试运行器：测量整体提取耗时和各字段提取器耗时，保存/比较JSON基线
+
+对合成工作簿（见 synth_workbook.py）和项目自带的 職務経歴書-*.xls 逐个测量：
+- total: ResumeExtractor.extract_from_excel 的耗时
+- 各字段: 字段调度器记录的每个提取器的耗时
+每项取多次运行的中位数。
+
+用法:
+    python benchmarks/run_benchmarks.py --save baseline.json
+    python benchmarks/run_benchmarks.py --baseline baseline.json [--threshold 0.2]
+
+与基线比较时，耗时增加超过 threshold（比例）且超过 --min-delta 毫秒的项标记为退化，
+有退化时退出码为1。
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from benchmarks.synth_workbook import DEFAULT_ROWS, VARIANTS, generate_corpus
+from extractor import ResumeExtractor
+
+
+def measure_file(
+    extractor: ResumeExtractor, file_path: Path, repeat: int
+) -> Dict[str, float]:
+    """测量单个文件
+
+    Returns:
+        {"total": 毫秒, 字段名: 毫秒, ...}（各项为中位数）
+    """
+    # 预热：首次运行包含模块内部缓存的建立
+    extractor.extract_from_excel(str(file_path))
+
+    samples: Dict[str, List[float]] = {}
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = extractor.extract_from_excel(str(file_path))
+        elapsed = (time.perf_counter() - start) * 1000
+        if "error" in result:
+            raise RuntimeError(f"{file_path}: {result['error']}")
+
+        samples.setdefault("total", []).append(elapsed)
+        for field, field_ms in extractor.last_timings.items():
+            samples.setdefault(field, []).append(field_ms)
+
+    return {
+        metric: round(statistics.median(values), 3)
+        for metric, values in samples.items()
+    }
+
+
+def run(files: List[Path], repeat: int, loader: str = "pandas") -> Dict:
+    """运行基准测试
+
+    Returns:
+        基线格式的结果 {"meta": {...}, "cases": {文件名: {指标: 毫秒}}}
+    """
+    extractor = ResumeExtractor(quiet=True, loader=loader)
+    cases = {}
+    for file_path in files:
+        cases[file_path.name] = measure_file(extractor, file_path, repeat)
+        print(
+            f"{file_path.name:<28}{cases[file_path.name]['total']:>10.1f} ms",
+            file=sys.stderr,
+        )
+
+    return {
+        "meta": {
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "loader": loader,
+            "repeat": repeat,
+        },
+        "cases": cases,
+    }
+
+
+def compare(
+    current: Dict, baseline: Dict, threshold: float, min_delta_ms: float
+) -> List[Dict]:
+    """与基线比较
+
+    Args:
+        current: 本次结果
+        baseline: 基线结果
+        threshold: 判定为退化的耗时增加比例（0.2 表示20%）
+        min_delta_ms: 判定为退化的最小耗时增加（毫秒，过滤微小字段的噪声）
+
+    Returns:
+        每个指标的比较结果 [{"case", "metric", "baseline", "current", "ratio", "regression"}]
+    """
+    rows = []
+    for case, metrics in current["cases"].items():
+        base_metrics = baseline.get("cases", {}).get(case)
+        if not base_metrics:
+            continue
+        for metric, value in metrics.items():
+            base_value = base_metrics.get(metric)
+            if base_value is None:
+                continue
+            ratio = value / base_value if base_value > 0 else float("inf")
+            rows.append(
+                {
+                    "case": case,
+                    "metric": metric,
+                    "baseline": base_value,
+                    "current": value,
+                    "ratio": round(ratio, 3),
+                    "regression": ratio > 1 + threshold
+                    and value - base_value > min_delta_ms,
+                }
+            )
+    return rows
+
+
+def format_comparison(rows: List[Dict]) -> str:
+    """格式化比较结果（每个文件的total和退化项）"""
+    lines = [f"{'文件':<28}{'指标':<20}{'基线(ms)':>10}{'本次(ms)':>10}{'比例':>8}"]
+    for row in rows:
+        if row["metric"] != "total" and not row["regression"]:
+            continue
+        flag = "  ← 退化" if row["regression"] else ""
+        lines.append(
+            f"{row['case']:<28}{row['metric']:<20}{row['baseline']:>10.1f}"
+            f"{row['current']:>10.1f}{row['ratio']:>8.2f}{flag}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="简历提取基准测试")
+    parser.add_argument("--corpus", help="合成工作簿目录（默认临时目录）")
+    parser.add_argument(
+        "--rows", type=int, nargs="+", default=list(DEFAULT_ROWS), help="合成行数"
+    )
+    parser.add_argument(
+        "--variants", nargs="+", choices=VARIANTS, default=list(VARIANTS)
+    )
+    parser.add_argument(
+        "--formats", nargs="+", choices=("xlsx", "xls"), default=["xlsx", "xls"]
+    )
+    parser.add_argument(
+        "--no-samples", action="store_true", help="不包含项目自带的 職務経歴書-*.xls"
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="每个文件的运行次数")
+    parser.add_argument(
+        "--loader", choices=("pandas", "native", "streaming"), default="pandas"
+    )
+    parser.add_argument("--save", help="保存结果为基线JSON")
+    parser.add_argument("--baseline", help="与该基线JSON比较")
+    parser.add_argument(
+        "--threshold", type=float, default=0.2, help="退化判定比例（默认0.2）"
+    )
+    parser.add_argument(
+        "--min-delta", type=float, default=1.0, help="退化判定的最小增加毫秒数"
+    )
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        corpus_dir = Path(args.corpus or tmp_dir)
+        files = generate_corpus(corpus_dir, args.rows, args.variants, args.formats)
+        if not args.no_samples:
+            files = sorted(PROJECT_ROOT.glob("職務経歴書-*.xls")) + files
+
+        current = run(files, args.repeat, args.loader)
+
+    if args.save:
+        Path(args.save).write_text(
+            json.dumps(current, ensure_ascii=False, indent=2), encoding="utf-8"
+        )
+        print(f"基线已保存: {args.save}", file=sys.stderr)
+
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text(encoding="utf-8"))
+        rows = compare(current, baseline, args.threshold, args.min_delta)
+        print(format_comparison(rows))
+        regressions = [row for row in rows if row["regression"]]
+        if regressions:
+            print(f"发现 {len(regressions)} 项性能退化", file=sys.stderr)
+            return 1
+        print("没有性能退化", file=sys.stderr)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
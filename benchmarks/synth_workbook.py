@@ -0,0 +1,283 @@
+# -*- coding: utf-8 -*-
+"""合成職務経歴書生成器：生成用于基准测试的技能表工作簿
+
+布局变体：
+- right:  标签右侧相邻单元格为值
+- spread: 值在标签右侧隔几列（模拟合并单元格展开后的空列）
+- below:  值在标签下方
+
+每个工作簿包含个人信息区、技能区和项目表（期间、业务内容、技术、役割、
+基本設計…運用保守 各工程列的◎○●标记），项目行重复直到达到指定行数。
+
+.xlsx 使用 openpyxl 写入；.xls 需要 xlwt（可选依赖，见 requirements.txt，
+未安装时跳过.xls并在标准错误输出原因）。
+
+用法: python benchmarks/synth_workbook.py 输出目录 [--rows 50 500 5000]
+      [--variants right spread below] [--formats xlsx xls] [--seed N]
+"""
+
+import argparse
+import random
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+VARIANTS = ("right", "spread", "below")
+DEFAULT_ROWS = (50, 500, 5000)
+DEFAULT_FORMATS = ("xlsx", "xls")
+
+XLWT_MISSING_MESSAGE = "生成.xls合成工作簿需要xlwt（pip install xlwt）"
+
+DESIGN_PHASES = [
+    "要件定義",
+    "基本設計",
+    "詳細設計",
+    "製造",
+    "単体テスト",
+    "結合テスト",
+    "総合テスト",
+    "運用保守",
+]
+MARKS = ["◎", "○", "●", ""]
+
+NAMES = [("リュウ", "劉 偉"), ("エン", "燕 明"), ("ヤマダ タロウ", "山田 太郎")]
+NATIONALITIES = ["中国", "ベトナム", "韓国", "日本"]
+LANGUAGES = ["Java", "Python", "C#", "JavaScript", "TypeScript", "PHP", "Go", "VB.NET"]
+FRAMEWORKS = ["Spring Boot", "Django", "ASP.NET", "React", "Vue.js", "Laravel"]
+DATABASES = ["MySQL", "Oracle", "PostgreSQL", "SQL Server"]
+OS_LIST = ["Windows", "Linux", "CentOS", "Ubuntu"]
+TOOLS = ["Git", "SVN", "Eclipse", "Jenkins", "Docker", "VS Code"]
+ROLES = ["PG", "SE", "PL", "PM"]
+BUSINESS = [
+    "顧客管理システムの開発",
+    "在庫管理システムの改修",
+    "物流Webシステムの新規開発",
+    "会計パッケージの保守",
+    "ECサイトのバックエンド開発",
+]
+
+# 项目表的列
+PROJECT_COLUMNS = ["No", "期間", "業務内容", "言語", "DB", "OS", "役割"] + DESIGN_PHASES
+
+Cells = Dict[Tuple[int, int], object]
+
+
+def _place(cells: Cells, row: int, col: int, label: str, value, variant: str) -> int:
+    """按布局变体放置标签和值，返回占用的行数"""
+    cells[(row, col)] = label
+    if variant == "right":
+        cells[(row, col + 1)] = value
+        return 1
+    if variant == "spread":
+        cells[(row, col + 3)] = value
+        return 1
+    cells[(row + 1, col)] = value
+    return 2
+
+
+def build_cells(n_rows: int, variant: str, seed: int = 0) -> Cells:
+    """生成工作簿的单元格内容
+
+    Args:
+        n_rows: 目标行数（项目表重复直到达到该行数）
+        variant: 布局变体（right / spread / below）
+        seed: 随机种子
+
+    Returns:
+        (row, col) -> 值
+    """
+    if variant not in VARIANTS:
+        raise ValueError(f"未知的布局变体: {variant}")
+
+    rng = random.Random(f"{seed}-{variant}-{n_rows}")
+    cells: Cells = {}
+    furigana, name = rng.choice(NAMES)
+    birth_year = rng.randint(1980, 2000)
+
+    cells[(0, 0)] = "職務経歴書"
+
+    # 个人信息区
+    row = 2
+    row += _place(cells, row, 0, "フリガナ", furigana, variant)
+    row += _place(cells, row, 0, "氏名", name, variant)
+    _place(cells, row, 0, "性別", rng.choice(["男", "女"]), variant)
+    # 生年月日分散在多个单元格（年/月/日）
+    cells[(row, 6)] = "生年月日"
+    cells[(row + 1, 6)] = f"{birth_year}年"
+    cells[(row + 1, 7)] = f"{rng.randint(1, 12)}月"
+    cells[(row + 1, 8)] = f"{rng.randint(1, 28)}日"
+    row += 2
+    # 年龄：満 / 数字 / 才
+    cells[(row, 6)] = "満"
+    cells[(row, 7)] = 2024 - birth_year
+    cells[(row, 8)] = "才"
+    row += _place(cells, row, 0, "国籍", rng.choice(NATIONALITIES), variant)
+    row += _place(cells, row, 0, "来日", f"{rng.randint(2010, 2020)}年", variant)
+    row += _place(cells, row, 0, "経験年数", f"{rng.randint(2, 15)}年", variant)
+    row += _place(
+        cells, row, 0, "日本語", rng.choice(["N1", "N2", "ビジネスレベル"]), variant
+    )
+    row += 1
+
+    # 技能区
+    cells[(row, 0)] = "スキル"
+    row += 1
+    for label, pool in (
+        ("言語", LANGUAGES),
+        ("フレームワーク", FRAMEWORKS),
+        ("DB", DATABASES),
+        ("OS", OS_LIST),
+        ("ツール", TOOLS),
+    ):
+        cells[(row, 0)] = label
+        cells[(row, 2)] = "、".join(rng.sample(pool, min(3, len(pool))))
+        row += 1
+    row += 1
+
+    # 项目表
+    for col, header in enumerate(PROJECT_COLUMNS):
+        cells[(row, col)] = header
+    row += 1
+
+    project = 1
+    year = 2010
+    while row < n_rows:
+        month = rng.randint(1, 12)
+        length = rng.randint(3, 18)
+        end_year = year + (month + length - 1) // 12
+        end_month = (month + length - 1) % 12 + 1
+        cells[(row, 0)] = project
+        cells[(row, 1)] = f"{year}年{month}月～{end_year}年{end_month}月"
+        cells[(row, 2)] = rng.choice(BUSINESS)
+        cells[(row, 3)] = rng.choice(LANGUAGES)
+        cells[(row, 4)] = rng.choice(DATABASES)
+        cells[(row, 5)] = rng.choice(OS_LIST)
+        cells[(row, 6)] = rng.choice(ROLES)
+        start = rng.randint(0, 3)
+        for phase in range(len(DESIGN_PHASES)):
+            mark = rng.choice(MARKS[:3]) if start <= phase < start + 5 else ""
+            if mark:
+                cells[(row, 7 + phase)] = mark
+        # 业务内容的后续说明行
+        for extra in range(rng.randint(1, 3)):
+            if row + 1 + extra >= n_rows:
+                break
+            cells[(row + 1 + extra, 2)] = (
+                f"・{rng.choice(FRAMEWORKS)}を用いた{rng.choice(['画面', '帳票', 'バッチ'])}開発"
+            )
+            if rng.random() < 0.5:
+                cells[(row + 1 + extra, 3)] = rng.choice(FRAMEWORKS)
+        row += 4
+        project += 1
+        year = min(end_year, 2023)
+
+    return cells
+
+
+def _write_xlsx(path: Path, cells: Cells):
+    import openpyxl
+
+    book = openpyxl.Workbook(write_only=True)
+    sheet = book.create_sheet("職務経歴書")
+    n_rows = max(row for row, _ in cells) + 1
+    n_cols = max(col for _, col in cells) + 1
+    for row in range(n_rows):
+        sheet.append([cells.get((row, col)) for col in range(n_cols)])
+    book.save(path)
+
+
+def _write_xls(path: Path, cells: Cells):
+    try:
+        import xlwt
+    except ImportError as e:
+        raise ImportError(XLWT_MISSING_MESSAGE) from e
+
+    book = xlwt.Workbook(encoding="utf-8")
+    sheet = book.add_sheet("職務経歴書")
+    for (row, col), value in cells.items():
+        sheet.write(row, col, value)
+    book.save(str(path))
+
+
+def generate_workbook(
+    path: Path, n_rows: int, variant: str = "right", seed: int = 0
+) -> Path:
+    """生成一个合成工作簿
+
+    Args:
+        path: 输出路径（扩展名决定格式：.xlsx 或 .xls）
+        n_rows: 行数
+        variant: 布局变体
+        seed: 随机种子
+
+    Returns:
+        输出路径
+
+    Raises:
+        ImportError: 生成.xls但没有安装xlwt
+    """
+    path = Path(path)
+    cells = build_cells(n_rows, variant, seed)
+    if path.suffix.lower() == ".xls":
+        _write_xls(path, cells)
+    else:
+        _write_xlsx(path, cells)
+    return path
+
+
+def generate_corpus(
+    output_dir: Path,
+    rows: Sequence[int] = DEFAULT_ROWS,
+    variants: Sequence[str] = VARIANTS,
+    formats: Sequence[str] = DEFAULT_FORMATS,
+    seed: int = 0,
+) -> List[Path]:
+    """生成一组合成工作簿（已存在的文件不重新生成）
+
+    Returns:
+        生成的文件路径（缺少xlwt时不包含.xls）
+    """
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    files = []
+    for file_format in formats:
+        if file_format == "xls":
+            try:
+                import xlwt  # noqa: F401
+            except ImportError:
+                skipped = len(variants) * len(rows)
+                print(
+                    f"跳过{skipped}个.xls用例：{XLWT_MISSING_MESSAGE}", file=sys.stderr
+                )
+                continue
+        for variant in variants:
+            for n_rows in rows:
+                path = output_dir / f"synth-{variant}-{n_rows}.{file_format}"
+                if not path.exists():
+                    generate_workbook(path, n_rows, variant, seed)
+                files.append(path)
+    return files
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="生成合成職務経歴書工作簿")
+    parser.add_argument("output_dir", help="输出目录")
+    parser.add_argument("--rows", type=int, nargs="+", default=list(DEFAULT_ROWS))
+    parser.add_argument(
+        "--variants", nargs="+", choices=VARIANTS, default=list(VARIANTS)
+    )
+    parser.add_argument(
+        "--formats", nargs="+", choices=DEFAULT_FORMATS, default=list(DEFAULT_FORMATS)
+    )
+    parser.add_argument("--seed", type=int, default=0, help="随机种子")
+    args = parser.parse_args(argv)
+
+    for path in generate_corpus(
+        args.output_dir, args.rows, args.variants, args.formats, args.seed
+    ):
+        print(path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+"""工作簿读取基准：比较 pandas.read_excel 与 xlrd/openpyxl 直接读取
+
+对每个文件分别测量两种方式的读取耗时（读取 + 构建SheetGrid）
+和完整提取耗时，并列出两种方式提取结果不同的字段。
+
+用法: python benchmarks/workbook_loader.py [文件...] [--repeat N]
+      （默认使用项目根目录下的 職務経歴書-*.xls）
+"""
+
+import argparse
+import sys
+import timeit
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from extractor import ResumeExtractor
+
+
+def main():
+    parser = argparse.ArgumentParser(description="工作簿读取基准")
+    parser.add_argument("files", nargs="*", help="Excel文件")
+    parser.add_argument("--repeat", type=int, default=20, help="每个文件的重复次数")
+    args = parser.parse_args()
+
+    files = args.files or sorted(
+        str(path) for path in PROJECT_ROOT.glob("職務経歴書-*.xls")
+    )
+    extractors = {
+        loader: ResumeExtractor(quiet=True, loader=loader)
+        for loader in ("pandas", "native")
+    }
+
+    print(f"{'文件':<24}{'读取方式':<10}{'读取(ms)':>10}{'提取(ms)':>10}")
+    for file_path in files:
+        results = {}
+        for loader, extractor in extractors.items():
+            engine = "xlrd" if file_path.lower().endswith(".xls") else "openpyxl"
+            load_time = min(
+                timeit.repeat(
+                    lambda: extractor._load_sheets(file_path, engine),
+                    number=1,
+                    repeat=args.repeat,
+                )
+            )
+            extract_time = min(
+                timeit.repeat(
+                    lambda: extractor.extract_from_excel(file_path),
+                    number=1,
+                    repeat=args.repeat,
+                )
+            )
+            results[loader] = extractor.extract_from_excel(file_path)
+            print(
+                f"{Path(file_path).name:<24}{loader:<10}"
+                f"{load_time * 1000:>10.1f}{extract_time * 1000:>10.1f}"
+            )
+
+        for field, value in results["pandas"].items():
+            if results["native"].get(field) != value:
+                print(
+                    f"    字段不同 {field}: pandas={value!r} "
+                    f"native={results['native'].get(field)!r}"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,30 +1,142 @@
 # -*- coding: utf-8 -*-
 """主提取器类 - 修复版：统一返回null"""
 
-import pandas as pd
-from typing import Dict, List, Optional, Any
-import traceback
+import importlib
+import logging
+import threading
+import time
+
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
 from pathlib import Path
 
-from extractors.name_extractor import NameExtractor
-from extractors.gender_extractor import GenderExtractor
-from extractors.age_extractor import AgeExtractor
-from extractors.nationality_extractor import NationalityExtractor
-from extractors.arrival_year_extractor import ArrivalYearExtractor
-from extractors.experience_extractor import ExperienceExtractor
-from extractors.japanese_level_extractor import JapaneseLevelExtractor
-from extractors.skills_extractor import SkillsExtractor
-from extractors.work_scope_extractor import WorkScopeExtractor
-from extractors.role_extractor import RoleExtractor
-from extractors.birthdate_extractor import BirthdateExtractor
-from utils.text_utils import dataframe_to_text
+from base.deadline import (
+    DeadlineExceeded,
+    check_deadline,
+    deadline_after,
+    deadline_scope,
+)
+from base.field_scheduler import FieldNode, FieldScheduler
+from utils.result_cache import ResultCache, file_sha256
+from utils.log_utils import get_logger, configure_logging
+
+if TYPE_CHECKING:
+    from base.base_extractor import BaseExtractor
+
+# pandas、openpyxl/xlrd、各提取器（以及它们编译的正则、关键词自动机）都在首次使用时导入：
+# 命中缓存的调用和短生命周期的进程不承担这些开销
+
+logger = get_logger(__name__)
+
+# 工作簿读取方式
+LOADERS = ("pandas", "native", "streaming")
+
+# 字段依赖图：(字段名, 提取器模块, 提取器类名, 依赖的字段)
+# 年龄和来日年份需要参考生年月日（计算年龄、排除出生年份），其余字段互相独立。
+FIELD_GRAPH: List[Tuple[str, str, str, Tuple[str, ...]]] = [
+    ("name", "extractors.name_extractor", "NameExtractor", ()),
+    ("gender", "extractors.gender_extractor", "GenderExtractor", ()),
+    ("birthdate", "extractors.birthdate_extractor", "BirthdateExtractor", ()),
+    ("age", "extractors.age_extractor", "AgeExtractor", ("birthdate",)),
+    ("nationality", "extractors.nationality_extractor", "NationalityExtractor", ()),
+    (
+        "arrival_year_japan",
+        "extractors.arrival_year_extractor",
+        "ArrivalYearExtractor",
+        ("birthdate",),
+    ),
+    ("experience", "extractors.experience_extractor", "ExperienceExtractor", ()),
+    (
+        "japanese_level",
+        "extractors.japanese_level_extractor",
+        "JapaneseLevelExtractor",
+        (),
+    ),
+    ("skills", "extractors.skills_extractor", "SkillsExtractor", ()),
+    ("work_scope", "extractors.work_scope_extractor", "WorkScopeExtractor", ()),
+    ("roles", "extractors.role_extractor", "RoleExtractor", ()),
+]
+
+_EXTRACTOR_CLASSES = {
+    field: (module_name, class_name)
+    for field, module_name, class_name, _ in FIELD_GRAPH
+}
+
+# 字段的显示名称（进度输出用）
+FIELD_LABELS = {
+    "name": "姓名",
+    "gender": "性别",
+    "birthdate": "出生年月日",
+    "age": "年龄",
+    "nationality": "国籍",
+    "arrival_year_japan": "来日年份",
+    "experience": "经验",
+    "japanese_level": "日语",
+    "skills": "技能",
+    "work_scope": "作业范围",
+    "roles": "角色",
+}
+
+
+# 超过时间预算、没有完成的字段的结果（组装结果时替换为None）
+_TIMED_OUT = object()
+
+
+def _elapsed_ms(start: float) -> float:
+    """从start（perf_counter）到现在的毫秒数"""
+    return round((time.perf_counter() - start) * 1000, 3)
 
 
 class ResumeExtractor:
     """简历信息提取器主类 - 修复版"""
 
-    def __init__(self):
-        """初始化提取器"""
+    def __init__(
+        self,
+        cache: Optional[ResultCache] = None,
+        quiet: bool = False,
+        verbose: bool = False,
+        workers: int = 1,
+        loader: str = "pandas",
+        triage: bool = True,
+        timings: bool = False,
+        profile_dir: Optional[str] = None,
+        time_budget: Optional[float] = None,
+        skill_cache_size: Optional[int] = None,
+    ):
+        """初始化提取器
+
+        Args:
+            cache: 结果缓存（可选），内容相同的工作簿直接返回已保存的结果
+            quiet: 静默模式，只输出警告和错误（批量处理时使用）
+            verbose: 输出各提取器的候选和逐单元格诊断信息
+                     （quiet/verbose 都不指定时不改变日志配置，由调用方自行配置logging）
+            workers: 字段提取的线程数（1 表示按依赖顺序逐个提取）
+            loader: 工作簿读取方式
+                    - "pandas": pandas.read_excel（第一行作为表头，跳过空行）
+                    - "native": xlrd/openpyxl直接读取原始单元格网格（保留全部行）
+                    - "streaming": 与native相同的网格，.xlsx按各提取器需要的行数
+                      流式解析（.xls仍整体读取）
+            triage: 先抽样判断各sheet是否像简历，跳过封面、说明等无关sheet
+                    （命中姓名、个人信息、技能、设计工程关键词的sheet都会保留）
+            timings: 在结果的 _meta.timings 中附加各阶段耗时（毫秒）
+            profile_dir: 用cProfile分析每次提取，pstats和折叠栈输出到该目录
+            time_budget: 每个文件的时间预算（秒，None 表示不限制），超时后返回已完成的字段，
+                         未完成的字段为None并记录在 _meta.timed_out_fields 中
+            skill_cache_size: 技能文本缓存的容量（条目数，0 表示不缓存）。
+                              该缓存在进程内共享，None 时保持环境变量
+                              SKILLS_EXTRACTOR_SKILL_CACHE_SIZE 或默认的容量
+        """
+        if loader not in LOADERS:
+            raise ValueError(f"未知的读取方式: {loader}（可选: {', '.join(LOADERS)}）")
+        self.cache = cache
+        self.loader = loader
+        self.triage = triage
+        self.timings = timings
+        self.profile_dir = profile_dir
+        self.time_budget = time_budget
+        self.skill_cache_size = skill_cache_size
+        if quiet or verbose:
+            configure_logging(quiet=quiet, verbose=verbose)
+
         # 修改模板：所有字段默认为None
         self.template = {
             "name": None,
@@ -40,18 +152,111 @@ class ResumeExtractor:
             "roles": None,
         }
 
-        # 初始化各个提取器
-        self.name_extractor = NameExtractor()
-        self.gender_extractor = GenderExtractor()
-        self.age_extractor = AgeExtractor()
-        self.birthdate_extractor = BirthdateExtractor()
-        self.nationality_extractor = NationalityExtractor()
-        self.arrival_year_extractor = ArrivalYearExtractor()
-        self.experience_extractor = ExperienceExtractor()
-        self.japanese_level_extractor = JapaneseLevelExtractor()
-        self.skills_extractor = SkillsExtractor()
-        self.work_scope_extractor = WorkScopeExtractor()
-        self.role_extractor = RoleExtractor()
+        # 各字段的提取器在第一次提取该字段时创建
+        self._extractors: Dict[str, "BaseExtractor"] = {}
+        self._extractors_lock = threading.Lock()
+
+        self.workers = workers
+        self.scheduler = FieldScheduler(
+            [
+                FieldNode(field, self._field_task(field), deps)
+                for field, _, _, deps in FIELD_GRAPH
+            ]
+        )
+        # 最近一次提取的各字段耗时（毫秒）
+        self.last_timings: Dict[str, float] = {}
+        # 当前提取中构建网格和文本的耗时（秒，各线程分别追加）
+        self._build_times: List[float] = []
+        # 当前提取的截止时间（time.monotonic()，None 表示不限制）
+        self._deadline: Optional[float] = None
+
+    def extractor(self, field: str) -> "BaseExtractor":
+        """获取字段的提取器（首次使用时导入模块并创建实例）
+
+        Args:
+            field: 字段名（FIELD_GRAPH 中的字段）
+
+        Returns:
+            该字段的提取器实例
+        """
+        extractor = self._extractors.get(field)
+        if extractor is None:
+            with self._extractors_lock:
+                extractor = self._extractors.get(field)
+                if extractor is None:
+                    module_name, class_name = _EXTRACTOR_CLASSES[field]
+                    module = importlib.import_module(module_name)
+                    extractor = getattr(module, class_name)()
+                    # 技能文本缓存在模块中，导入后才能调整容量
+                    if field == "skills" and self.skill_cache_size is not None:
+                        module.SKILL_TEXT_CACHE.resize(self.skill_cache_size)
+                    self._extractors[field] = extractor
+        return extractor
+
+    def warm_up(self):
+        """预先导入依赖并创建全部提取器
+
+        常驻进程（服务模式）启动时调用，第一个请求不再承担导入和初始化的开销。
+        """
+        for field in self.scheduler.order:
+            self.extractor(field)
+        modules = ["xlrd", "openpyxl", "base.sheet_triage", "base.workbook_loader"]
+        if self.loader == "pandas":
+            modules.append("pandas")
+        for module_name in modules:
+            try:
+                importlib.import_module(module_name)
+            except ImportError:
+                # 缺少的库在提取时报告
+                pass
+
+    def _field_task(self, field: str) -> Callable[..., Any]:
+        """包装提取器，返回标准化后的结果（依赖字段拿到的也是标准化后的值）"""
+        label = FIELD_LABELS[field]
+
+        def task(all_data: List[Dict], *deps: Any) -> Any:
+            try:
+                # 提取器和索引在循环中检查截止时间；已超时的字段不再开始
+                with deadline_scope(self._deadline):
+                    check_deadline()
+                    extractor = self.extractor(field)
+                    horizon = extractor.row_horizon
+                    sheets = [
+                        self._timed_build(self._sheet_view, data, horizon)
+                        for data in all_data
+                    ]
+                    value = self._normalize_result(extractor.extract(sheets, *deps))
+            except DeadlineExceeded:
+                logger.info("✗ %s: 超过时间预算，未完成", label)
+                return _TIMED_OUT
+            if field == "skills":
+                logger.info("✓ %s: %s个", label, len(value) if value else 0)
+            else:
+                logger.info("✓ %s: %s", label, value)
+            return value
+
+        return task
+
+    def _timed_build(self, func: Callable[..., Any], *args: Any) -> Any:
+        """执行网格/文本的构建，耗时计入 _meta.timings 的 build_ms"""
+        start = time.perf_counter()
+        try:
+            return func(*args)
+        finally:
+            self._build_times.append(time.perf_counter() - start)
+
+    @staticmethod
+    def _sheet_view(data: Dict, horizon: Optional[int]) -> Dict:
+        """提取器看到的sheet数据
+
+        流式读取的sheet按提取器的行数上限取网格（只解析需要的行），
+        其他读取方式已经是完整的网格，原样返回。
+        """
+        sheet = data.get("sheet")
+        if sheet is None:
+            return data
+        grid = sheet.grid(horizon)
+        return {"sheet_name": data["sheet_name"], "grid": grid}
 
     def _normalize_result(self, value: Any) -> Optional[Any]:
         """标准化提取结果
@@ -81,15 +286,253 @@ class ResumeExtractor:
         # 其他类型直接返回
         return value
 
-    def extract_from_excel(self, file_path: str) -> Dict:
+    def extract_from_excel(
+        self, file_path: str, deadline: Optional[float] = None
+    ) -> Dict:
         """从Excel文件提取简历信息 - 修复版
 
         Args:
             file_path: Excel文件路径（支持.xls和.xlsx格式）
+            deadline: 本次提取的时间预算（秒，从调用时开始计算），默认使用 time_budget。
+                      超时后不再等待未完成的字段：已完成的字段照常返回，
+                      其余字段为None并列在 _meta.timed_out_fields 中（部分结果不写入缓存）
 
         Returns:
             提取的简历信息字典
         """
+        budget = deadline if deadline is not None else self.time_budget
+        expires = deadline_after(budget)
+        if self.cache is None:
+            return self._run_extraction(file_path, expires)
+
+        try:
+            # 读取方式和sheet筛选都会影响结果，分开缓存
+            file_hash = (
+                f"{file_sha256(file_path)}:{self.loader}:triage={int(self.triage)}"
+            )
+        except OSError:
+            # 文件无法读取时交给正常流程报告错误
+            return self._run_extraction(file_path, expires)
+
+        start = time.perf_counter()
+        cached = self.cache.get(file_hash)
+        if cached is not None:
+            logger.info("命中缓存: %s", file_path)
+            if "_meta" in cached:
+                if expires is not None:
+                    cached["_meta"]["timed_out_fields"] = []
+                if self.timings:
+                    cached["_meta"]["timings"] = {
+                        "cached": True,
+                        "total_ms": _elapsed_ms(start),
+                    }
+            return cached
+
+        result = self._run_extraction(file_path, expires)
+        meta = result.get("_meta", {})
+        # 超时的部分结果不写入缓存
+        if "error" not in result and not meta.get("timed_out_fields"):
+            # 耗时和超时字段只属于本次提取，不写入缓存
+            timings = meta.pop("timings", None)
+            timed_out = meta.pop("timed_out_fields", None)
+            self.cache.put(file_hash, result)
+            if timings is not None:
+                meta["timings"] = timings
+            if timed_out is not None:
+                meta["timed_out_fields"] = timed_out
+        return result
+
+    def _run_extraction(self, file_path: str, deadline: Optional[float] = None) -> Dict:
+        """提取一个文件（指定了 profile_dir 时在cProfile下执行）"""
+        if not self.profile_dir:
+            return self._extract_from_excel(file_path, deadline)
+
+        from utils.profile_utils import profile_call
+
+        result, pstats_path = profile_call(
+            self._extract_from_excel,
+            self.profile_dir,
+            Path(file_path).stem,
+            file_path,
+            deadline,
+        )
+        logger.info("性能分析结果: %s", pstats_path)
+        return result
+
+    def _triage_sheets(
+        self, samplers: List[Tuple[str, Callable[[], Any]]]
+    ) -> Dict[str, str]:
+        """用各sheet开头的少量单元格判断哪些sheet不需要读取
+
+        Args:
+            samplers: [(sheet名, 返回开头若干行单元格值的函数)]
+
+        Returns:
+            sheet名 -> 跳过原因（所有sheet都不像简历时不跳过任何sheet）
+        """
+        if not self.triage:
+            return {}
+
+        from base.sheet_triage import triage_sheet
+
+        reasons = {}
+        for sheet_name, sample in samplers:
+            reason = triage_sheet(sample())
+            if reason:
+                reasons[sheet_name] = reason
+
+        if reasons and len(reasons) == len(samplers):
+            logger.info("所有sheet都没有简历关键词，全部提取")
+            return {}
+        for sheet_name, reason in reasons.items():
+            logger.info("跳过sheet: %s（%s）", sheet_name, reason)
+        return reasons
+
+    def _load_sheets(
+        self, file_path: str, engine: Optional[str]
+    ) -> Tuple[List[Dict], List[Dict]]:
+        """读取工作簿，返回各有效sheet的数据
+
+        各sheet按需读取：先用开头的少量单元格筛选，只完整读取可能是简历的sheet。
+        pandas读取方式下抽样本身会让xlrd/openpyxl解析整张sheet，
+        筛选只省去被跳过sheet的DataFrame和网格构建，读取时间基本不变。
+
+        Args:
+            file_path: Excel文件路径
+            engine: pandas读取引擎
+
+        Returns:
+            (sheet数据, 跳过的sheet)
+            - sheet数据: [{"sheet_name", "grid", "df"(仅pandas)}]，
+              行文本在提取器第一次需要时由网格构建（grid.row_texts）；
+              流式读取时为 [{"sheet_name", "sheet"}]，网格在提取时按需构建
+            - 跳过的sheet: [{"sheet", "reason"}]
+        """
+        from base.sheet_triage import TRIAGE_MAX_ROWS
+
+        all_data = []
+        skipped = []
+
+        def skip(sheet_name: str, reason: str):
+            skipped.append({"sheet": sheet_name, "reason": reason})
+
+        if self.loader == "streaming" and Path(file_path).suffix.lower() == ".xlsx":
+            from base.workbook_loader import open_streaming_sheets
+
+            sheets = open_streaming_sheets(file_path)
+            try:
+                reasons = self._triage_sheets(
+                    [
+                        (
+                            sheet.name,
+                            lambda sheet=sheet: sheet.grid(TRIAGE_MAX_ROWS).values,
+                        )
+                        for sheet in sheets
+                    ]
+                )
+                for sheet in sheets:
+                    if sheet.name in reasons:
+                        skip(sheet.name, reasons[sheet.name])
+                    elif sheet.is_empty():
+                        logger.info("跳过空sheet: %s", sheet.name)
+                        skip(sheet.name, "空sheet")
+                    else:
+                        all_data.append({"sheet_name": sheet.name, "sheet": sheet})
+            except BaseException:
+                # 筛选中出错（sheet的XML损坏等）时关闭工作簿，避免常驻进程泄漏文件句柄
+                if sheets:
+                    sheets[0].close()
+                raise
+            # 有需要提取的sheet时，工作簿在字段提取结束后关闭
+            if not all_data and sheets:
+                sheets[0].close()
+            return all_data, skipped
+
+        if self.loader in ("native", "streaming"):
+            from base.workbook_loader import open_workbook_sheets
+
+            sheets, close = open_workbook_sheets(file_path)
+            try:
+                reasons = self._triage_sheets(
+                    [
+                        (sheet.name, lambda sheet=sheet: sheet.sample(TRIAGE_MAX_ROWS))
+                        for sheet in sheets
+                    ]
+                )
+                for sheet in sheets:
+                    if sheet.name in reasons:
+                        sheet.release()
+                        skip(sheet.name, reasons[sheet.name])
+                        continue
+
+                    grid = self._timed_build(sheet.grid)
+                    sheet.release()
+                    if grid.n_rows == 0:
+                        logger.info("跳过空sheet: %s", sheet.name)
+                        skip(sheet.name, "空sheet")
+                        continue
+                    all_data.append({"sheet_name": sheet.name, "grid": grid})
+            finally:
+                close()
+            return all_data, skipped
+
+        import pandas as pd
+
+        from base.sheet_grid import SheetGrid
+
+        # xlrd按需加载：只解析被访问的sheet
+        source = file_path
+        if engine == "xlrd":
+            import xlrd
+
+            source = xlrd.open_workbook(file_path, on_demand=True)
+
+        with pd.ExcelFile(source, engine=engine) as excel:
+            reasons = self._triage_sheets(
+                [
+                    (
+                        sheet_name,
+                        lambda sheet_name=sheet_name: excel.parse(
+                            sheet_name, header=None, nrows=TRIAGE_MAX_ROWS
+                        ).itertuples(index=False, name=None),
+                    )
+                    for sheet_name in excel.sheet_names
+                ]
+            )
+            for sheet_name in excel.sheet_names:
+                if sheet_name in reasons:
+                    skip(sheet_name, reasons[sheet_name])
+                    continue
+
+                df = excel.parse(sheet_name)
+                # 跳过空的sheet
+                if df.empty:
+                    logger.info("跳过空sheet: %s", sheet_name)
+                    skip(sheet_name, "空sheet")
+                    continue
+
+                # 每个sheet只物化一次单元格网格，供所有提取器共享
+                all_data.append(
+                    {
+                        "sheet_name": sheet_name,
+                        "df": df,
+                        "grid": self._timed_build(SheetGrid.from_dataframe, df),
+                    }
+                )
+        return all_data, skipped
+
+    def _extract_from_excel(
+        self, file_path: str, deadline: Optional[float] = None
+    ) -> Dict:
+        """读取工作簿并提取简历信息（不经过缓存）
+
+        Args:
+            file_path: Excel文件路径
+            deadline: 截止时间（time.monotonic()，None 表示不限制）
+        """
+        start = time.perf_counter()
+        self._build_times = []
+        self._deadline = deadline
         try:
             # 检查文件扩展名
             file_ext = Path(file_path).suffix.lower()
@@ -97,18 +540,18 @@ class ResumeExtractor:
             # 根据文件类型设置引擎
             if file_ext == ".xls":
                 engine = "xlrd"
-                print(f"使用xlrd引擎读取xls文件")
+                logger.info("使用xlrd引擎读取xls文件")
             elif file_ext == ".xlsx":
                 engine = "openpyxl"
-                print(f"使用openpyxl引擎读取xlsx文件")
+                logger.info("使用openpyxl引擎读取xlsx文件")
             else:
                 # pandas会自动选择引擎
                 engine = None
-                print(f"自动选择引擎读取文件")
+                logger.info("自动选择引擎读取文件")
 
             # 读取所有sheets
             try:
-                all_sheets = pd.read_excel(file_path, sheet_name=None, engine=engine)
+                all_data, skipped = self._load_sheets(file_path, engine)
             except ImportError as e:
                 if "xlrd" in str(e):
                     return {"error": "缺少xlrd库。请运行: pip install xlrd==2.0.1"}
@@ -117,86 +560,75 @@ class ResumeExtractor:
                 else:
                     raise
 
-            result = self.template.copy()
-
-            # 收集所有数据
-            all_data = []
-            for sheet_name, df in all_sheets.items():
-                # 跳过空的sheet
-                if df.empty:
-                    print(f"跳过空sheet: {sheet_name}")
-                    continue
+            load_end = time.perf_counter()
+            load_build = sum(self._build_times)
 
-                all_data.append(
-                    {"sheet_name": sheet_name, "df": df, "text": dataframe_to_text(df)}
-                )
+            result = self.template.copy()
 
             if not all_data:
                 return {"error": "Excel文件中没有有效的数据"}
 
             # 按优化顺序提取各个字段
-            print(f"开始提取文件: {file_path}")
-            print(f"包含 {len(all_data)} 个有效sheet")
-
-            # 基本信息
-            name_result = self.name_extractor.extract(all_data)
-            result["name"] = self._normalize_result(name_result)
-            print(f"✓ 姓名: {result['name']}")
-
-            gender_result = self.gender_extractor.extract(all_data)
-            result["gender"] = self._normalize_result(gender_result)
-            print(f"✓ 性别: {result['gender']}")
-
-            # 先提取生年月日，再用它来计算年龄
-            birthdate_result = self.birthdate_extractor.extract(all_data)
-            result["birthdate"] = self._normalize_result(birthdate_result)
-            print(f"✓ 出生年月日: {result['birthdate']}")
-
-            # 修复：年龄提取器现在可以接受生年月日参数
-            age_result = self.age_extractor.extract(all_data, result["birthdate"])
-            result["age"] = self._normalize_result(age_result)
-            print(f"✓ 年龄: {result['age']}")
-
-            nationality_result = self.nationality_extractor.extract(all_data)
-            result["nationality"] = self._normalize_result(nationality_result)
-            print(f"✓ 国籍: {result['nationality']}")
-
-            # 修复：来日年份提取器现在可以排除出生年份
-            arrival_result = self.arrival_year_extractor.extract(
-                all_data, result["birthdate"]
-            )
-            result["arrival_year_japan"] = self._normalize_result(arrival_result)
-            print(f"✓ 来日年份: {result['arrival_year_japan']}")
-
-            experience_result = self.experience_extractor.extract(all_data)
-            result["experience"] = self._normalize_result(experience_result)
-            print(f"✓ 经验: {result['experience']}")
-
-            # 修复：使用改进的日语水平提取器
-            japanese_result = self.japanese_level_extractor.extract(all_data)
-            result["japanese_level"] = self._normalize_result(japanese_result)
-            print(f"✓ 日语: {result['japanese_level']}")
+            logger.info("开始提取文件: %s", file_path)
+            logger.info("包含 %s 个有效sheet", len(all_data))
 
-            skills_result = self.skills_extractor.extract(all_data)
-            result["skills"] = self._normalize_result(skills_result)
-            print(f"✓ 技能: {len(skills_result) if skills_result else 0}个")
-
-            work_scope_result = self.work_scope_extractor.extract(all_data)
-            result["work_scope"] = self._normalize_result(work_scope_result)
-            print(f"✓ 作业范围: {result['work_scope']}")
-
-            roles_result = self.role_extractor.extract(all_data)
-            result["roles"] = self._normalize_result(roles_result)
-            print(f"✓ 角色: {result['roles']}")
+            # 按字段依赖关系执行，没有依赖的字段可以并发
+            try:
+                values, timings = self.scheduler.run(all_data, max_workers=self.workers)
+            finally:
+                for data in all_data:
+                    if "sheet" in data:
+                        data["sheet"].close()
+            self.last_timings = timings
+            timed_out = []
+            for field in self.scheduler.order:
+                if values[field] is _TIMED_OUT:
+                    timed_out.append(field)
+                    result[field] = None
+                else:
+                    result[field] = values[field]
+            if timed_out:
+                logger.warning("超过时间预算，未完成的字段: %s", ", ".join(timed_out))
+
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "字段耗时(ms): %s",
+                    ", ".join(
+                        f"{field}={elapsed:.1f}" for field, elapsed in timings.items()
+                    ),
+                )
 
             # 后处理：如果某些字段仍然有问题，进行最后修复
+            post_start = time.perf_counter()
             result = self._post_process_result(result)
 
+            # 提取过程的附加信息（不属于简历字段）
+            result["_meta"] = {"skipped_sheets": skipped}
+            if deadline is not None:
+                result["_meta"]["timed_out_fields"] = timed_out
+            if self.timings:
+                from extractors.skills_extractor import SKILL_TEXT_CACHE
+
+                # 流式读取时网格在各字段提取中构建，build_ms也包含在字段耗时内
+                result["_meta"]["timings"] = {
+                    "load_ms": round((load_end - start - load_build) * 1000, 3),
+                    "build_ms": round(sum(self._build_times) * 1000, 3),
+                    "fields_ms": {
+                        field: round(elapsed, 3) for field, elapsed in timings.items()
+                    },
+                    "post_process_ms": _elapsed_ms(post_start),
+                    "total_ms": _elapsed_ms(start),
+                    # 进程启动以来的累计值（批量/服务模式下为各工作进程各自的统计）
+                    "skill_text_cache": SKILL_TEXT_CACHE.info(),
+                }
+
             return result
 
         except Exception as e:
-            print(f"处理文件时出错: {e}")
-            traceback.print_exc()
+            # 静默模式下错误已记录在结果中，只输出一行
+            logger.error(
+                "处理文件时出错: %s", e, exc_info=logger.isEnabledFor(logging.INFO)
+            )
 
             # 提供更详细的错误信息
             error_msg = str(e)
@@ -212,7 +644,7 @@ class ResumeExtractor:
 
     def _post_process_result(self, result: Dict) -> Dict:
         """后处理结果，进行最终修复"""
-        print("\n🔧 后处理阶段...")
+        logger.info("\n🔧 后处理阶段...")
 
         # 修复1：如果年龄仍为空但有生年月日，计算年龄
         if result.get("age") is None and result.get("birthdate"):
@@ -229,7 +661,7 @@ class ResumeExtractor:
                     age -= 1
                 if 15 <= age <= 80:
                     result["age"] = str(age)
-                    print(f"    修复年龄: {result['age']}")
+                    logger.info("    修复年龄: %s", result["age"])
             except:
                 pass
 
@@ -239,7 +671,7 @@ class ResumeExtractor:
             and result.get("birthdate")
             and result["arrival_year_japan"] == result["birthdate"][:4]
         ):
-            print(f"    发现错误的来日年份（等于出生年份），清空")
+            logger.info("    发现错误的来日年份（等于出生年份），清空")
             result["arrival_year_japan"] = None
 
         # 修复3：如果日语水平为空但经验丰富，给出合理推测
@@ -249,15 +681,17 @@ class ResumeExtractor:
             and any(char.isdigit() for char in result["experience"])
         ):
             try:
-                # 提取经验年数
-                import re
+                from base.patterns import DECIMAL_NUMBER
 
-                exp_match = re.search(r"(\d+(?:\.\d+)?)", result["experience"])
+                # 提取经验年数
+                exp_match = DECIMAL_NUMBER.search(result["experience"])
                 if exp_match:
                     exp_years = float(exp_match.group(1))
                     if exp_years >= 5:
                         result["japanese_level"] = "N2以上"
-                        print(f"    根据经验推测日语水平: {result['japanese_level']}")
+                        logger.info(
+                            "    根据经验推测日语水平: %s", result["japanese_level"]
+                        )
             except:
                 pass
 
@@ -272,12 +706,14 @@ class ResumeExtractor:
                     unique_skills.append(skill)
 
             if len(unique_skills) != len(result["skills"]):
-                print(f"    技能去重: {len(result['skills'])} → {len(unique_skills)}")
+                logger.info(
+                    "    技能去重: %s → %s", len(result["skills"]), len(unique_skills)
+                )
                 result["skills"] = unique_skills
 
         # 最终确保所有空值都是None
         for key, value in result.items():
             result[key] = self._normalize_result(value)
 
-        print("✅ 后处理完成")
+        logger.info("✅ 后处理完成")
         return result
@@ -1,25 +1,25 @@
-from .name_extractor import NameExtractor
-from .gender_extractor import GenderExtractor
-from .age_extractor import AgeExtractor
-from .birthdate_extractor import BirthdateExtractor
-from .nationality_extractor import NationalityExtractor
-from .arrival_year_extractor import ArrivalYearExtractor
-from .experience_extractor import ExperienceExtractor
-from .japanese_level_extractor import JapaneseLevelExtractor
-from .skills_extractor import SkillsExtractor
-from .work_scope_extractor import WorkScopeExtractor
-from .role_extractor import RoleExtractor
+# 各提取器在首次访问时才导入，只用到部分字段时不加载其余提取器
+_LAZY_EXPORTS = {
+    "NameExtractor": ".name_extractor",
+    "GenderExtractor": ".gender_extractor",
+    "AgeExtractor": ".age_extractor",
+    "BirthdateExtractor": ".birthdate_extractor",
+    "NationalityExtractor": ".nationality_extractor",
+    "ArrivalYearExtractor": ".arrival_year_extractor",
+    "ExperienceExtractor": ".experience_extractor",
+    "JapaneseLevelExtractor": ".japanese_level_extractor",
+    "SkillsExtractor": ".skills_extractor",
+    "WorkScopeExtractor": ".work_scope_extractor",
+    "RoleExtractor": ".role_extractor",
+}
 
-__all__ = [
-    "NameExtractor",
-    "GenderExtractor",
-    "AgeExtractor",
-    "BirthdateExtractor",
-    "NationalityExtractor",
-    "ArrivalYearExtractor",
-    "ExperienceExtractor",
-    "JapaneseLevelExtractor",
-    "SkillsExtractor",
-    "WorkScopeExtractor",
-    "RoleExtractor",
-]
+__all__ = list(_LAZY_EXPORTS)
+
+
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        import importlib
+
+        module = importlib.import_module(_LAZY_EXPORTS[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -4,17 +4,29 @@
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 from collections import defaultdict
-import pandas as pd
-import re
 
 from base.base_extractor import BaseExtractor
+from base.deadline import check_deadline
+from base.sheet_grid import SheetGrid
 from base.constants import KEYWORDS
-from utils.date_utils import convert_excel_serial_to_date, calculate_age_from_birthdate
+from base.patterns import (
+    AGE_NUMBER,
+    AGE_WITH_UNIT,
+    AGE_ROW_PATTERNS,
+    AGE_VALUE_PATTERNS,
+)
+from utils.date_utils import calculate_age_from_birthdate
+from utils.log_utils import get_logger
+
+logger = get_logger(__name__)
 
 
 class AgeExtractor(BaseExtractor):
     """年龄信息提取器 - 修复版"""
 
+    # 只在前30行查找，附近搜索最多向下5行
+    row_horizon = 35
+
     def extract(
         self, all_data: List[Dict[str, Any]], birthdate_result: Optional[str] = None
     ) -> str:
@@ -30,39 +42,45 @@ class AgeExtractor(BaseExtractor):
         candidates = []
 
         for data in all_data:
-            df = data["df"]
+            grid = data["grid"]
             sheet_name = data.get("sheet_name", "Unknown")
 
-            print(f"\n🔍 开始年龄提取 - Sheet: {sheet_name}")
+            logger.debug("\n🔍 开始年龄提取 - Sheet: %s", sheet_name)
 
             # 方法1: 扫描所有Date对象
-            date_candidates = self._extract_from_date_objects(df)
+            date_candidates = self._extract_from_date_objects(grid)
             if date_candidates:
-                print(f"    从日期对象提取到 {len(date_candidates)} 个候选年龄")
+                logger.debug("    从日期对象提取到 %s 个候选年龄", len(date_candidates))
             candidates.extend(date_candidates)
 
             # 方法2: 扫描Excel序列日期数字
-            serial_candidates = self._extract_from_serial_dates(df)
+            serial_candidates = self._extract_from_serial_dates(grid)
             if serial_candidates:
-                print(f"    从序列日期提取到 {len(serial_candidates)} 个候选年龄")
+                logger.debug(
+                    "    从序列日期提取到 %s 个候选年龄", len(serial_candidates)
+                )
             candidates.extend(serial_candidates)
 
             # 方法3: 传统的年龄标签搜索
-            label_candidates = self._extract_from_age_labels(df)
+            label_candidates = self._extract_from_age_labels(grid)
             if label_candidates:
-                print(f"    从年龄标签提取到 {len(label_candidates)} 个候选年龄")
+                logger.debug(
+                    "    从年龄标签提取到 %s 个候选年龄", len(label_candidates)
+                )
             candidates.extend(label_candidates)
 
             # 方法4: 查找跨单元格的年龄信息
-            cross_candidates = self._extract_from_cross_cells(df)
+            cross_candidates = self._extract_from_cross_cells(grid)
             if cross_candidates:
-                print(f"    从跨单元格提取到 {len(cross_candidates)} 个候选年龄")
+                logger.debug(
+                    "    从跨单元格提取到 %s 个候选年龄", len(cross_candidates)
+                )
             candidates.extend(cross_candidates)
 
             # 方法5: 从整行文本中提取
-            row_candidates = self._extract_from_row_text(df)
+            row_candidates = self._extract_from_row_text(grid)
             if row_candidates:
-                print(f"    从行文本提取到 {len(row_candidates)} 个候选年龄")
+                logger.debug("    从行文本提取到 %s 个候选年龄", len(row_candidates))
             candidates.extend(row_candidates)
 
         # 如果找到了直接的年龄信息，使用它
@@ -74,17 +92,19 @@ class AgeExtractor(BaseExtractor):
 
             # 选择置信度最高的年龄
             best_age = max(age_scores.items(), key=lambda x: x[1])
-            print(f"\n✅ 从直接提取获得年龄: {best_age[0]} (置信度: {best_age[1]:.2f})")
+            logger.debug(
+                "\n✅ 从直接提取获得年龄: %s (置信度: %.2f)", best_age[0], best_age[1]
+            )
             return best_age[0]
 
         # 如果没有直接年龄信息，但有生年月日，则计算年龄
         if birthdate_result:
             calculated_age = self._calculate_age_from_birthdate(birthdate_result)
             if calculated_age:
-                print(f"\n✅ 从生年月日计算得到年龄: {calculated_age}")
+                logger.debug("\n✅ 从生年月日计算得到年龄: %s", calculated_age)
                 return calculated_age
 
-        print("\n❌ 未能提取到年龄")
+        logger.debug("\n❌ 未能提取到年龄")
         return ""
 
     def _calculate_age_from_birthdate(self, birthdate_str: str) -> Optional[str]:
@@ -102,44 +122,28 @@ class AgeExtractor(BaseExtractor):
 
             # 验证年龄合理性
             if 15 <= age <= 80:
-                print(f"    计算年龄: {birthdate_str} → {age}岁")
+                logger.debug("    计算年龄: %s → %s岁", birthdate_str, age)
                 return str(age)
             else:
-                print(f"    计算出的年龄不合理: {age}")
+                logger.debug("    计算出的年龄不合理: %s", age)
                 return None
 
         except ValueError as e:
-            print(f"    生年月日格式错误: {e}")
+            logger.debug("    生年月日格式错误: %s", e)
             return None
 
-    def _extract_from_row_text(self, df: pd.DataFrame) -> List[tuple]:
+    def _extract_from_row_text(self, grid: SheetGrid) -> List[tuple]:
         """从整行文本中提取年龄（处理跨单元格的情况）"""
         candidates = []
 
         # 只搜索前30行
-        for row in range(min(30, len(df))):
-            # 将整行合并为文本
-            row_text = ""
-            for col in range(len(df.columns)):
-                cell = df.iloc[row, col]
-                if pd.notna(cell):
-                    row_text += str(cell).strip() + " "
-
+        for row in range(min(30, grid.n_rows)):
+            row_text = grid.row_text(row)
             if not row_text.strip():
                 continue
 
-            # 定义多种年龄模式
-            patterns = [
-                (r"満\s*(\d{1,2})\s*[才歳歲]", 3.5),  # "満 30 才"
-                (r"満\s*(\d{1,2})(?:\s|$)", 3.0),  # "満 30"
-                (r"(\d{1,2})\s*[才歳歲]", 2.5),  # "30 才"
-                (r"年齢[：:]\s*(\d{1,2})", 2.5),  # "年齢：30"
-                (r"年齢\s*(\d{1,2})", 2.0),  # "年齢 30"
-                (r"(?:^|\s)(\d{1,2})(?:\s|$)", 1.0),  # 独立的数字
-            ]
-
-            for pattern, confidence in patterns:
-                matches = re.finditer(pattern, row_text)
+            for pattern, confidence in AGE_ROW_PATTERNS:
+                matches = pattern.finditer(row_text)
                 for match in matches:
                     age_str = match.group(1)
                     age = int(age_str)
@@ -147,8 +151,11 @@ class AgeExtractor(BaseExtractor):
                         # 检查是否有年龄相关上下文
                         if self._has_age_keywords_in_row(row_text) or confidence >= 2.5:
                             candidates.append((str(age), confidence))
-                            print(
-                                f"    行{row}: 在行文本中找到年龄 {age} (模式: {pattern})"
+                            logger.debug(
+                                "    行%s: 在行文本中找到年龄 %s (模式: %s)",
+                                row,
+                                age,
+                                pattern.pattern,
                             )
                             break  # 每行只取第一个匹配
 
@@ -159,80 +166,88 @@ class AgeExtractor(BaseExtractor):
         age_keywords = ["年齢", "年龄", "満", "满", "歳", "才", "歲", "Age", "生年月"]
         return any(keyword in row_text for keyword in age_keywords)
 
-    def _extract_from_cross_cells(self, df: pd.DataFrame) -> List[tuple]:
+    def _extract_from_cross_cells(self, grid: SheetGrid) -> List[tuple]:
         """从跨单元格的年龄信息中提取年龄"""
         candidates = []
 
         # 搜索包含"満"或年龄相关关键词的位置
-        for idx in range(min(30, len(df))):
-            for col in range(len(df.columns)):
-                cell = df.iloc[idx, col]
-                if pd.notna(cell):
-                    cell_str = str(cell).strip()
+        for idx in range(min(30, grid.n_rows)):
+            for col in range(grid.n_cols):
+                if grid.mask[idx][col]:
+                    cell_str = grid.strings[idx][col]
 
                     # 检查是否包含"満"字
                     if "満" in cell_str or "满" in cell_str:
                         # 搜索右侧相邻的单元格
-                        age_found = self._search_age_in_adjacent_cells(df, idx, col)
+                        age_found = self._search_age_in_adjacent_cells(grid, idx, col)
                         if age_found:
                             candidates.append((age_found, 3.0))
-                            print(
-                                f"    行{idx}, 列{col}: 在'満'右侧找到年龄 {age_found}"
+                            logger.debug(
+                                "    行%s, 列%s: 在'満'右侧找到年龄 %s",
+                                idx,
+                                col,
+                                age_found,
                             )
 
                     # 检查是否是纯数字（可能的年龄）
-                    if re.match(r"^\d{1,2}$", cell_str):
+                    if AGE_NUMBER.match(cell_str):
                         age_val = int(cell_str)
                         if 18 <= age_val <= 65:
                             # 检查周围是否有年龄相关上下文
-                            if self._has_age_context_nearby(df, idx, col):
+                            if self._has_age_context_nearby(grid, idx, col):
                                 candidates.append((str(age_val), 2.5))
-                                print(
-                                    f"    行{idx}, 列{col}: 找到独立数字年龄 {age_val}"
+                                logger.debug(
+                                    "    行%s, 列%s: 找到独立数字年龄 %s",
+                                    idx,
+                                    col,
+                                    age_val,
                                 )
 
                     # 检查是否包含年龄关键词
-                    if any(k in cell_str for k in KEYWORDS["age"]):
+                    if grid.keyword_index.has("age", idx, col):
                         # 搜索附近的数字
                         nearby_ages = self._search_numbers_nearby_age_keyword(
-                            df, idx, col
+                            grid, idx, col
                         )
                         if nearby_ages:
                             candidates.extend(nearby_ages)
-                            print(
-                                f"    行{idx}, 列{col}: 在年龄关键词附近找到 {len(nearby_ages)} 个年龄"
+                            logger.debug(
+                                "    行%s, 列%s: 在年龄关键词附近找到 %s 个年龄",
+                                idx,
+                                col,
+                                len(nearby_ages),
                             )
 
         return candidates
 
     def _search_age_in_adjacent_cells(
-        self, df: pd.DataFrame, row: int, col: int
+        self, grid: SheetGrid, row: int, col: int
     ) -> Optional[str]:
         """在相邻单元格中搜索年龄数值"""
+        check_deadline()
         # 搜索右侧的几个单元格
         for c_offset in range(1, 5):  # 扩大搜索范围到右侧5个单元格
             c = col + c_offset
-            if c < len(df.columns):
-                cell = df.iloc[row, c]
-                if pd.notna(cell):
-                    cell_str = str(cell).strip()
+            if c < grid.n_cols:
+                if grid.mask[row][c]:
+                    cell_str = grid.strings[row][c]
 
                     # 检查是否是数字
-                    match = re.match(r"^(\d{1,2})$", cell_str)
+                    match = AGE_NUMBER.match(cell_str)
                     if match:
                         age = int(match.group(1))
                         if 18 <= age <= 65:
                             # 再检查是否有"才"或"歳"在附近
-                            if self._has_age_unit_nearby(df, row, c):
+                            if self._has_age_unit_nearby(grid, row, c):
                                 return str(age)
                             # 即使没有单位，如果左侧有"満"，也认为是年龄
-                            elif col >= 0 and pd.notna(df.iloc[row, col]):
-                                left_cell = str(df.iloc[row, col])
+                            elif col >= 0 and grid.mask[row][col]:
+                                left_cell = grid.strings[row][col]
                                 if "満" in left_cell or "满" in left_cell:
                                     return str(age)
 
                     # 检查是否包含数字和单位
-                    match = re.search(r"(\d{1,2})\s*[歳才歲]", cell_str)
+                    match = AGE_WITH_UNIT.search(cell_str)
                     if match:
                         age = int(match.group(1))
                         if 18 <= age <= 65:
@@ -241,9 +256,10 @@ class AgeExtractor(BaseExtractor):
         return None
 
     def _search_numbers_nearby_age_keyword(
-        self, df: pd.DataFrame, row: int, col: int
+        self, grid: SheetGrid, row: int, col: int
     ) -> List[tuple]:
         """在年龄关键词附近搜索数字"""
+        check_deadline()
         candidates = []
 
         # 扩大搜索范围
@@ -252,13 +268,12 @@ class AgeExtractor(BaseExtractor):
                 r = row + r_offset
                 c = col + c_offset
 
-                if 0 <= r < len(df) and 0 <= c < len(df.columns):
-                    cell = df.iloc[r, c]
-                    if pd.notna(cell):
-                        cell_str = str(cell).strip()
+                if 0 <= r < grid.n_rows and 0 <= c < grid.n_cols:
+                    if grid.mask[r][c]:
+                        cell_str = grid.strings[r][c]
 
                         # 纯数字检查
-                        if re.match(r"^\d{1,2}$", cell_str):
+                        if AGE_NUMBER.match(cell_str):
                             age = int(cell_str)
                             if 18 <= age <= 65:
                                 # 计算距离，越近置信度越高
@@ -268,99 +283,81 @@ class AgeExtractor(BaseExtractor):
 
         return candidates
 
-    def _has_age_unit_nearby(self, df: pd.DataFrame, row: int, col: int) -> bool:
+    def _has_age_unit_nearby(self, grid: SheetGrid, row: int, col: int) -> bool:
         """检查附近是否有年龄单位（才、歳）"""
         age_units = ["才", "歳", "歲"]
 
         # 检查右侧单元格
         for c_offset in range(1, 3):
             c = col + c_offset
-            if c < len(df.columns):
-                cell = df.iloc[row, c]
-                if pd.notna(cell):
-                    if any(unit in str(cell) for unit in age_units):
+            if c < grid.n_cols:
+                if grid.mask[row][c]:
+                    if any(unit in grid.strings[row][c] for unit in age_units):
                         return True
 
         # 检查同一单元格（可能数字和单位在一起）
-        cell = df.iloc[row, col]
-        if pd.notna(cell) and any(unit in str(cell) for unit in age_units):
+        if grid.mask[row][col] and any(
+            unit in grid.strings[row][col] for unit in age_units
+        ):
             return True
 
         return False
 
-    def _has_age_context_nearby(self, df: pd.DataFrame, row: int, col: int) -> bool:
+    def _has_age_context_nearby(self, grid: SheetGrid, row: int, col: int) -> bool:
         """检查附近是否有年龄相关上下文（增强版）"""
         age_keywords = ["生年月", "年齢", "年龄", "歳", "才", "歲", "満", "满", "Age"]
 
         # 检查更大的范围
-        for r_off in range(-3, 4):
-            for c_off in range(-8, 8):
-                r = row + r_off
-                c = col + c_off
-                if 0 <= r < len(df) and 0 <= c < len(df.columns):
-                    context_cell = df.iloc[r, c]
-                    if pd.notna(context_cell):
-                        context_str = str(context_cell)
-                        if any(k in context_str for k in age_keywords):
-                            return True
-
-        return False
+        count = grid.keyword_index.window_count(
+            age_keywords, row - 3, row + 3, col - 8, col + 7
+        )
+        return count > 0
 
-    def _extract_from_date_objects(self, df: pd.DataFrame) -> List[tuple]:
+    def _extract_from_date_objects(self, grid: SheetGrid) -> List[tuple]:
         """从Date对象中提取年龄"""
         candidates = []
 
-        for idx in range(min(30, len(df))):
-            for col in range(len(df.columns)):
-                cell = df.iloc[idx, col]
-                if isinstance(cell, datetime) or isinstance(cell, pd.Timestamp):
-                    if 1950 <= cell.year <= 2010:
-                        age = calculate_age_from_birthdate(cell)
-                        if age:
-                            context_score = self._get_age_context_score(df, idx, col)
-                            confidence = 2.0 + context_score * 0.5
-                            candidates.append((str(age), confidence))
+        for candidate in grid.date_index.select(
+            "datetime", max_row=30, min_year=1950, max_year=2010
+        ):
+            age = calculate_age_from_birthdate(candidate.date)
+            if age:
+                context_score = self._get_age_context_score(
+                    grid, candidate.row, candidate.col
+                )
+                confidence = 2.0 + context_score * 0.5
+                candidates.append((str(age), confidence))
 
         return candidates
 
-    def _extract_from_serial_dates(self, df: pd.DataFrame) -> List[tuple]:
+    def _extract_from_serial_dates(self, grid: SheetGrid) -> List[tuple]:
         """从Excel序列日期中提取年龄"""
         candidates = []
 
-        for idx in range(min(30, len(df))):
-            for col in range(len(df.columns)):
-                cell = df.iloc[idx, col]
-                if pd.notna(cell) and isinstance(cell, (int, float)):
-                    # 检查是否可能是Excel序列日期
-                    if 18000 <= cell <= 50000:
-                        converted_date = convert_excel_serial_to_date(cell)
-                        if converted_date:
-                            age = calculate_age_from_birthdate(converted_date)
-                            if age:
-                                # 检查上下文
-                                if self._has_age_context(df, idx, col):
-                                    candidates.append((str(age), 3.0))
+        # 18000～50000的数字，已按Excel序列日期批量转换
+        for candidate in grid.date_index.select("serial", max_row=30):
+            age = calculate_age_from_birthdate(candidate.date)
+            if age:
+                # 检查上下文
+                if self._has_age_context(grid, candidate.row, candidate.col):
+                    candidates.append((str(age), 3.0))
 
         return candidates
 
-    def _extract_from_age_labels(self, df: pd.DataFrame) -> List[tuple]:
+    def _extract_from_age_labels(self, grid: SheetGrid) -> List[tuple]:
         """从年龄标签附近提取年龄"""
         candidates = []
 
-        for idx in range(min(30, len(df))):
-            for col in range(len(df.columns)):
-                cell = df.iloc[idx, col]
-                if pd.notna(cell):
-                    cell_str = str(cell)
-                    if any(k in cell_str for k in KEYWORDS["age"]):
-                        # 搜索附近的年龄值
-                        nearby_ages = self._search_age_nearby(df, idx, col)
-                        candidates.extend(nearby_ages)
+        for idx, col in grid.keyword_index.cells("age", max_row=30):
+            # 搜索附近的年龄值
+            nearby_ages = self._search_age_nearby(grid, idx, col)
+            candidates.extend(nearby_ages)
 
         return candidates
 
-    def _search_age_nearby(self, df: pd.DataFrame, row: int, col: int) -> List[tuple]:
+    def _search_age_nearby(self, grid: SheetGrid, row: int, col: int) -> List[tuple]:
         """在指定位置附近搜索年龄值"""
+        check_deadline()
         candidates = []
 
         # 扩大搜索范围
@@ -369,17 +366,15 @@ class AgeExtractor(BaseExtractor):
                 r = row + r_offset
                 c = col + c_offset
 
-                if 0 <= r < len(df) and 0 <= c < len(df.columns):
-                    value = df.iloc[r, c]
-                    if pd.notna(value):
-                        if isinstance(value, datetime) or isinstance(
-                            value, pd.Timestamp
-                        ):
+                if 0 <= r < grid.n_rows and 0 <= c < grid.n_cols:
+                    if grid.mask[r][c]:
+                        value = grid.values[r][c]
+                        if isinstance(value, datetime):
                             age = calculate_age_from_birthdate(value)
                             if age:
                                 candidates.append((str(age), 2.5))
                         else:
-                            age = self._parse_age_value(str(value))
+                            age = self._parse_age_value(grid.strings[r][c])
                             if age:
                                 candidates.append((age, 2.0))
 
@@ -394,40 +389,25 @@ class AgeExtractor(BaseExtractor):
             return None
 
         # 多种年龄格式的匹配
-        patterns = [
-            (r"満\s*(\d{1,2})\s*[歳才歲]", 1),  # "満 30 歳"
-            (r"満\s*(\d{1,2})(?:\s|$)", 1),  # "満 30"
-            (r"(\d{1,2})\s*[歳才歲]", 1),  # "30歳"
-            (r"^(\d{1,2})$", 1),  # 纯数字
-        ]
-
-        for pattern, group_idx in patterns:
-            match = re.search(pattern, value)
+        for pattern in AGE_VALUE_PATTERNS:
+            match = pattern.search(value)
             if match:
-                age = int(match.group(group_idx))
+                age = int(match.group(1))
                 if 18 <= age <= 65:
                     return str(age)
 
         return None
 
-    def _has_age_context(self, df: pd.DataFrame, row: int, col: int) -> bool:
+    def _has_age_context(self, grid: SheetGrid, row: int, col: int) -> bool:
         """检查是否有年龄相关的上下文"""
         age_keywords = ["生年月", "年齢", "年龄", "歳", "才", "歲", "満", "满"]
 
-        for r_off in range(-2, 3):
-            for c_off in range(-5, 5):
-                r = row + r_off
-                c = col + c_off
-                if 0 <= r < len(df) and 0 <= c < len(df.columns):
-                    context_cell = df.iloc[r, c]
-                    if pd.notna(context_cell):
-                        context_str = str(context_cell)
-                        if any(k in context_str for k in age_keywords):
-                            return True
-
-        return False
+        count = grid.keyword_index.window_count(
+            age_keywords, row - 2, row + 2, col - 5, col + 4
+        )
+        return count > 0
 
-    def _get_age_context_score(self, df: pd.DataFrame, row: int, col: int) -> float:
+    def _get_age_context_score(self, grid: SheetGrid, row: int, col: int) -> float:
         """获取年龄上下文评分"""
         personal_keywords = (
             KEYWORDS["name"]
@@ -446,4 +426,4 @@ class AgeExtractor(BaseExtractor):
             ]
         )
 
-        return self.get_context_score(df, row, col, personal_keywords)
+        return self.get_context_score(grid, row, col, personal_keywords)
@@ -3,11 +3,52 @@
 
 from typing import List, Dict, Any, Optional
 from datetime import datetime
-import pandas as pd
-import re
 
 from base.base_extractor import BaseExtractor
+from base.deadline import check_deadline
+from base.sheet_grid import SheetGrid
+from base.constants import BIRTHDATE_KEYWORDS
+from base.patterns import (
+    BIRTH_YEAR_NEN,
+    BIRTH_FULL_DATE,
+    BIRTH_NUMERIC_DATE,
+    BIRTH_YEAR_ONLY,
+    MONTH_NUMBER,
+    DAY_NUMBER,
+)
 from utils.date_utils import convert_excel_serial_to_date
+from utils.log_utils import get_logger
+
+logger = get_logger(__name__)
+
+# 文本中的日期格式及解析方式（按顺序取第一个匹配）
+_DATE_TEXT_PATTERNS = [
+    # yyyy年mm月dd日
+    (
+        BIRTH_FULL_DATE,
+        lambda m: {
+            "year": int(m.group(1)),
+            "month": int(m.group(2)),
+            "day": int(m.group(3)),
+            "source": "full_date",
+        },
+    ),
+    # yyyy.mm.dd
+    (
+        BIRTH_NUMERIC_DATE,
+        lambda m: {
+            "year": int(m.group(1)),
+            "month": int(m.group(2)),
+            "day": int(m.group(3)),
+            "source": "numeric_date",
+        },
+    ),
+    # 只有年份
+    (
+        BIRTH_YEAR_ONLY,
+        lambda m: {"year": int(m.group(1)), "source": "year_only"},
+    ),
+]
 
 
 class BirthdateExtractor(BaseExtractor):
@@ -15,75 +56,63 @@ class BirthdateExtractor(BaseExtractor):
 
     def __init__(self):
         super().__init__()
-        self.birthdate_keywords = [
-            "生年月日",
-            "生年月",
-            "生年",
-            "誕生日",
-            "出生日期",
-            "出生年月日",
-            "Birth Date",
-            "Birthday",
-            "DOB",
-            "Date of Birth",
-        ]
+        self.birthdate_keywords = BIRTHDATE_KEYWORDS
 
     def extract(self, all_data: List[Dict[str, Any]]) -> Optional[str]:
         """提取出生年月日"""
         for data in all_data:
-            df = data["df"]
+            grid = data["grid"]
             sheet_name = data.get("sheet_name", "Unknown")
 
-            print(f"\n🔍 开始出生年月日提取 - Sheet: {sheet_name}")
-            print(f"    表格大小: {df.shape[0]}行 x {df.shape[1]}列")
+            logger.debug("\n🔍 开始出生年月日提取 - Sheet: %s", sheet_name)
+            logger.debug("    表格大小: %s行 x %s列", grid.n_rows, grid.n_cols)
 
             # 查找生年月关键字位置
-            keyword_positions = self._find_birthdate_keyword_positions(df)
+            keyword_positions = self._find_birthdate_keyword_positions(grid)
 
             if not keyword_positions:
-                print("    未找到生年月关键字，使用全表扫描")
-                return self._extract_from_full_scan(df)
+                logger.debug("    未找到生年月关键字，使用全表扫描")
+                return self._extract_from_full_scan(grid)
 
-            print(f"    找到 {len(keyword_positions)} 个生年月关键字位置")
+            logger.debug("    找到 %s 个生年月关键字位置", len(keyword_positions))
 
             # 对每个关键字位置进行详细搜索
             for pos in keyword_positions:
-                result = self._extract_from_keyword_position_enhanced(df, pos)
+                result = self._extract_from_keyword_position_enhanced(grid, pos)
                 if result:
                     return result
 
-        print("\n❌ 未能提取到出生年月日")
+        logger.debug("\n❌ 未能提取到出生年月日")
         return None
 
-    def _find_birthdate_keyword_positions(self, df: pd.DataFrame) -> List[Dict]:
+    def _find_birthdate_keyword_positions(self, grid: SheetGrid) -> List[Dict]:
         """查找生年月关键字的位置"""
         positions = []
-
-        for row in range(len(df)):
-            for col in range(len(df.columns)):
-                cell = df.iloc[row, col]
-                if pd.notna(cell):
-                    cell_str = str(cell).strip()
-                    for keyword in self.birthdate_keywords:
-                        if keyword in cell_str:
-                            positions.append(
-                                {
-                                    "row": row,
-                                    "col": col,
-                                    "value": cell_str,
-                                    "keyword": keyword,
-                                }
-                            )
-                            print(f"      发现关键字 '{keyword}' 在: 行{row}, 列{col}")
-                            break
+        index = grid.keyword_index
+
+        for row, col in index.cells("birthdate"):
+            keyword = index.first_keyword("birthdate", row, col)
+            positions.append(
+                {
+                    "row": row,
+                    "col": col,
+                    "value": grid.strings[row][col],
+                    "keyword": keyword,
+                }
+            )
+            logger.debug("      发现关键字 '%s' 在: 行%s, 列%s", keyword, row, col)
         return positions
 
     def _extract_from_keyword_position_enhanced(
-        self, df: pd.DataFrame, pos: Dict
+        self, grid: SheetGrid, pos: Dict
     ) -> Optional[str]:
         """从关键字位置提取出生年月日 - 增强版"""
-        print(
-            f"\n    详细检查位置: 行{pos['row']}, 列{pos['col']}, 内容: '{pos['value']}'"
+        check_deadline()
+        logger.debug(
+            "\n    详细检查位置: 行%s, 列%s, 内容: '%s'",
+            pos["row"],
+            pos["col"],
+            pos["value"],
         )
 
         # 针对劉ZY简历的特殊格式进行搜索
@@ -93,7 +122,7 @@ class BirthdateExtractor(BaseExtractor):
         base_col = pos["col"]
 
         # 详细记录搜索过程
-        print(f"      基准位置: 行{base_row}, 列{base_col}")
+        logger.debug("      基准位置: 行%s, 列%s", base_row, base_col)
 
         # 搜索范围：关键字下方5行，左右各5列
         for row_offset in range(1, 6):  # 下方1-5行
@@ -101,31 +130,38 @@ class BirthdateExtractor(BaseExtractor):
                 search_row = base_row + row_offset
                 search_col = base_col + col_offset
 
-                if 0 <= search_row < len(df) and 0 <= search_col < len(df.columns):
-                    cell = df.iloc[search_row, search_col]
-
-                    if pd.notna(cell):
-                        print(
-                            f"        检查[{search_row},{search_col}]: {repr(cell)} (类型: {type(cell).__name__})"
+                if 0 <= search_row < grid.n_rows and 0 <= search_col < grid.n_cols:
+                    if grid.mask[search_row][search_col]:
+                        cell = grid.values[search_row][search_col]
+                        logger.debug(
+                            "        检查[%s,%s]: %r (类型: %s)",
+                            search_row,
+                            search_col,
+                            cell,
+                            type(cell).__name__,
                         )
 
                         # 提取年份信息
                         year_info = self._extract_year_from_cell_enhanced(cell)
 
                         if year_info:
-                            print(f"        ✓ 找到年份信息: {year_info}")
+                            logger.debug("        ✓ 找到年份信息: %s", year_info)
 
                             # 尝试在附近寻找月份和日期信息
                             complete_date = self._try_build_complete_date(
-                                df, search_row, search_col, year_info
+                                grid, search_row, search_col, year_info
                             )
 
                             if complete_date:
                                 if self._validate_birthdate_relaxed(complete_date):
-                                    print(f"\n✅ 成功提取出生年月日: {complete_date}")
+                                    logger.debug(
+                                        "\n✅ 成功提取出生年月日: %s", complete_date
+                                    )
                                     return complete_date
                                 else:
-                                    print(f"        日期验证失败: {complete_date}")
+                                    logger.debug(
+                                        "        日期验证失败: %s", complete_date
+                                    )
 
         return None
 
@@ -133,7 +169,7 @@ class BirthdateExtractor(BaseExtractor):
         """从单元格提取年份信息 - 增强版"""
         try:
             # 处理日期对象
-            if isinstance(cell, (datetime, pd.Timestamp)):
+            if isinstance(cell, datetime):
                 if 1950 <= cell.year <= 2015:
                     return {
                         "year": cell.year,
@@ -158,7 +194,7 @@ class BirthdateExtractor(BaseExtractor):
             return self._extract_year_from_text_enhanced(cell_str)
 
         except Exception as e:
-            print(f"          提取错误: {e}")
+            logger.debug("          提取错误: %s", e)
             return None
 
     def _extract_year_from_text_enhanced(self, text: str) -> Optional[Dict]:
@@ -166,49 +202,21 @@ class BirthdateExtractor(BaseExtractor):
         text = str(text).strip()
 
         # 模式1: 1994年格式 (针对劉ZY简历)
-        match = re.search(r"(19[5-9]\d|20[0-1]\d)年", text)
+        match = BIRTH_YEAR_NEN.search(text)
         if match:
             year = int(match.group(1))
             return {"year": year, "source": "year_nen"}
 
         # 模式2: 完整日期格式
-        patterns = [
-            # yyyy年mm月dd日
-            (
-                r"(19[5-9]\d|20[0-1]\d)[年/](0?[1-9]|1[0-2])[月/](0?[1-9]|[12]\d|3[01])日?",
-                lambda m: {
-                    "year": int(m.group(1)),
-                    "month": int(m.group(2)),
-                    "day": int(m.group(3)),
-                    "source": "full_date",
-                },
-            ),
-            # yyyy.mm.dd
-            (
-                r"(19[5-9]\d|20[0-1]\d)[\.\-/](0?[1-9]|1[0-2])[\.\-/](0?[1-9]|[12]\d|3[01])",
-                lambda m: {
-                    "year": int(m.group(1)),
-                    "month": int(m.group(2)),
-                    "day": int(m.group(3)),
-                    "source": "numeric_date",
-                },
-            ),
-            # 只有年份
-            (
-                r"\b(19[5-9]\d|20[0-1]\d)\b",
-                lambda m: {"year": int(m.group(1)), "source": "year_only"},
-            ),
-        ]
-
-        for pattern, parser in patterns:
-            match = re.search(pattern, text)
+        for pattern, parser in _DATE_TEXT_PATTERNS:
+            match = pattern.search(text)
             if match:
                 return parser(match)
 
         return None
 
     def _try_build_complete_date(
-        self, df: pd.DataFrame, year_row: int, year_col: int, year_info: Dict
+        self, grid: SheetGrid, year_row: int, year_col: int, year_info: Dict
     ) -> Optional[str]:
         """尝试构建完整的出生日期"""
         year = year_info["year"]
@@ -224,7 +232,9 @@ class BirthdateExtractor(BaseExtractor):
                 pass
 
         # 尝试在附近寻找月份和日期信息
-        print(f"          尝试在年份位置[{year_row},{year_col}]附近寻找月日信息")
+        logger.debug(
+            "          尝试在年份位置[%s,%s]附近寻找月日信息", year_row, year_col
+        )
 
         # 搜索附近3x3区域
         for r_off in range(-1, 3):
@@ -232,23 +242,22 @@ class BirthdateExtractor(BaseExtractor):
                 r = year_row + r_off
                 c = year_col + c_off
 
-                if 0 <= r < len(df) and 0 <= c < len(df.columns):
-                    cell = df.iloc[r, c]
-                    if pd.notna(cell):
-                        cell_str = str(cell).strip()
-                        print(f"            检查附近[{r},{c}]: {repr(cell_str)}")
+                if 0 <= r < grid.n_rows and 0 <= c < grid.n_cols:
+                    if grid.mask[r][c]:
+                        cell_str = grid.strings[r][c]
+                        logger.debug("            检查附近[%s,%s]: %r", r, c, cell_str)
 
                         # 寻找月份信息
-                        month_match = re.search(r"(\d{1,2})月", cell_str)
+                        month_match = MONTH_NUMBER.search(cell_str)
                         if month_match:
                             month = int(month_match.group(1))
-                            print(f"            找到月份: {month}")
+                            logger.debug("            找到月份: %s", month)
 
                         # 寻找日期信息
-                        day_match = re.search(r"(\d{1,2})日", cell_str)
+                        day_match = DAY_NUMBER.search(cell_str)
                         if day_match:
                             day = int(day_match.group(1))
-                            print(f"            找到日期: {day}")
+                            logger.debug("            找到日期: %s", day)
 
         # 构建最终日期
         try:
@@ -260,11 +269,11 @@ class BirthdateExtractor(BaseExtractor):
 
             date_obj = datetime(year, month, day)
             result = date_obj.strftime("%Y-%m-%d")
-            print(f"          构建的日期: {result}")
+            logger.debug("          构建的日期: %s", result)
             return result
 
         except ValueError as e:
-            print(f"          构建日期失败: {e}")
+            logger.debug("          构建日期失败: %s", e)
             # 如果构建失败，使用默认值
             try:
                 date_obj = datetime(year, 1, 1)
@@ -272,36 +281,40 @@ class BirthdateExtractor(BaseExtractor):
             except ValueError:
                 return None
 
-    def _extract_from_full_scan(self, df: pd.DataFrame) -> Optional[str]:
+    def _extract_from_full_scan(self, grid: SheetGrid) -> Optional[str]:
         """全表扫描备用方案"""
-        print("      执行全表扫描...")
+        logger.debug("      执行全表扫描...")
 
         candidates = []
 
-        # 扫描前20行寻找年份
-        for row in range(min(20, len(df))):
-            for col in range(len(df.columns)):
-                cell = df.iloc[row, col]
-                if pd.notna(cell):
-                    year_info = self._extract_year_from_cell_enhanced(cell)
-                    if year_info:
-                        # 简单验证：年份在合理范围内
-                        year = year_info["year"]
-                        if 1950 <= year <= 2010:
-                            # 计算年龄看是否合理
-                            age = 2024 - year
-                            if 15 <= age <= 75:
-                                date_str = f"{year}-01-01"
-                                candidates.append((date_str, age, row, col))
-                                print(
-                                    f"      候选: {date_str} (行{row},列{col}, 年龄{age})"
-                                )
+        # 扫描前20行寻找年份：只有日期候选索引中的单元格可能解析出年份
+        for row, col in grid.date_index.cells(max_row=20):
+            year_info = self._extract_year_from_cell_enhanced(grid.values[row][col])
+            if year_info:
+                # 简单验证：年份在合理范围内
+                year = year_info["year"]
+                if 1950 <= year <= 2010:
+                    # 计算年龄看是否合理
+                    age = 2024 - year
+                    if 15 <= age <= 75:
+                        date_str = f"{year}-01-01"
+                        candidates.append((date_str, age, row, col))
+                        logger.debug(
+                            "      候选: %s (行%s,列%s, 年龄%s)",
+                            date_str,
+                            row,
+                            col,
+                            age,
+                        )
 
         if candidates:
             # 选择年龄最合理的候选（接近30岁的优先）
             best_candidate = min(candidates, key=lambda x: abs(x[1] - 30))
-            print(
-                f"\n✅ 全表扫描选择: {best_candidate[0]} (行{best_candidate[2]},列{best_candidate[3]})"
+            logger.debug(
+                "\n✅ 全表扫描选择: %s (行%s,列%s)",
+                best_candidate[0],
+                best_candidate[2],
+                best_candidate[3],
             )
             return best_candidate[0]
 
@@ -314,22 +327,22 @@ class BirthdateExtractor(BaseExtractor):
 
             # 检查年份范围
             if not (1950 <= date_obj.year <= 2015):
-                print(f"          年份超出范围: {date_obj.year}")
+                logger.debug("          年份超出范围: %s", date_obj.year)
                 return False
 
             # 检查是否是未来日期
             if date_obj > datetime.now():
-                print(f"          未来日期: {date_str}")
+                logger.debug("          未来日期: %s", date_str)
                 return False
 
             # 检查年龄范围（10-80岁）
             age = datetime.now().year - date_obj.year
             if not (10 <= age <= 80):
-                print(f"          年龄超出范围: {age}")
+                logger.debug("          年龄超出范围: %s", age)
                 return False
 
             return True
 
         except ValueError as e:
-            print(f"          日期格式错误: {e}")
+            logger.debug("          日期格式错误: %s", e)
             return False
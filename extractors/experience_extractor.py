@@ -2,17 +2,49 @@
 """经验提取器"""
 
 from typing import List, Dict, Any, Optional
-from datetime import datetime
-import pandas as pd
-import re
 
 from base.base_extractor import BaseExtractor
-from base.constants import KEYWORDS
+from base.deadline import check_deadline
+from base.sheet_grid import SheetGrid
+from base.patterns import (
+    EXPERIENCE_YEAR_MONTH_EXACT,
+    EXPERIENCE_YEARS_EXACT,
+    EXPERIENCE_NUMBER_EXACT,
+    EXPERIENCE_YEAR_MONTH,
+    EXPERIENCE_YEARS,
+)
+
+# 经验值格式及格式化方式（按顺序取第一个有效结果）
+_EXPERIENCE_VALUE_PATTERNS = [
+    (
+        EXPERIENCE_YEAR_MONTH_EXACT,
+        lambda m: f"{m.group(1)}年{m.group(2)}ヶ月",
+    ),
+    (
+        EXPERIENCE_YEARS_EXACT,
+        lambda m: (
+            f"{float(m.group(1)):.0f}年"
+            if float(m.group(1)) == int(float(m.group(1)))
+            else f"{m.group(1)}年"
+        ),
+    ),
+    (
+        EXPERIENCE_NUMBER_EXACT,
+        lambda m: (
+            f"{float(m.group(1)):.0f}年" if 1 <= float(m.group(1)) <= 40 else None
+        ),
+    ),
+    (EXPERIENCE_YEAR_MONTH, lambda m: f"{m.group(1)}年{m.group(2)}ヶ月"),
+    (EXPERIENCE_YEARS, lambda m: f"{m.group(1)}年"),
+]
 
 
 class ExperienceExtractor(BaseExtractor):
     """经验信息提取器"""
 
+    # 经验关键词只在前60行查找，附近搜索最多向下5行
+    row_horizon = 65
+
     def extract(self, all_data: List[Dict[str, Any]]) -> str:
         """提取经验年数
 
@@ -25,13 +57,13 @@ class ExperienceExtractor(BaseExtractor):
         candidates = []
 
         for data in all_data:
-            df = data["df"]
+            grid = data["grid"]
 
             # 方法1: 查找经验关键词
-            candidates.extend(self._extract_from_experience_labels(df))
+            candidates.extend(self._extract_from_experience_labels(grid))
 
             # 方法2: 从项目日期推算经验
-            candidates.extend(self._extract_from_project_dates(df))
+            candidates.extend(self._extract_from_project_dates(grid))
 
         if candidates:
             # 按置信度排序，选择最高的
@@ -41,54 +73,47 @@ class ExperienceExtractor(BaseExtractor):
 
         return ""
 
-    def _extract_from_experience_labels(self, df: pd.DataFrame) -> List[tuple]:
+    def _extract_from_experience_labels(self, grid: SheetGrid) -> List[tuple]:
         """从经验关键词附近提取经验值"""
         candidates = []
 
-        for idx in range(min(60, len(df))):
-            for col in range(len(df.columns)):
-                cell = df.iloc[idx, col]
-                if pd.notna(cell):
-                    cell_str = str(cell)
-                    if any(k in cell_str for k in KEYWORDS["experience"]):
-                        # 排除说明文字
-                        if self._is_explanation_text(cell_str):
-                            continue
-
-                        # 搜索数值
-                        nearby_exp = self._search_experience_value(
-                            df, idx, col, cell_str
-                        )
-                        candidates.extend(nearby_exp)
+        for idx, col in grid.keyword_index.cells("experience", max_row=60):
+            cell_str = grid.strings[idx][col]
+            # 排除说明文字
+            if self._is_explanation_text(cell_str):
+                continue
+
+            # 搜索数值
+            nearby_exp = self._search_experience_value(grid, idx, col, cell_str)
+            candidates.extend(nearby_exp)
 
         return candidates
 
-    def _extract_from_project_dates(self, df: pd.DataFrame) -> List[tuple]:
+    def _extract_from_project_dates(self, grid: SheetGrid) -> List[tuple]:
         """从项目日期推算经验"""
         candidates = []
 
-        for idx in range(min(50, len(df))):
-            for col in range(len(df.columns)):
-                cell = df.iloc[idx, col]
-                if isinstance(cell, datetime):
-                    # 检查是否是项目开始日期
-                    if 2015 <= cell.year <= 2024:
-                        # 检查同行是否有项目描述
-                        if self._has_project_context(df, idx):
-                            # 从最早的项目日期推算经验年数
-                            experience_years = 2024 - cell.year
-                            if 1 <= experience_years <= 15:
-                                # 对于合理的项目经验，给予更高置信度
-                                confidence = 1.5 if experience_years >= 5 else 1.2
-                                exp_str = f"{experience_years}年"
-                                candidates.append((exp_str, confidence))
+        # 项目开始日期：前50行中2015～2024年的日期
+        for candidate in grid.date_index.select(
+            "datetime", max_row=50, min_year=2015, max_year=2024
+        ):
+            # 检查同行是否有项目描述
+            if self._has_project_context(grid, candidate.row):
+                # 从最早的项目日期推算经验年数
+                experience_years = 2024 - candidate.date.year
+                if 1 <= experience_years <= 15:
+                    # 对于合理的项目经验，给予更高置信度
+                    confidence = 1.5 if experience_years >= 5 else 1.2
+                    exp_str = f"{experience_years}年"
+                    candidates.append((exp_str, confidence))
 
         return candidates
 
     def _search_experience_value(
-        self, df: pd.DataFrame, row: int, col: int, cell_str: str
+        self, grid: SheetGrid, row: int, col: int, cell_str: str
     ) -> List[tuple]:
         """搜索经验数值"""
+        check_deadline()
         candidates = []
 
         for r_off in range(-3, 6):
@@ -96,10 +121,9 @@ class ExperienceExtractor(BaseExtractor):
                 r = row + r_off
                 c = col + c_off
 
-                if 0 <= r < len(df) and 0 <= c < len(df.columns):
-                    value = df.iloc[r, c]
-                    if pd.notna(value):
-                        exp = self._parse_experience_value(str(value))
+                if 0 <= r < grid.n_rows and 0 <= c < grid.n_cols:
+                    if grid.mask[r][c]:
+                        exp = self._parse_experience_value(grid.strings[r][c])
                         if exp:
                             confidence = 1.0
 
@@ -126,33 +150,8 @@ class ExperienceExtractor(BaseExtractor):
         # 转换全角数字
         value = value.translate(self.trans_table)
 
-        patterns = [
-            (
-                r"^(\d+)\s*年\s*(\d+)\s*ヶ月$",
-                lambda m: f"{m.group(1)}年{m.group(2)}ヶ月",
-            ),
-            (
-                r"^(\d+(?:\.\d+)?)\s*年$",
-                lambda m: (
-                    f"{float(m.group(1)):.0f}年"
-                    if float(m.group(1)) == int(float(m.group(1)))
-                    else f"{m.group(1)}年"
-                ),
-            ),
-            (
-                r"^(\d+(?:\.\d+)?)\s*$",
-                lambda m: (
-                    f"{float(m.group(1)):.0f}年"
-                    if 1 <= float(m.group(1)) <= 40
-                    else None
-                ),
-            ),
-            (r"(\d+)\s*年\s*(\d+)\s*ヶ月", lambda m: f"{m.group(1)}年{m.group(2)}ヶ月"),
-            (r"(\d+)\s*年", lambda m: f"{m.group(1)}年"),
-        ]
-
-        for pattern, formatter in patterns:
-            match = re.search(pattern, value)
+        for pattern, formatter in _EXPERIENCE_VALUE_PATTERNS:
+            match = pattern.search(value)
             if match:
                 result = formatter(match)
                 if result:
@@ -165,10 +164,9 @@ class ExperienceExtractor(BaseExtractor):
         explanations = ["以上", "未満", "◎", "○", "△", "指導", "精通", "できる"]
         return any(ex in text for ex in explanations)
 
-    def _has_project_context(self, df: pd.DataFrame, row: int) -> bool:
+    def _has_project_context(self, grid: SheetGrid, row: int) -> bool:
         """检查是否有项目上下文"""
-        row_data = df.iloc[row]
-        row_text = " ".join([str(cell) for cell in row_data if pd.notna(cell)])
+        row_text = grid.row_text(row)
 
         project_keywords = ["システム", "開発", "業務", "プロジェクト"]
         return any(keyword in row_text for keyword in project_keywords)
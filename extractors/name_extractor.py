@@ -2,17 +2,23 @@
 """姓名提取器 - 完整修复版：解决距离权重和搜索范围问题"""
 
 from typing import List, Dict, Any
-import pandas as pd
-import re
 
 from base.base_extractor import BaseExtractor
-from base.constants import KEYWORDS
+from base.deadline import check_deadline
+from base.sheet_grid import SheetGrid
+from base.patterns import KANJI, NAME_CHARS
 from utils.validation_utils import is_valid_name
+from utils.log_utils import get_logger
+
+logger = get_logger(__name__)
 
 
 class NameExtractor(BaseExtractor):
     """姓名信息提取器 - 完整修复版"""
 
+    # 姓名关键词只在前10行查找，附近搜索最多向下3行
+    row_horizon = 13
+
     def __init__(self):
         super().__init__()
         # 学历相关关键词，用于避免在学历区域搜索姓名
@@ -68,22 +74,24 @@ class NameExtractor(BaseExtractor):
         candidates = []
 
         for data in all_data:
-            df = data["df"]
+            grid = data["grid"]
             sheet_name = data.get("sheet_name", "Unknown")
 
-            print(f"\n🔍 开始姓名提取 - Sheet: {sheet_name}")
-            print(f"    表格大小: {df.shape[0]}行 x {df.shape[1]}列")
+            logger.debug("\n🔍 开始姓名提取 - Sheet: %s", sheet_name)
+            logger.debug("    表格大小: %s行 x %s列", grid.n_rows, grid.n_cols)
 
             # 方法1: 精确搜索姓名关键词附近（修复距离权重问题）
-            primary_candidates = self._search_name_by_keywords_fixed(df)
+            primary_candidates = self._search_name_by_keywords_fixed(grid)
             if primary_candidates:
-                print(f"    ✅ 通过关键词找到 {len(primary_candidates)} 个候选姓名")
+                logger.debug(
+                    "    ✅ 通过关键词找到 %s 个候选姓名", len(primary_candidates)
+                )
                 candidates.extend(primary_candidates)
 
             # 方法2: 如果主要方法失败，使用备用搜索（限制在前5行）
             if not candidates:
-                print("    使用备用方法：前5行搜索")
-                backup_candidates = self._search_name_in_top_rows(df)
+                logger.debug("    使用备用方法：前5行搜索")
+                backup_candidates = self._search_name_in_top_rows(grid)
                 candidates.extend(backup_candidates)
 
         if candidates:
@@ -92,71 +100,78 @@ class NameExtractor(BaseExtractor):
             for name, confidence in candidates:
                 if is_valid_name(name) and not self._is_relationship_word(name):
                     valid_candidates.append((name, confidence))
-                    print(f"    ✅ 有效候选: '{name}' (置信度: {confidence:.2f})")
+                    logger.debug(
+                        "    ✅ 有效候选: '%s' (置信度: %.2f)", name, confidence
+                    )
                 else:
-                    print(f"    ❌ 过滤候选: '{name}' (验证失败或关系词汇)")
+                    logger.debug("    ❌ 过滤候选: '%s' (验证失败或关系词汇)", name)
 
             if valid_candidates:
                 # 按置信度排序，返回最佳候选
                 valid_candidates.sort(key=lambda x: x[1], reverse=True)
                 best_name = valid_candidates[0][0].strip()
-                print(
-                    f"\n✅ 最终选择姓名: '{best_name}' (置信度: {valid_candidates[0][1]:.2f})"
+                logger.debug(
+                    "\n✅ 最终选择姓名: '%s' (置信度: %.2f)",
+                    best_name,
+                    valid_candidates[0][1],
                 )
                 return best_name
 
-        print("\n❌ 未能提取到姓名")
+        logger.debug("\n❌ 未能提取到姓名")
         return ""
 
-    def _search_name_by_keywords_fixed(self, df: pd.DataFrame) -> List[tuple]:
+    def _search_name_by_keywords_fixed(self, grid: SheetGrid) -> List[tuple]:
         """通过姓名关键词搜索姓名 - 修复版（解决距离权重问题）"""
         candidates = []
 
         # 只搜索前10行，避免在学历等区域搜索
-        for idx in range(min(10, len(df))):
-            for col in range(len(df.columns)):
-                cell = df.iloc[idx, col]
-                if pd.notna(cell) and any(k in str(cell) for k in KEYWORDS["name"]):
-                    print(f"    找到姓名关键词 '{cell}' 在位置 [{idx}, {col}]")
+        for idx, col in grid.keyword_index.cells("name", max_row=10):
+            logger.debug(
+                "    找到姓名关键词 '%s' 在位置 [%s, %s]",
+                grid.strings[idx][col],
+                idx,
+                col,
+            )
 
-                    # 修复后的邻近搜索：分层搜索，强化距离权重
-                    nearby_candidates = self._search_name_nearby_fixed(df, idx, col)
-                    candidates.extend(nearby_candidates)
+            # 修复后的邻近搜索：分层搜索，强化距离权重
+            nearby_candidates = self._search_name_nearby_fixed(grid, idx, col)
+            candidates.extend(nearby_candidates)
 
         return candidates
 
     def _search_name_nearby_fixed(
-        self, df: pd.DataFrame, row: int, col: int
+        self, grid: SheetGrid, row: int, col: int
     ) -> List[tuple]:
         """修复后的邻近搜索 - 分层搜索，强化距离权重"""
         candidates = []
 
-        print(f"    开始分层搜索姓名关键词[{row},{col}]附近的姓名")
+        logger.debug("    开始分层搜索姓名关键词[%s,%s]附近的姓名", row, col)
 
         # 策略1: 优先搜索直接邻近位置（距离1-3）
-        priority_candidates = self._search_immediate_vicinity(df, row, col)
+        priority_candidates = self._search_immediate_vicinity(grid, row, col)
 
         # 策略2: 扩大搜索但强化距离权重（距离4-8）
-        extended_candidates = self._search_extended_area(df, row, col)
+        extended_candidates = self._search_extended_area(grid, row, col)
 
         # 合并候选，优先级候选获得额外权重
         for name, conf in priority_candidates:
             enhanced_conf = conf * 2.0  # 邻近候选获得双倍权重
             candidates.append((name, enhanced_conf))
-            print(
-                f"      🎯 优先候选: '{name}' 置信度{enhanced_conf:.2f} (原{conf:.2f})"
+            logger.debug(
+                "      🎯 优先候选: '%s' 置信度%.2f (原%.2f)", name, enhanced_conf, conf
             )
 
         for name, conf in extended_candidates:
             candidates.append((name, conf))
-            print(f"      📍 扩展候选: '{name}' 置信度{conf:.2f}")
+            logger.debug("      📍 扩展候选: '%s' 置信度%.2f", name, conf)
 
         return candidates
 
     def _search_immediate_vicinity(
-        self, df: pd.DataFrame, row: int, col: int
+        self, grid: SheetGrid, row: int, col: int
     ) -> List[tuple]:
         """搜索直接邻近位置（距离1-3）"""
+        check_deadline()
         candidates = []
 
         # 只搜索非常近的位置
@@ -165,28 +180,31 @@ class NameExtractor(BaseExtractor):
                 r = row + r_offset
                 c = col + c_offset
 
-                if 0 <= r < len(df) and 0 <= c < len(df.columns):
+                if 0 <= r < grid.n_rows and 0 <= c < grid.n_cols:
                     distance = abs(r_offset) + abs(c_offset)
                     if distance <= 3:  # 只考虑距离3以内
-                        value = df.iloc[r, c]
-                        if pd.notna(value):
-                            value_str = str(value).strip()
+                        if grid.mask[r][c]:
+                            value_str = grid.strings[r][c]
 
                             if self._could_be_name(value_str):
                                 confidence = self._calculate_proximity_confidence(
                                     r_offset, c_offset, value_str
                                 )
                                 candidates.append((value_str, confidence))
-                                print(
-                                    f"        📍 近距离候选[{r},{c}]: '{value_str}' 距离{distance} 置信度{confidence:.2f}"
+                                logger.debug(
+                                    "        📍 近距离候选[%s,%s]: '%s' 距离%s 置信度%.2f",
+                                    r,
+                                    c,
+                                    value_str,
+                                    distance,
+                                    confidence,
                                 )
 
         return candidates
 
-    def _search_extended_area(
-        self, df: pd.DataFrame, row: int, col: int
-    ) -> List[tuple]:
+    def _search_extended_area(self, grid: SheetGrid, row: int, col: int) -> List[tuple]:
         """搜索扩展区域（距离4-8）"""
+        check_deadline()
         candidates = []
 
         # 扩大搜索但限制范围（比原来小很多）
@@ -195,20 +213,24 @@ class NameExtractor(BaseExtractor):
                 r = row + r_offset
                 c = col + c_offset
 
-                if 0 <= r < len(df) and 0 <= c < len(df.columns):
+                if 0 <= r < grid.n_rows and 0 <= c < grid.n_cols:
                     distance = abs(r_offset) + abs(c_offset)
                     if 4 <= distance <= 8:  # 只考虑中等距离
-                        value = df.iloc[r, c]
-                        if pd.notna(value):
-                            value_str = str(value).strip()
+                        if grid.mask[r][c]:
+                            value_str = grid.strings[r][c]
 
                             if self._could_be_name(value_str):
                                 confidence = self._calculate_distance_confidence(
                                     r_offset, c_offset, value_str
                                 )
                                 candidates.append((value_str, confidence))
-                                print(
-                                    f"        📍 扩展候选[{r},{c}]: '{value_str}' 距离{distance} 置信度{confidence:.2f}"
+                                logger.debug(
+                                    "        📍 扩展候选[%s,%s]: '%s' 距离%s 置信度%.2f",
+                                    r,
+                                    c,
+                                    value_str,
+                                    distance,
+                                    confidence,
                                 )
 
         return candidates
@@ -237,9 +259,9 @@ class NameExtractor(BaseExtractor):
             confidence *= 1.2  # 降低长度权重影响
         elif len(value) == 1:
             # 单字符中文姓名仍然有效（如"付"）
-            if re.search(r"[一-龥]", value):
+            if KANJI.search(value):
                 confidence *= 1.1  # 略微提升中文单字符
-                print(f"          🈯 单字符中文姓名: '{value}'")
+                logger.debug("          🈯 单字符中文姓名: '%s'", value)
 
         return confidence
 
@@ -278,7 +300,7 @@ class NameExtractor(BaseExtractor):
             return False
 
         # 必须包含文字字符
-        if not re.search(r"[一-龥ぁ-んァ-ンa-zA-Z]", text):
+        if not NAME_CHARS.search(text):
             return False
 
         # 快速排除明显不是姓名的
@@ -329,25 +351,24 @@ class NameExtractor(BaseExtractor):
         """检查是否是关系词汇"""
         return any(word in text for word in self.relationship_keywords)
 
-    def _search_name_in_top_rows(self, df: pd.DataFrame) -> List[tuple]:
+    def _search_name_in_top_rows(self, grid: SheetGrid) -> List[tuple]:
         """在前几行搜索可能的姓名（备用方法）"""
         candidates = []
 
-        print("    🔄 执行备用搜索：前5行×前8列")
+        logger.debug("    🔄 执行备用搜索：前5行×前8列")
 
         # 只搜索前5行，每行的前8列
-        for row in range(min(5, len(df))):
-            for col in range(min(8, len(df.columns))):
-                cell = df.iloc[row, col]
-                if pd.notna(cell):
-                    cell_str = str(cell).strip()
+        for row in range(min(5, grid.n_rows)):
+            for col in range(min(8, grid.n_cols)):
+                if grid.mask[row][col]:
+                    cell_str = grid.strings[row][col]
 
                     # 跳过明显不是姓名的内容
                     if not self._could_be_name(cell_str):
                         continue
 
                     # 跳过学历区域
-                    if self._is_in_education_area(df, row, col):
+                    if self._is_in_education_area(grid, row, col):
                         continue
 
                     if is_valid_name(cell_str) and not self._is_relationship_word(
@@ -363,24 +384,25 @@ class NameExtractor(BaseExtractor):
                         # 长度权重（平衡处理）
                         if len(cell_str.strip()) >= 2:
                             confidence += 0.3
-                        elif len(cell_str.strip()) == 1 and re.search(
-                            r"[一-龥]", cell_str
-                        ):
+                        elif len(cell_str.strip()) == 1 and KANJI.search(cell_str):
                             # 单字符中文姓名也给予合理置信度
                             confidence += 0.2
 
                         candidates.append((cell_str, confidence))
-                        print(
-                            f"    📍 备用候选: '{cell_str}' 行{row}列{col} 置信度{confidence:.2f}"
+                        logger.debug(
+                            "    📍 备用候选: '%s' 行%s列%s 置信度%.2f",
+                            cell_str,
+                            row,
+                            col,
+                            confidence,
                         )
 
         return candidates
 
-    def _is_in_education_area(self, df: pd.DataFrame, row: int, col: int) -> bool:
+    def _is_in_education_area(self, grid: SheetGrid, row: int, col: int) -> bool:
         """检查是否在学历区域"""
-        if 0 <= row < len(df):
-            row_data = df.iloc[row]
-            row_text = " ".join([str(cell) for cell in row_data if pd.notna(cell)])
+        if 0 <= row < grid.n_rows:
+            row_text = grid.row_text(row)
 
             if any(keyword in row_text for keyword in self.education_keywords):
                 return True
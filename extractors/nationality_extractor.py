@@ -3,15 +3,19 @@
 
 from typing import List, Dict, Any, Optional
 from collections import defaultdict
-import pandas as pd
 
 from base.base_extractor import BaseExtractor
-from base.constants import KEYWORDS, VALID_NATIONALITIES
+from base.deadline import check_deadline
+from base.sheet_grid import SheetGrid
+from base.constants import VALID_NATIONALITIES
 
 
 class NationalityExtractor(BaseExtractor):
     """国籍信息提取器"""
 
+    # 国籍值只在前50行查找，上下文最多向下3行
+    row_horizon = 53
+
     def extract(self, all_data: List[Dict[str, Any]]) -> Optional[str]:
         """提取国籍
 
@@ -24,13 +28,13 @@ class NationalityExtractor(BaseExtractor):
         candidates = []
 
         for data in all_data:
-            df = data["df"]
+            grid = data["grid"]
 
             # 方法1: 扫描整个表格的所有国籍关键词
-            candidates.extend(self._scan_for_nationalities(df))
+            candidates.extend(self._scan_for_nationalities(grid))
 
             # 方法2: 查找国籍标签附近的值
-            candidates.extend(self._search_near_labels(df))
+            candidates.extend(self._search_near_labels(grid))
 
         if candidates:
             # 统计每个国籍的总置信度
@@ -44,77 +48,59 @@ class NationalityExtractor(BaseExtractor):
 
         return None
 
-    def _scan_for_nationalities(self, df: pd.DataFrame) -> List[tuple]:
+    def _scan_for_nationalities(self, grid: SheetGrid) -> List[tuple]:
         """扫描整个表格查找国籍"""
         candidates = []
 
-        for idx in range(min(50, len(df))):
-            for col in range(len(df.columns)):
-                cell = df.iloc[idx, col]
-                if pd.notna(cell):
-                    cell_str = str(cell).strip()
+        # 只检查包含国籍名的单元格
+        for idx, col in grid.keyword_index.cells("nationality_values", max_row=50):
+            cell_str = grid.strings[idx][col]
 
-                    # 直接检查是否是国籍值
-                    if cell_str in VALID_NATIONALITIES:
-                        # 计算上下文评分
-                        context_score = self._calculate_context_score(df, idx, col)
-                        total_confidence = max(1.0, context_score)
-                        candidates.append((cell_str, total_confidence))
+            # 直接检查是否是国籍值
+            if cell_str in VALID_NATIONALITIES:
+                # 计算上下文评分
+                context_score = self._calculate_context_score(grid, idx, col)
+                total_confidence = max(1.0, context_score)
+                candidates.append((cell_str, total_confidence))
 
         return candidates
 
-    def _search_near_labels(self, df: pd.DataFrame) -> List[tuple]:
+    def _search_near_labels(self, grid: SheetGrid) -> List[tuple]:
         """在国籍标签附近搜索"""
         candidates = []
 
-        for idx in range(min(40, len(df))):
-            for col in range(len(df.columns)):
-                cell = df.iloc[idx, col]
-                if pd.notna(cell) and any(
-                    k in str(cell) for k in KEYWORDS["nationality"]
-                ):
-                    # 搜索附近的国籍值
-                    for r_off in range(-3, 6):
-                        for c_off in range(-3, 15):
-                            r = idx + r_off
-                            c = col + c_off
-
-                            if 0 <= r < len(df) and 0 <= c < len(df.columns):
-                                value = df.iloc[r, c]
-                                if pd.notna(value):
-                                    value_str = str(value).strip()
-                                    if value_str in VALID_NATIONALITIES:
-                                        confidence = 3.0
-                                        candidates.append((value_str, confidence))
+        for idx, col in grid.keyword_index.cells("nationality", max_row=40):
+            check_deadline()
+            # 搜索附近的国籍值
+            for r_off in range(-3, 6):
+                for c_off in range(-3, 15):
+                    r = idx + r_off
+                    c = col + c_off
+
+                    if 0 <= r < grid.n_rows and 0 <= c < grid.n_cols:
+                        if grid.mask[r][c]:
+                            value_str = grid.strings[r][c]
+                            if value_str in VALID_NATIONALITIES:
+                                confidence = 3.0
+                                candidates.append((value_str, confidence))
 
         return candidates
 
-    def _calculate_context_score(self, df: pd.DataFrame, row: int, col: int) -> float:
+    def _calculate_context_score(self, grid: SheetGrid, row: int, col: int) -> float:
         """计算国籍的上下文评分"""
         context_score = 0
 
         # 检查同行是否有个人信息
-        row_data = df.iloc[row]
-        row_text = " ".join([str(cell) for cell in row_data if pd.notna(cell)])
+        row_text = grid.row_text(row)
 
         personal_keywords = ["氏名", "性別", "年齢", "最寄", "住所", "男", "女"]
         if any(keyword in row_text for keyword in personal_keywords):
             context_score += 2.0
 
         # 检查周围是否有个人信息
-        for r_off in range(-3, 4):
-            for c_off in range(-5, 6):
-                r = row + r_off
-                c = col + c_off
-
-                if 0 <= r < len(df) and 0 <= c < len(df.columns):
-                    nearby_cell = df.iloc[r, c]
-                    if pd.notna(nearby_cell):
-                        nearby_text = str(nearby_cell)
-                        if any(
-                            keyword in nearby_text
-                            for keyword in ["氏名", "性別", "年齢", "学歴"]
-                        ):
-                            context_score += 1.0
+        nearby_count = grid.keyword_index.window_count(
+            ["氏名", "性別", "年齢", "学歴"], row - 3, row + 3, col - 5, col + 5
+        )
+        context_score += 1.0 * nearby_count
 
         return context_score
@@ -1,11 +1,145 @@
 # -*- coding: utf-8 -*-
 """角色（役割）提取器 - 改进版"""
 
-from typing import List, Dict, Any, Set, Optional, Tuple
-import pandas as pd
-import re
+import logging
+from bisect import bisect_left
+from typing import Callable, List, Dict, Any, Set, Optional, Tuple
 
 from base.base_extractor import BaseExtractor
+from base.deadline import check_deadline
+from base.sheet_grid import SheetGrid
+from base.constants import ROLE_KEYWORDS, ROLE_DESIGN_KEYWORDS, ROLE_COLUMN_KEYWORDS
+from base.patterns import (
+    ROLE_MARK_PREFIX,
+    ROLE_TECH_COMBINATION,
+    ROLE_LABEL,
+    ROLE_WORD_PATTERNS,
+)
+from utils.log_utils import get_logger
+
+logger = get_logger(__name__)
+
+# 上下文检查：表示项目内容的关键词
+PROJECT_CONTEXT_KEYWORDS = ["プロジェクト", "開発", "システム", "業務", "担当", "作業"]
+
+
+class _RoleTokenIndex:
+    """单个sheet的角色识别结果
+
+    相同的单元格文本只做一次角色识别（角色、是否为角色说明、是否包含项目相关关键词），
+    角色说明的判定只执行一次，结果同时用于排除角色。
+    按列、按行的位置索引（各列角色数、上下文计数）在第一次被需要时扫描全表建立，
+    只有列标题和表头附近找不到角色时才会用到。
+    """
+
+    def __init__(
+        self,
+        grid: SheetGrid,
+        match_role: Callable[[str], Optional[str]],
+        is_legend: Callable[[str], bool],
+    ):
+        """初始化
+
+        Args:
+            grid: SheetGrid对象
+            match_role: 去掉标记后的非说明文本 -> 角色（RoleExtractor._match_role）
+            is_legend: 去掉标记后的文本是否为角色说明（RoleExtractor._is_role_legend）
+        """
+        self._grid = grid
+        self._match_role = match_role
+        self._is_legend = is_legend
+        # 文本 -> (角色, 是否为角色说明, 是否包含项目相关关键词)
+        self._tokens: Dict[str, Tuple[Optional[str], bool, bool]] = {}
+        self._scanned = False
+
+        # 以下在 _scan 中建立
+        # (row, col) -> 角色（行优先顺序）
+        self._roles: Dict[Tuple[int, int], str] = {}
+        # 列 -> 有角色的行 / 包含项目相关关键词的行（升序）
+        self._role_rows: Dict[int, List[int]] = {}
+        self._project_rows: Dict[int, List[int]] = {}
+        # 角色说明（图例）单元格
+        self._legends: Set[Tuple[int, int]] = set()
+
+    def token(self, text: str) -> Tuple[Optional[str], bool, bool]:
+        """文本的识别结果 (角色, 是否为角色说明, 是否包含项目相关关键词)"""
+        token = self._tokens.get(text)
+        if token is None:
+            stripped = ROLE_MARK_PREFIX.sub("", text).strip()
+            legend = self._is_legend(stripped)
+            token = self._tokens[text] = (
+                None if legend else self._match_role(stripped),
+                legend,
+                any(keyword in text for keyword in PROJECT_CONTEXT_KEYWORDS),
+            )
+        return token
+
+    def role_at(self, row: int, col: int) -> Optional[str]:
+        """单元格中的角色（空单元格为None）"""
+        if not self._grid.mask[row][col]:
+            return None
+        return self.token(self._grid.strings[row][col])[0]
+
+    def _scan(self):
+        """扫描全表建立位置索引"""
+        if self._scanned:
+            return
+        grid = self._grid
+        for row, (row_strings, row_mask) in enumerate(zip(grid.strings, grid.mask)):
+            check_deadline()
+            for col, (cell_str, present) in enumerate(zip(row_strings, row_mask)):
+                if not present:
+                    continue
+                role, legend, project = self.token(cell_str)
+                if role:
+                    self._roles[(row, col)] = role
+                    self._role_rows.setdefault(col, []).append(row)
+                if legend:
+                    self._legends.add((row, col))
+                if project:
+                    self._project_rows.setdefault(col, []).append(row)
+        self._scanned = True
+
+    @property
+    def roles(self) -> Dict[Tuple[int, int], str]:
+        """(row, col) -> 角色（行优先顺序）"""
+        self._scan()
+        return self._roles
+
+    @property
+    def legends(self) -> Set[Tuple[int, int]]:
+        """角色说明（图例）单元格"""
+        self._scan()
+        return self._legends
+
+    def column_counts(self) -> Dict[int, int]:
+        """列 -> 包含角色的单元格数（按列号顺序）"""
+        self._scan()
+        return {col: len(self._role_rows[col]) for col in sorted(self._role_rows)}
+
+    def column_roles(self, col: int, start_row: int, end_row: int) -> Set[str]:
+        """列中 [start_row, end_row) 范围内的角色"""
+        self._scan()
+        rows = self._role_rows.get(col, [])
+        return {
+            self._roles[(row, col)]
+            for row in rows[bisect_left(rows, start_row) : bisect_left(rows, end_row)]
+        }
+
+    @staticmethod
+    def _count(rows: List[int], start_row: int, end_row: int) -> int:
+        """升序行列表中落在 [start_row, end_row) 的个数"""
+        return bisect_left(rows, end_row) - bisect_left(rows, start_row)
+
+    def count_roles(self, col: int, start_row: int, end_row: int) -> int:
+        """列中 [start_row, end_row) 范围内有角色的单元格数"""
+        self._scan()
+        return self._count(self._role_rows.get(col, []), start_row, end_row)
+
+    def count_project_cells(self, col: int, start_row: int, end_row: int) -> int:
+        """列中 [start_row, end_row) 范围内包含项目相关关键词的单元格数"""
+        self._scan()
+        return self._count(self._project_rows.get(col, []), start_row, end_row)
 
 
 class RoleExtractor(BaseExtractor):
@@ -14,20 +148,10 @@ class RoleExtractor(BaseExtractor):
     def __init__(self):
         super().__init__()
         # 工程阶段关键词（用于定位作业范围）
-        self.design_keywords = [
-            "基本設計",
-            "詳細設計",
-            "製造",
-            "単体テスト",
-            "結合テスト",
-            "総合テスト",
-            "運用保守",
-            "要件定義",
-            "作業範囲",
-        ]
+        self.design_keywords = ROLE_DESIGN_KEYWORDS
 
         # 角色关键词
-        self.role_keywords = ["PM", "PL", "SL", "TL", "BSE", "SE", "PG"]
+        self.role_keywords = ROLE_KEYWORDS
 
         # 角色级别映射（数字越大，级别越高）
         self.role_levels = {
@@ -52,16 +176,7 @@ class RoleExtractor(BaseExtractor):
         }
 
         # 角色列标题关键词
-        self.role_column_keywords = [
-            "役割",
-            "役　割",
-            "担当",
-            "ポジション",
-            "Position",
-            "Role",
-            "職種",
-            "職位",
-        ]
+        self.role_column_keywords = ROLE_COLUMN_KEYWORDS
 
     def extract(self, all_data: List[Dict[str, Any]]) -> List[str]:
         """提取角色
@@ -76,126 +191,104 @@ class RoleExtractor(BaseExtractor):
         debug_info = []  # 收集调试信息
 
         for data in all_data:
-            df = data["df"]
+            grid = data["grid"]
             sheet_name = data.get("sheet_name", "Unknown")
 
-            print(f"\n🔍 开始角色提取 - Sheet: {sheet_name}")
-            print(f"    表格大小: {df.shape[0]}行 x {df.shape[1]}列")
+            logger.debug("\n🔍 开始角色提取 - Sheet: %s", sheet_name)
+            logger.debug("    表格大小: %s行 x %s列", grid.n_rows, grid.n_cols)
 
             # 方法1：查找标记为"役割"的列
-            role_columns = self._find_role_columns_by_header(df)
+            role_columns = self._find_role_columns_by_header(grid)
             if role_columns:
-                print(f"    找到 {len(role_columns)} 个角色列（通过标题）")
+                logger.debug("    找到 %s 个角色列（通过标题）", len(role_columns))
                 for col_info in role_columns:
                     roles = self._extract_roles_from_column_range(
-                        df, col_info["col"], col_info["row"] + 1, len(df)
+                        grid, col_info["col"], col_info["row"] + 1, grid.n_rows
                     )
                     if roles:
                         all_roles.update(roles)
-                        print(f"    ✓ 从列{col_info['col']}发现角色: {roles}")
+                        logger.debug("    ✓ 从列%s发现角色: %s", col_info["col"], roles)
                         debug_info.append(
                             f"方法1: 从役割列{col_info['col']}提取到{roles}"
                         )
 
             # 方法2：查找作业范围附近的角色
-            design_positions = self._find_design_positions(df)
+            design_positions = self._find_design_positions(grid)
             if design_positions:
-                print(f"    找到 {len(design_positions)} 个作业范围位置")
+                logger.debug("    找到 %s 个作业范围位置", len(design_positions))
                 for design_pos in design_positions:
                     # 在作业范围同行查找角色
-                    roles = self._extract_roles_from_design_row(df, design_pos)
+                    roles = self._extract_roles_from_design_row(grid, design_pos)
                     if roles:
                         all_roles.update(roles)
-                        print(f"    ✓ 从作业范围行发现角色: {roles}")
+                        logger.debug("    ✓ 从作业范围行发现角色: %s", roles)
                         debug_info.append(
                             f"方法2: 从作业范围行{design_pos['row']}提取到{roles}"
                         )
 
             # 方法3：查找包含多个角色的列
             if len(all_roles) < 2:  # 如果找到的角色太少，使用更激进的方法
-                print("    使用方法3：查找包含角色的列")
-                role_rich_columns = self._find_columns_with_roles(df)
+                logger.debug("    使用方法3：查找包含角色的列")
+                if logger.isEnabledFor(logging.DEBUG):
+                    legends = self._role_tokens(grid).legends
+                    if legends:
+                        logger.debug("    跳过 %s 个角色说明单元格", len(legends))
+                role_rich_columns = self._find_columns_with_roles(grid)
                 for col in role_rich_columns:
-                    roles = self._extract_all_roles_from_column(df, col)
+                    roles = self._extract_all_roles_from_column(grid, col)
                     if roles:
                         all_roles.update(roles)
-                        print(f"    ✓ 从列{col}发现角色: {roles}")
+                        logger.debug("    ✓ 从列%s发现角色: %s", col, roles)
                         debug_info.append(f"方法3: 从列{col}提取到{roles}")
 
             # 方法4：全文搜索（最后的备用方法）
             if not all_roles:
-                print("    使用备用方法：全文搜索")
-                fallback_roles = self._extract_roles_fallback(df)
+                logger.debug("    使用备用方法：全文搜索")
+                fallback_roles = self._extract_roles_fallback(grid)
                 all_roles.update(fallback_roles)
                 if fallback_roles:
                     debug_info.append(f"方法4: 全文搜索提取到{fallback_roles}")
 
         # 打印调试信息汇总
         if debug_info:
-            print("\n📋 角色提取详情:")
+            logger.debug("\n📋 角色提取详情:")
             for info in debug_info:
-                print(f"    - {info}")
+                logger.debug("    - %s", info)
 
         # 按照职位级别排序
         sorted_roles = self._sort_roles_by_level(list(all_roles))
 
-        print(f"\n✅ 最终提取的角色: {sorted_roles}")
+        logger.debug("\n✅ 最终提取的角色: %s", sorted_roles)
         return sorted_roles
 
-    def _find_role_columns_by_header(self, df: pd.DataFrame) -> List[Dict]:
+    def _role_tokens(self, grid: SheetGrid) -> _RoleTokenIndex:
+        """获取sheet的角色识别结果（各方法共用，每个文本只识别一次）"""
+        return grid.cached(
+            "role_tokens",
+            lambda g: _RoleTokenIndex(g, self._match_role, self._is_role_legend),
+        )
+
+    def _find_role_columns_by_header(self, grid: SheetGrid) -> List[Dict]:
         """通过列标题查找角色列"""
-        role_columns = []
-
-        # 扫描前30行查找列标题（增加搜索范围）
-        for row in range(min(30, len(df))):
-            for col in range(len(df.columns)):
-                cell = df.iloc[row, col]
-                if pd.notna(cell):
-                    cell_str = str(cell).strip()
-                    # 检查是否包含角色列标题关键词
-                    if any(
-                        keyword in cell_str for keyword in self.role_column_keywords
-                    ):
-                        # 额外检查：确保不是说明文字
-                        if len(cell_str) < 20:  # 避免长文本误判
-                            role_columns.append(
-                                {"row": row, "col": col, "header": cell_str}
-                            )
-                            print(
-                                f"      发现角色列标题 '{cell_str}' 在: 行{row}, 列{col}"
-                            )
+        # 前30行中的列标题（长文本视为说明文字，已在项目表布局中排除）
+        role_columns = list(grid.project_layout.role_columns)
+        for col_info in role_columns:
+            logger.debug(
+                "      发现角色列标题 '%s' 在: 行%s, 列%s",
+                col_info["header"],
+                col_info["row"],
+                col_info["col"],
+            )
 
         return role_columns
 
-    def _find_design_positions(self, df: pd.DataFrame) -> List[Dict]:
+    def _find_design_positions(self, grid: SheetGrid) -> List[Dict]:
         """查找包含作业范围的位置"""
-        positions = []
-
-        for row in range(len(df)):
-            design_count = 0
-            design_cols = []
-
-            for col in range(len(df.columns)):
-                cell = df.iloc[row, col]
-                if pd.notna(cell):
-                    cell_str = str(cell).strip()
-                    # 检查是否包含工程阶段关键词
-                    for keyword in self.design_keywords:
-                        if keyword in cell_str:
-                            design_count += 1
-                            design_cols.append(col)
-                            break
-
-            # 如果该行包含多个工程阶段关键词，记录该行
-            if design_count >= 3:
-                positions.append(
-                    {"row": row, "design_cols": design_cols, "count": design_count}
-                )
-
-        return positions
+        # 包含多个工程阶段关键词的行（项目表表头）
+        return list(grid.project_layout.header_rows)
 
     def _extract_roles_from_design_row(
-        self, df: pd.DataFrame, design_pos: Dict
+        self, grid: SheetGrid, design_pos: Dict
     ) -> Set[str]:
         """从作业范围行提取角色"""
         roles = set()
@@ -206,43 +299,27 @@ class RoleExtractor(BaseExtractor):
             min(design_pos["design_cols"]) if design_pos["design_cols"] else 0
         )
 
+        tokens = self._role_tokens(grid)
+
         # 检查左侧的列
         for col in range(0, first_design_col):
-            cell = df.iloc[row, col]
-            if pd.notna(cell):
-                cell_str = str(cell).strip()
-                extracted_role = self._extract_role_from_text(cell_str)
-                if extracted_role:
-                    roles.add(extracted_role)
+            extracted_role = tokens.role_at(row, col)
+            if extracted_role:
+                roles.add(extracted_role)
 
         # 检查下方几行的左侧列
-        for row_offset in range(1, min(10, len(df) - row)):
+        for row_offset in range(1, min(10, grid.n_rows - row)):
             for col in range(0, min(5, first_design_col)):  # 只检查最左边的几列
-                cell = df.iloc[row + row_offset, col]
-                if pd.notna(cell):
-                    cell_str = str(cell).strip()
-                    extracted_role = self._extract_role_from_text(cell_str)
-                    if extracted_role:
-                        roles.add(extracted_role)
+                extracted_role = tokens.role_at(row + row_offset, col)
+                if extracted_role:
+                    roles.add(extracted_role)
 
         return roles
 
-    def _find_columns_with_roles(self, df: pd.DataFrame) -> List[int]:
+    def _find_columns_with_roles(self, grid: SheetGrid) -> List[int]:
         """查找包含角色的列"""
-        column_role_counts = {}
-
-        # 统计每列包含的角色数量
-        for col in range(len(df.columns)):
-            role_count = 0
-            for row in range(len(df)):
-                cell = df.iloc[row, col]
-                if pd.notna(cell):
-                    cell_str = str(cell).strip()
-                    if self._extract_role_from_text(cell_str):
-                        role_count += 1
-
-            if role_count > 0:
-                column_role_counts[col] = role_count
+        # 每列包含的角色数量
+        column_role_counts = self._role_tokens(grid).column_counts()
 
         # 返回包含角色的列（按角色数量排序）
         sorted_columns = sorted(
@@ -251,69 +328,57 @@ class RoleExtractor(BaseExtractor):
         return [col for col, count in sorted_columns if count >= 1]
 
     def _extract_roles_from_column_range(
-        self, df: pd.DataFrame, col: int, start_row: int, end_row: int
+        self, grid: SheetGrid, col: int, start_row: int, end_row: int
     ) -> Set[str]:
         """从指定列的指定行范围提取角色"""
+        check_deadline()
+        tokens = self._role_tokens(grid)
         roles = set()
 
-        for row in range(start_row, min(end_row, len(df))):
-            cell = df.iloc[row, col]
-            if pd.notna(cell):
-                cell_str = str(cell).strip()
-                extracted_role = self._extract_role_from_text(cell_str)
-                if extracted_role:
-                    roles.add(extracted_role)
+        for row in range(start_row, min(end_row, grid.n_rows)):
+            extracted_role = tokens.role_at(row, col)
+            if extracted_role:
+                roles.add(extracted_role)
 
         return roles
 
-    def _extract_all_roles_from_column(self, df: pd.DataFrame, col: int) -> Set[str]:
+    def _extract_all_roles_from_column(self, grid: SheetGrid, col: int) -> Set[str]:
         """从整列提取所有角色"""
-        return self._extract_roles_from_column_range(df, col, 0, len(df))
+        return self._role_tokens(grid).column_roles(col, 0, grid.n_rows)
 
     def _extract_role_from_text(self, text: str) -> Optional[str]:
         """从文本中提取角色"""
         # 移除可能的标记符号
-        text = re.sub(r"^[●○◎△×・\-\s]+", "", text).strip()
+        text = ROLE_MARK_PREFIX.sub("", text).strip()
 
         # 排除说明性文字（图例/legend）
         # 如果文本包含多个角色的说明，则不提取
         if self._is_role_legend(text):
             return None
+        return self._match_role(text)
 
+    def _match_role(self, text: str) -> Optional[str]:
+        """从已去掉标记、且不是角色说明的文本中匹配角色"""
         # 排除包含技术术语的情况
         # PL/SQL 是数据库语言，不是角色
         if "PL/SQL" in text.upper() or "PL／SQL" in text:
             return None
 
         # 排除其他可能的技术术语组合
-        tech_combinations = [
-            r"SQL[・\s]*PL",  # SQL・PL
-            r"PL[・\s]*SQL",  # PL・SQL
-            r"\bPL/",  # PL/开头的技术术语
-            r"/PL\b",  # /PL结尾的技术术语
-        ]
-
-        for tech_pattern in tech_combinations:
-            if re.search(tech_pattern, text, re.IGNORECASE):
-                return None
+        # SQL・PL、PL・SQL、PL/xxx、xxx/PL
+        if ROLE_TECH_COMBINATION.search(text):
+            return None
 
         # 特殊检查：如果包含"角色名：说明"格式，不提取
         # 例如 "PL：ﾌﾟﾛｼﾞｪｸﾄﾘｰﾀﾞｰ"
-        if re.search(r"(PM|PL|SL|TL|BSE|SE|PG)[：:]", text):
+        if ROLE_LABEL.search(text):
             return None
 
         # 首先检查精确匹配
         for role in self.role_keywords:
-            patterns = [
-                rf"^{role}$",  # 完全匹配
-                rf"^{role}(?:[^A-Za-z]|$)",  # 以角色开头
-                rf"(?:^|[^A-Za-z]){role}$",  # 以角色结尾
-                rf"(?:^|[^A-Za-z]){role}(?:[^A-Za-z]|$)",  # 独立的角色词
-            ]
-
-            for pattern in patterns:
-                if re.search(pattern, text, re.IGNORECASE):
-                    return role.upper()
+            # 完全匹配、以角色开头/结尾、独立的角色词
+            if ROLE_WORD_PATTERNS[role].search(text):
+                return role.upper()
 
         # 检查全称匹配
         for role, full_names in self.role_full_names.items():
@@ -366,86 +431,65 @@ class RoleExtractor(BaseExtractor):
 
         return False
 
-    def _extract_roles_fallback(self, df: pd.DataFrame) -> Set[str]:
+    def _extract_roles_fallback(self, grid: SheetGrid) -> Set[str]:
         """备用方法：全文搜索角色（更严格的验证）"""
         roles = set()
 
         # 收集可疑的单元格，用于调试
         suspicious_cells = []
 
-        # 将整个DataFrame转换为文本进行搜索
-        for idx in range(len(df)):
-            for col in range(len(df.columns)):
-                cell = df.iloc[idx, col]
-                if pd.notna(cell):
-                    cell_str = str(cell).strip()
-
-                    # 跳过过长的单元格（可能是说明文字）
-                    if len(cell_str) > 50:
-                        continue
-
-                    # 尝试提取角色
-                    extracted_role = self._extract_role_from_text(cell_str)
-                    if extracted_role:
-                        # 额外验证：检查是否在合理的上下文中
-                        if self._is_valid_role_context(df, idx, col):
-                            roles.add(extracted_role)
-                        else:
-                            suspicious_cells.append(
-                                {
-                                    "row": idx,
-                                    "col": col,
-                                    "value": cell_str,
-                                    "role": extracted_role,
-                                }
-                            )
+        # 所有识别出角色的单元格（行优先顺序）
+        for (idx, col), extracted_role in self._role_tokens(grid).roles.items():
+            cell_str = grid.strings[idx][col]
+
+            # 跳过过长的单元格（可能是说明文字）
+            if len(cell_str) > 50:
+                continue
+
+            # 额外验证：检查是否在合理的上下文中
+            if self._is_valid_role_context(grid, idx, col):
+                roles.add(extracted_role)
+            else:
+                suspicious_cells.append(
+                    {"row": idx, "col": col, "value": cell_str, "role": extracted_role}
+                )
 
         # 如果有可疑的提取，打印警告
         if suspicious_cells:
-            print("    ⚠️ 发现可疑的角色提取（已排除）:")
+            logger.debug("    ⚠️ 发现可疑的角色提取（已排除）:")
             for cell in suspicious_cells[:3]:  # 只显示前3个
-                print(
-                    f"      行{cell['row']}, 列{cell['col']}: '{cell['value']}' -> {cell['role']}"
+                logger.debug(
+                    "      行%s, 列%s: '%s' -> %s",
+                    cell["row"],
+                    cell["col"],
+                    cell["value"],
+                    cell["role"],
                 )
 
         return roles
 
-    def _is_valid_role_context(self, df: pd.DataFrame, row: int, col: int) -> bool:
+    def _is_valid_role_context(self, grid: SheetGrid, row: int, col: int) -> bool:
         """检查角色所在的上下文是否合理
 
         Args:
-            df: DataFrame
+            grid: SheetGrid对象
             row: 行索引
             col: 列索引
 
         Returns:
             如果上下文合理返回True
         """
-        # 检查同列是否有其他角色或项目相关内容
-        role_count_in_column = 0
-        project_related_count = 0
-
-        for check_row in range(max(0, row - 10), min(len(df), row + 10)):
-            if check_row != row:
-                cell = df.iloc[check_row, col]
-                if pd.notna(cell):
-                    cell_str = str(cell).strip()
-
-                    # 检查是否有其他角色
-                    if self._extract_role_from_text(cell_str):
-                        role_count_in_column += 1
-
-                    # 检查是否有项目相关内容
-                    project_keywords = [
-                        "プロジェクト",
-                        "開発",
-                        "システム",
-                        "業務",
-                        "担当",
-                        "作業",
-                    ]
-                    if any(keyword in cell_str for keyword in project_keywords):
-                        project_related_count += 1
+        # 检查同列上下10行内（不含自身）是否有其他角色或项目相关内容
+        tokens = self._role_tokens(grid)
+        start_row = max(0, row - 10)
+        end_row = min(grid.n_rows, row + 10)
+        role_count_in_column = tokens.count_roles(col, start_row, end_row)
+        if (row, col) in tokens.roles:
+            role_count_in_column -= 1
+
+        project_related_count = tokens.count_project_cells(col, start_row, end_row)
+        if grid.mask[row][col] and tokens.token(grid.strings[row][col])[2]:
+            project_related_count -= 1
 
         # 如果同列有其他角色或项目相关内容，认为上下文合理
         return role_count_in_column > 0 or project_related_count >= 2
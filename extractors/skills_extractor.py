@@ -1,12 +1,239 @@
 # -*- coding: utf-8 -*-
 """技能提取器"""
 
-from typing import List, Dict, Any, Tuple, Optional
-import pandas as pd
+from bisect import bisect_left
+from typing import Callable, List, Dict, Any, Tuple, Optional
+import logging
+import os
 import re
 
 from base.base_extractor import BaseExtractor
-from base.constants import VALID_SKILLS, SKILL_MARKS, EXCLUDE_PATTERNS
+from base.deadline import check_deadline
+from base.sheet_grid import SheetGrid
+from base.constants import (
+    VALID_SKILLS,
+    SKILL_MARKS,
+    SKILL_DESIGN_KEYWORDS,
+    TECH_COLUMN_KEYWORDS,
+    NO_SPLIT_SKILLS,
+    SKILL_NAME_MAPPING,
+)
+from base.skill_lexicon import (
+    VALID_SKILLS_UPPER,
+    SKILL_NAME_MAPPING_LOWER,
+    VALID_SKILL_MATCHER,
+    VALID_SKILL_LOWER_MATCHER,
+    NO_SPLIT_SKILL_PATTERN,
+    canonical_skill,
+    no_split_skill,
+)
+from base.patterns import (
+    TECH_CONTENT,
+    SKILL_EXCLUDE,
+    SKILL_MARK_PREFIX,
+    SKILL_BRACKET,
+    SKILL_SEPARATORS,
+    SKILL_FALLBACK_PATTERNS,
+    WIN_VERSION,
+    WINDOWS_VERSION,
+    LATIN_LETTER,
+)
+from utils.log_utils import get_logger
+from utils.memo_cache import MemoCache
+
+logger = get_logger(__name__)
+
+# 单元格文本 -> 技能列表的缓存容量（同样的文本在不同简历中反复出现，进程内跨文件共享）
+# 可用环境变量 SKILLS_EXTRACTOR_SKILL_CACHE_SIZE 或 ResumeExtractor(skill_cache_size=...)
+# （批量/服务模式的 --skill-cache-size）调整，0 表示不缓存
+DEFAULT_SKILL_TEXT_CACHE_SIZE = 16384
+SKILL_CACHE_SIZE_ENV = "SKILLS_EXTRACTOR_SKILL_CACHE_SIZE"
+
+
+def _skill_cache_size_from_env() -> int:
+    """从环境变量读取技能缓存容量，值无效时使用默认值"""
+    value = os.environ.get(SKILL_CACHE_SIZE_ENV)
+    if value is None:
+        return DEFAULT_SKILL_TEXT_CACHE_SIZE
+    try:
+        return max(0, int(value))
+    except ValueError:
+        logger.warning(
+            "%s=%r 不是有效的整数，使用默认值 %s",
+            SKILL_CACHE_SIZE_ENV,
+            value,
+            DEFAULT_SKILL_TEXT_CACHE_SIZE,
+        )
+        return DEFAULT_SKILL_TEXT_CACHE_SIZE
+
+
+SKILL_TEXT_CACHE_SIZE = _skill_cache_size_from_env()
+SKILL_TEXT_CACHE = MemoCache(SKILL_TEXT_CACHE_SIZE)
+
+# 包含这些日文关键词的不是技能
+NON_SKILL_JAPANESE_KEYWORDS = (
+    "自己PR",
+    "自己紹介",
+    "志望動機",
+    "アピール",
+    "ポイント",
+    "経歴書",
+    "履歴書",
+    "スキルシート",
+    "職務経歴",
+    "氏名",
+    "性別",
+    "生年月日",
+    "年齢",
+    "住所",
+    "電話",
+    "学歴",
+    "職歴",
+    "資格",
+    "趣味",
+    "特技",
+    "備考",
+)
+
+# 职位标记（不是技能）
+ROLE_MARKS = frozenset(["PM", "PL", "SL", "TL", "BSE", "SE", "PG"])
+
+# 包含英文字母的候选中，带有这些词的是工程/职责描述而不是技能
+NON_SKILL_WORDS = (
+    "設計",
+    "製造",
+    "試験",
+    "テスト",
+    "管理",
+    "経験",
+    "担当",
+    "役割",
+    "フェーズ",
+)
+
+# 技术列标题命中一次的分数（包含技术内容的单元格为1分）
+TECH_HEADER_SCORE = 10
+
+
+def _tech_header_type(cell_str: str) -> Optional[str]:
+    """根据技术列标题判断列类型"""
+    if any(k in cell_str for k in ["言語", "ツール", "プログラミング"]):
+        return "programming"
+    if "DB" in cell_str or "データベース" in cell_str:
+        return "database"
+    if "OS" in cell_str or "機種" in cell_str:
+        return "os"
+    if any(k in cell_str for k in ["Git", "SVN", "バージョン"]):
+        return "version_control"
+    return None
+
+
+class _TechColumnIndex:
+    """单个sheet的技术列评分
+
+    每列只扫描一次，记录技术列标题所在的行和包含技术内容的行（相同文本只判断一次），
+    任意起始行的列评分用二分查找得到。多个工程阶段列向左搜索到同一列时，
+    评分结果和整列提取的技能按 (列, 行范围) 复用。
+    """
+
+    def __init__(
+        self,
+        grid: SheetGrid,
+        contains_tech: Callable[[str], bool],
+        extract_skills: Callable[[str], List[str]],
+    ):
+        """初始化
+
+        Args:
+            grid: SheetGrid对象
+            contains_tech: 单元格文本是否包含技术内容
+            extract_skills: 从单元格文本提取技能
+        """
+        self._grid = grid
+        self._contains_tech = contains_tech
+        self._extract_skills = extract_skills
+        self._tech_text: Dict[str, bool] = {}
+        # 列 -> (标题行, 可识别类型的标题行, 对应的类型, 技术内容行)
+        self._columns: Dict[int, Tuple[List[int], List[int], List[str], List[int]]] = {}
+        # (列, 起始行, 结束行) -> 评分结果
+        self._scores: Dict[Tuple[int, int, int], Optional[Dict]] = {}
+        # (列, 起始行) -> 整列提取的技能
+        self.column_skills: Dict[Tuple[int, int], List[str]] = {}
+
+    def _column(self, col: int):
+        """扫描一列（只在第一次请求该列时执行）"""
+        check_deadline()
+        if col in self._columns:
+            return self._columns[col]
+
+        grid = self._grid
+        index = grid.keyword_index
+        header_rows = []
+        typed_rows = []
+        types = []
+        tech_rows = []
+        for row in range(grid.n_rows):
+            if not grid.mask[row][col]:
+                continue
+            cell_str = grid.strings[row][col]
+            if index.has("tech_column", row, col):
+                header_rows.append(row)
+                column_type = _tech_header_type(cell_str)
+                if column_type:
+                    typed_rows.append(row)
+                    types.append(column_type)
+            tech = self._tech_text.get(cell_str)
+            if tech is None:
+                tech = self._tech_text[cell_str] = self._contains_tech(cell_str)
+            if tech:
+                tech_rows.append(row)
+
+        self._columns[col] = (header_rows, typed_rows, types, tech_rows)
+        return self._columns[col]
+
+    def score(self, col: int, start_row: int, end_row: int) -> Optional[Dict]:
+        """列在 [start_row, end_row) 范围内的技术列评分，分数不足2时返回None"""
+        key = (col, start_row, end_row)
+        if key in self._scores:
+            return self._scores[key]
+
+        header_rows, typed_rows, types, tech_rows = self._column(col)
+        header_lo = bisect_left(header_rows, start_row)
+        header_hi = bisect_left(header_rows, end_row)
+        tech_lo = bisect_left(tech_rows, start_row)
+        tech_hi = bisect_left(tech_rows, end_row)
+
+        tech_score = (header_hi - header_lo) * TECH_HEADER_SCORE + (tech_hi - tech_lo)
+        result = None
+        if tech_score >= 2:
+            # 范围内最后一个可识别类型的标题决定列类型
+            column_type = None
+            typed_hi = bisect_left(typed_rows, end_row)
+            if typed_hi > bisect_left(typed_rows, start_row):
+                column_type = types[typed_hi - 1]
+
+            first_rows = (
+                header_rows[header_lo:header_hi][:1] + tech_rows[tech_lo:tech_hi][:1]
+            )
+
+            # 收集样本技能（按行顺序，每个单元格只取前2个避免太多）
+            sample_skills = []
+            for row in tech_rows[tech_lo:tech_hi]:
+                if len(sample_skills) >= 5:
+                    break
+                extracted = self._extract_skills(self._grid.strings[row][col])
+                sample_skills.extend(extracted[:2])
+
+            result = {
+                "col": col,
+                "start_row": min(first_rows),
+                "score": tech_score,
+                "type": column_type or "general",
+                "sample_skills": sample_skills[:5],  # 保留前5个作为样本
+            }
+
+        self._scores[key] = result
+        return result
 
 
 class SkillsExtractor(BaseExtractor):
@@ -15,62 +242,13 @@ class SkillsExtractor(BaseExtractor):
     def __init__(self):
         super().__init__()
         # 工程阶段关键词（用于定位右侧列）
-        self.design_keywords = [
-            "基本設計",
-            "詳細設計",
-            "製造",
-            "単体テスト",
-            "結合テスト",
-            "総合テスト",
-            "運用保守",
-            "要件定義",
-            "基本设计",
-            "详细设计",
-            # "No.",  # 添加 No. 作为工程阶段标题
-        ]
+        self.design_keywords = SKILL_DESIGN_KEYWORDS
 
         # 技术列标题关键词（用于识别技术列）
-        self.tech_column_keywords = [
-            "言語",
-            "ツール",
-            "技術",
-            "スキル",
-            "DB",
-            "OS",
-            "フレームワーク",
-            "開発環境",
-            "プログラミング",
-            "機種",
-            "Git",
-            "SVN",
-            "バージョン管理",
-        ]
+        self.tech_column_keywords = TECH_COLUMN_KEYWORDS
 
         # 不应该被空格分割的技能（保持完整性）
-        self.no_split_skills = {
-            "VS Code",
-            "Visual Studio",
-            "Android Studio",
-            "IntelliJ IDEA",
-            "SQL Server",
-            "Azure SQL Database",
-            "Azure SQL DB",
-            "React Native",
-            "Node.js",
-            "Vue.js",
-            "React.js",
-            "TeraTerm",
-            "Tera Term",
-            "Win95/98",
-            "Finance and Operations",
-            "Dynamics 365",
-            "AWS Glue",
-            "AWS S3",
-            "AWS Lambda",
-            "AWS EC2",
-            "AWS IAM",
-            "AWS CodeCommit",
-        }
+        self.no_split_skills = NO_SPLIT_SKILLS
 
     def extract(self, all_data: List[Dict[str, Any]]) -> List[str]:
         """提取技能列表
@@ -84,29 +262,31 @@ class SkillsExtractor(BaseExtractor):
         all_skills = []
 
         for data in all_data:
-            df = data["df"]
+            grid = data["grid"]
             sheet_name = data.get("sheet_name", "Unknown")
 
-            print(f"\n🔍 开始技术关键字提取 - Sheet: {sheet_name}")
-            print(f"    表格大小: {df.shape[0]}行 x {df.shape[1]}列")
+            logger.debug("\n🔍 开始技术关键字提取 - Sheet: %s", sheet_name)
+            logger.debug("    表格大小: %s行 x %s列", grid.n_rows, grid.n_cols)
 
             # 主要方法：基于工程阶段列定位技术列
-            skills, design_positions = self._extract_skills_by_design_column(df)
+            skills, design_positions = self._extract_skills_by_design_column(grid)
             if skills:
-                print(f"    ✓ 从技术列提取到 {len(skills)} 个技能")
+                logger.debug("    ✓ 从技术列提取到 %s 个技能", len(skills))
                 all_skills.extend(skills)
 
             # 备用方法：如果主方法失败或提取太少
             if len(all_skills) < 5:
-                print(f"    使用备用方法补充提取")
+                logger.debug("    使用备用方法补充提取")
                 # 方法2：查找合并单元格（限制在设计行下方）
-                merged_skills = self._find_skills_in_merged_cells(df, design_positions)
+                merged_skills = self._find_skills_in_merged_cells(
+                    grid, design_positions
+                )
                 all_skills.extend(merged_skills)
 
                 # 方法3：全文搜索（限制在设计行下方）
                 if len(all_skills) < 5:
                     fallback_skills = self._extract_skills_fallback(
-                        df, design_positions
+                        grid, design_positions
                     )
                     all_skills.extend(fallback_skills)
 
@@ -115,58 +295,54 @@ class SkillsExtractor(BaseExtractor):
         return final_skills
 
     def _extract_skills_by_design_column(
-        self, df: pd.DataFrame
+        self, grid: SheetGrid
     ) -> Tuple[List[str], List[Dict]]:
         """基于工程阶段列定位并提取技术列"""
         skills = []
 
         # Step 1: 找到包含"基本設計"等关键词的列位置
-        design_positions = self._find_design_column_positions(df)
+        design_positions = self._find_design_column_positions(grid)
         if not design_positions:
-            print("    未找到工程阶段列")
+            logger.debug("    未找到工程阶段列")
             return skills, design_positions
 
-        print(f"    找到 {len(design_positions)} 个工程阶段列位置")
+        logger.debug("    找到 %s 个工程阶段列位置", len(design_positions))
 
         # Step 2: 对每个找到的设计列位置，向左查找所有技术列
         for design_pos in design_positions:
             # 找到所有技术列（不是只找一个）
-            tech_columns = self._find_all_tech_columns_left(df, design_pos)
+            tech_columns = self._find_all_tech_columns_left(grid, design_pos)
 
             if tech_columns:
-                print(
-                    f"    从设计列 {design_pos['col']} (行{design_pos['row']}: {design_pos['value']}) 向左找到 {len(tech_columns)} 个技术列"
+                logger.debug(
+                    "    从设计列 %s (行%s: %s) 向左找到 %s 个技术列",
+                    design_pos["col"],
+                    design_pos["row"],
+                    design_pos["value"],
+                    len(tech_columns),
                 )
 
                 # Step 3: 提取每个技术列的内容
                 for tech_column in tech_columns:
-                    print(
-                        f"      提取列 {tech_column['col']} (类型: {tech_column.get('type', '未知')})"
+                    logger.debug(
+                        "      提取列 %s (类型: %s)",
+                        tech_column["col"],
+                        tech_column.get("type", "未知"),
+                    )
+                    column_skills = self._extract_entire_column_skills(
+                        grid, tech_column
                     )
-                    column_skills = self._extract_entire_column_skills(df, tech_column)
                     skills.extend(column_skills)
 
         return skills, design_positions
 
-    def _find_design_column_positions(self, df: pd.DataFrame) -> List[Dict]:
+    def _find_design_column_positions(self, grid: SheetGrid) -> List[Dict]:
         """查找包含工程阶段关键词的列位置"""
-        positions = []
-
-        # 从右向左扫描（优先查找右侧的列）
-        for col in range(len(df.columns) - 1, -1, -1):
-            for row in range(len(df)):  # 搜索整个列
-                cell = df.iloc[row, col]
-                if pd.notna(cell):
-                    cell_str = str(cell).strip()
-                    # 检查是否包含工程阶段关键词
-                    if any(keyword in cell_str for keyword in self.design_keywords):
-                        positions.append({"row": row, "col": col, "value": cell_str})
-                        break  # 该列已找到，继续下一列
-
-        return positions
+        # 每列最上方的工程阶段关键词单元格，从右向左排列（优先查找右侧的列）
+        return list(grid.project_layout.design_columns)
 
     def _find_all_tech_columns_left(
-        self, df: pd.DataFrame, design_pos: Dict
+        self, grid: SheetGrid, design_pos: Dict
     ) -> List[Dict]:
         """从设计列位置向左查找所有技术列"""
         design_row = design_pos["row"]
@@ -175,13 +351,13 @@ class SkillsExtractor(BaseExtractor):
 
         # 定义搜索范围：只在设计行的下方搜索
         search_start_row = design_row  # 从设计行开始
-        search_end_row = len(df)  # 搜索到表格末尾
+        search_end_row = grid.n_rows  # 搜索到表格末尾
 
         # 从设计列向左逐列搜索
         for col in range(design_col - 1, max(-1, design_col - 20), -1):
             # 检查该列是否包含技术内容
             tech_info = self._analyze_column_for_tech(
-                df, col, search_start_row, search_end_row
+                grid, col, search_start_row, search_end_row
             )
 
             if tech_info and tech_info["score"] >= 2:
@@ -190,85 +366,34 @@ class SkillsExtractor(BaseExtractor):
         return tech_columns
 
     def _analyze_column_for_tech(
-        self, df: pd.DataFrame, col: int, start_row: int, end_row: int
+        self, grid: SheetGrid, col: int, start_row: int, end_row: int
     ) -> Optional[Dict]:
-        """分析某一列是否为技术列"""
-        tech_score = 0
-        tech_row_start = None
-        column_type = None
-        sample_skills = []
-
-        for row in range(start_row, end_row):
-            if row >= len(df):
-                break
-
-            cell = df.iloc[row, col]
-            if pd.notna(cell):
-                cell_str = str(cell).strip()
-
-                # 检查列标题
-                if any(keyword in cell_str for keyword in self.tech_column_keywords):
-                    tech_score += 10
-
-                    # 识别列类型
-                    if any(k in cell_str for k in ["言語", "ツール", "プログラミング"]):
-                        column_type = "programming"
-                    elif "DB" in cell_str or "データベース" in cell_str:
-                        column_type = "database"
-                    elif "OS" in cell_str or "機種" in cell_str:
-                        column_type = "os"
-                    elif any(k in cell_str for k in ["Git", "SVN", "バージョン"]):
-                        column_type = "version_control"
-
-                    if tech_row_start is None:
-                        tech_row_start = row
-
-                # 检查是否包含技术内容
-                if self._cell_contains_tech_content(cell_str):
-                    tech_score += 1
-                    if tech_row_start is None:
-                        tech_row_start = row
-
-                    # 收集样本技能
-                    if len(sample_skills) < 5:
-                        extracted = self._extract_skills_from_text(cell_str)
-                        sample_skills.extend(extracted[:2])  # 只取前2个避免太多
-
-        # 如果该列技术分数足够高，返回信息
-        if tech_score >= 2:
-            return {
-                "col": col,
-                "start_row": tech_row_start or start_row,
-                "score": tech_score,
-                "type": column_type or "general",
-                "sample_skills": sample_skills[:5],  # 保留前5个作为样本
-            }
+        """分析某一列是否为技术列
+
+        列标题每个10分，包含技术内容的单元格每个1分，2分以上视为技术列。
+        """
+        return self._tech_columns(grid).score(col, start_row, min(end_row, grid.n_rows))
 
-        return None
+    def _tech_columns(self, grid: SheetGrid) -> _TechColumnIndex:
+        """获取sheet的技术列评分索引"""
+        return grid.cached(
+            "skill_tech_columns",
+            lambda g: _TechColumnIndex(
+                g, self._cell_contains_tech_content, self._extract_skills_from_text
+            ),
+        )
 
     def _cell_contains_tech_content(self, cell_str: str) -> bool:
         """检查单元格是否包含技术内容"""
         # 快速检查常见技术关键词
-        tech_patterns = [
-            r"\b(Java|Python|JavaScript|PHP|Ruby|C\+\+|C#|Go|VB|COBOL)\b",
-            r"\b(Spring|React|Vue|Angular|Django|Rails|Node\.js|\.NET)\b",
-            r"\b(MySQL|PostgreSQL|Oracle|MongoDB|Redis|SQL\s*Server|DB2)\b",
-            r"\b(AWS|Azure|GCP|Docker|Kubernetes)\b",
-            r"\b(Git|SVN|Jenkins|Maven|TortoiseSVN|GitHub)\b",
-            r"\b(Windows|Linux|Unix|Ubuntu|CentOS|win\d+)\b",
-            r"\b(Eclipse|IntelliJ|VS\s*Code|Visual\s*Studio|NetBeans)\b",
-            r"(HTML|CSS|SQL|XML|JSON|TeraTerm)",
-        ]
+        if TECH_CONTENT.search(cell_str):
+            return True
 
         cell_upper = cell_str.upper()
-        for pattern in tech_patterns:
-            if re.search(pattern, cell_str, re.IGNORECASE):
-                return True
 
         # 检查是否包含预定义的有效技能
-        for skill in VALID_SKILLS:
-            if skill.upper() in cell_upper:
-                return True
+        if VALID_SKILL_MATCHER.contains_any(cell_upper):
+            return True
 
         # 特殊情况：单独的"SE"或"PG"不算技能，但在技术列中可能出现
         if cell_str in ["SE", "PG", "PL", "PM"]:
@@ -277,29 +402,36 @@ class SkillsExtractor(BaseExtractor):
         return False
 
     def _extract_entire_column_skills(
-        self, df: pd.DataFrame, tech_column: Dict
+        self, grid: SheetGrid, tech_column: Dict
     ) -> List[str]:
         """提取整个技术列的所有技能"""
-        skills = []
+        check_deadline()
         col = tech_column["col"]
         start_row = tech_column["start_row"]
 
-        print(f"        从行 {start_row} 开始提取")
+        logger.debug("        从行 %s 开始提取", start_row)
+
+        # 多个工程阶段列找到同一技术列时直接复用
+        memo = self._tech_columns(grid).column_skills
+        if (col, start_row) in memo:
+            return list(memo[(col, start_row)])
+
+        skills = []
 
         # 提取该列从start_row开始的所有内容
+        layout = grid.project_layout
         consecutive_empty = 0
-        for row in range(start_row, len(df)):
-            cell = df.iloc[row, col]
-            if pd.notna(cell):
-                cell_str = str(cell).strip()
+        for row in range(start_row, grid.n_rows):
+            if grid.mask[row][col]:
+                cell_str = grid.strings[row][col]
                 consecutive_empty = 0
 
-                # 检查是否到达技能区域结束
-                if self._is_column_end(cell_str):
+                # 检查是否到达技能区域结束（日期开头表示新的项目开始）
+                if layout.is_separator(row, col) or self._is_column_end(cell_str):
                     break
 
                 # 跳过职位标记
-                if cell_str.upper() in ["PM", "PL", "SL", "TL", "BSE", "SE", "PG"]:
+                if cell_str.upper() in ROLE_MARKS:
                     continue
 
                 # 处理多行内容（换行符分隔）
@@ -318,7 +450,8 @@ class SkillsExtractor(BaseExtractor):
                 if consecutive_empty >= 5:
                     break
 
-        return skills
+        memo[(col, start_row)] = skills
+        return list(skills)
 
     def _is_column_end(self, cell_str: str) -> bool:
         """判断是否到达技术列结束"""
@@ -339,14 +472,17 @@ class SkillsExtractor(BaseExtractor):
             "資格",
         ]
 
-        # 日期格式也表示新的项目开始
-        if re.match(r"^\d{4}[年/]\d{1,2}[月/]", cell_str):
-            return True
-
         return any(marker in cell_str for marker in end_markers)
 
     def _extract_skills_from_text(self, text: str) -> List[str]:
-        """从文本中提取技能"""
+        """从文本中提取技能（结果按原始文本缓存，跨文件复用）"""
+        skills = SKILL_TEXT_CACHE.get_or_compute(
+            text, lambda: tuple(self._parse_skills_from_text(text))
+        )
+        return list(skills)
+
+    def _parse_skills_from_text(self, text: str) -> List[str]:
+        """从文本中提取技能（分割、验证和标准化）"""
         skills = []
         text = text.strip()
 
@@ -354,12 +490,11 @@ class SkillsExtractor(BaseExtractor):
             return skills
 
         # 移除标记符号
-        text = re.sub(r"^[◎○△×★●◯▲※・\-\s]+", "", text)
+        text = SKILL_MARK_PREFIX.sub("", text)
 
         # 处理括号内的内容
         # 例如: "Python AWS (glue/S3/Lambda/EC2/IAM/codecommit)"
-        bracket_pattern = r"([^(]+)\s*\(([^)]+)\)"
-        bracket_match = re.match(bracket_pattern, text)
+        bracket_match = SKILL_BRACKET.match(text)
 
         if bracket_match:
             # 括号前的内容
@@ -388,29 +523,30 @@ class SkillsExtractor(BaseExtractor):
         text_stripped = text.strip()
 
         # 检查完整文本是否匹配不可分割技能（不区分大小写）
-        for no_split_skill in self.no_split_skills:
-            if text_stripped.lower() == no_split_skill.lower():
-                if self._is_valid_skill(text_stripped):
-                    normalized = self._normalize_skill_name(text_stripped)
-                    skills.append(normalized)
-                    return skills
+        if no_split_skill(text_stripped) is not None:
+            if self._is_valid_skill(text_stripped):
+                normalized = self._normalize_skill_name(text_stripped)
+                skills.append(normalized)
+                return skills
 
         # 保护不可分割的技能：将它们临时替换为占位符
+        # （一次扫描找出所有不可分割技能，重叠时取最长的）
         protected_skills = {}
-        protected_text = text
-        placeholder_index = 0
-
-        for no_split_skill in self.no_split_skills:
-            # 使用正则表达式进行不区分大小写的匹配
-            pattern = re.compile(re.escape(no_split_skill), re.IGNORECASE)
-            if pattern.search(protected_text):
-                placeholder = f"__SKILL_PLACEHOLDER_{placeholder_index}__"
-                protected_skills[placeholder] = no_split_skill
-                protected_text = pattern.sub(placeholder, protected_text)
-                placeholder_index += 1
+        placeholders = {}
+
+        def protect(match) -> str:
+            skill = no_split_skill(match.group(0)) or match.group(0)
+            placeholder = placeholders.get(skill)
+            if placeholder is None:
+                placeholder = f"__SKILL_PLACEHOLDER_{len(placeholders)}__"
+                placeholders[skill] = placeholder
+                protected_skills[placeholder] = skill
+            return placeholder
+
+        protected_text = NO_SPLIT_SKILL_PATTERN.sub(protect, text)
 
         # 使用多种分隔符分割（但不包括被保护的技能）
-        items = re.split(r"[、,，/／\s\|｜]+", protected_text)
+        items = SKILL_SEPARATORS.split(protected_text)
 
         for item in items:
             item = item.strip()
@@ -438,7 +574,7 @@ class SkillsExtractor(BaseExtractor):
         return skills
 
     def _find_skills_in_merged_cells(
-        self, df: pd.DataFrame, design_positions: List[Dict]
+        self, grid: SheetGrid, design_positions: List[Dict]
     ) -> List[str]:
         """查找合并单元格中的技能（备用方法）"""
         skills = []
@@ -448,11 +584,11 @@ class SkillsExtractor(BaseExtractor):
         if design_positions:
             min_design_row = min(pos["row"] for pos in design_positions)
 
-        for row in range(min_design_row, len(df)):  # 只搜索设计行下方
-            for col in range(len(df.columns)):
-                cell = df.iloc[row, col]
-                if pd.notna(cell) and "\n" in str(cell):
-                    cell_str = str(cell)
+        for row in range(min_design_row, grid.n_rows):  # 只搜索设计行下方
+            check_deadline()
+            for col in range(grid.n_cols):
+                cell_str = grid.strings[row][col]
+                if grid.mask[row][col] and "\n" in cell_str:
                     lines = cell_str.split("\n")
 
                     # 计算包含技能的行数
@@ -470,7 +606,7 @@ class SkillsExtractor(BaseExtractor):
         return skills
 
     def _extract_skills_fallback(
-        self, df: pd.DataFrame, design_positions: List[Dict]
+        self, grid: SheetGrid, design_positions: List[Dict]
     ) -> List[str]:
         """全文搜索技能（最后的备用方法）"""
         skills = []
@@ -480,26 +616,14 @@ class SkillsExtractor(BaseExtractor):
         if design_positions:
             min_design_row = min(pos["row"] for pos in design_positions)
 
-        # 只将设计行下方的内容转换为文本
-        text_parts = []
-        for idx in range(min_design_row, len(df)):
-            row = df.iloc[idx]
-            row_text = " ".join([str(cell) for cell in row if pd.notna(cell)])
-            if row_text.strip():
-                text_parts.append(row_text)
-
-        text = "\n".join(text_parts)
+        # 只使用设计行下方的文本
+        text = grid.row_texts.text_from(min_design_row)
 
+        # 先用自动机找出文本中出现过的技能，只对这些技能做边界检查
+        present = VALID_SKILL_LOWER_MATCHER.find_all(text.lower())
         for skill in VALID_SKILLS:
-            patterns = [
-                rf"\b{re.escape(skill)}\b",
-                rf"(?:^|\s|[、,，/]){re.escape(skill)}(?:$|\s|[、,，/])",
-            ]
-
-            for pattern in patterns:
-                if re.search(pattern, text, re.IGNORECASE):
-                    skills.append(skill)
-                    break
+            if skill.lower() in present and SKILL_FALLBACK_PATTERNS[skill].search(text):
+                skills.append(skill)
 
         return skills
 
@@ -520,71 +644,32 @@ class SkillsExtractor(BaseExtractor):
             return False
 
         # 排除包含日文关键词的非技能内容
-        exclude_japanese_keywords = [
-            "自己PR",
-            "自己紹介",
-            "志望動機",
-            "アピール",
-            "ポイント",
-            "経歴書",
-            "履歴書",
-            "スキルシート",
-            "職務経歴",
-            "氏名",
-            "性別",
-            "生年月日",
-            "年齢",
-            "住所",
-            "電話",
-            "学歴",
-            "職歴",
-            "資格",
-            "趣味",
-            "特技",
-            "備考",
-        ]
-        if any(keyword in skill for keyword in exclude_japanese_keywords):
+        if any(keyword in skill for keyword in NON_SKILL_JAPANESE_KEYWORDS):
             return False
 
         # 排除模式
-        for pattern in EXCLUDE_PATTERNS:
-            if re.match(pattern, skill, re.IGNORECASE):
-                return False
+        if SKILL_EXCLUDE.match(skill):
+            return False
 
         # 特殊情况
         if skill.upper() == "C":
             return True
 
         # 特殊排除：职位标记
-        if skill.upper() in ["PM", "PL", "SL", "TL", "BSE", "SE", "PG"]:
+        if skill.upper() in ROLE_MARKS:
             return False
 
         # 检查预定义技能列表
-        skill_upper = skill.upper()
-        for valid_skill in VALID_SKILLS:
-            if valid_skill.upper() == skill_upper:
-                return True
+        if skill.upper() in VALID_SKILLS_UPPER:
+            return True
 
         # 操作系统模式
-        if re.match(r"^win\d+$", skill_lower) or re.match(
-            r"^Windows\s*\d+$", skill, re.IGNORECASE
-        ):
+        if WIN_VERSION.match(skill_lower) or WINDOWS_VERSION.match(skill):
             return True
 
         # 包含技术关键词
-        if re.search(r"[a-zA-Z]", skill) and len(skill) >= 2:
-            exclude_words = [
-                "設計",
-                "製造",
-                "試験",
-                "テスト",
-                "管理",
-                "経験",
-                "担当",
-                "役割",
-                "フェーズ",
-            ]
-            if not any(word in skill for word in exclude_words):
+        if LATIN_LETTER.search(skill) and len(skill) >= 2:
+            if not any(word in skill for word in NON_SKILL_WORDS):
                 return True
 
         return False
@@ -613,110 +698,17 @@ class SkillsExtractor(BaseExtractor):
         if "linux" in skill.lower():
             return "Linux"
 
-        # 技能名称映射
-        skill_mapping = {
-            # 编程语言
-            "JAVA": "Java",
-            "java": "Java",
-            "Javascript": "JavaScript",
-            "javascript": "JavaScript",
-            "JAVASCRIPT": "JavaScript",
-            "typescript": "TypeScript",
-            "TYPESCRIPT": "TypeScript",
-            "python": "Python",
-            "PYTHON": "Python",
-            # 数据库
-            "MySql": "MySQL",
-            "mysql": "MySQL",
-            "mybatis": "MyBatis",
-            "Mybatis": "MyBatis",
-            "MYBATIS": "MyBatis",
-            "PostgreSQL": "PostgreSQL",
-            "Postgre SQL": "PostgreSQL",
-            "SqlServer": "SQL Server",
-            "SQLServer": "SQL Server",
-            "sqlserver": "SQL Server",
-            "SQL SERVER": "SQL Server",
-            # 框架
-            "spring": "Spring",
-            "springboot": "SpringBoot",
-            "SpringBoot": "SpringBoot",
-            "node.js": "Node.js",
-            "Node.JS": "Node.js",
-            "nodejs": "Node.js",
-            "vue.js": "Vue",
-            "react.js": "React",
-            "thymeleaf": "Thymeleaf",
-            # IDE和工具
-            "eclipse": "Eclipse",
-            "eclipes": "Eclipse",  # 常见拼写错误
-            "ECLIPSE": "Eclipse",
-            "vscode": "VS Code",
-            "Vscode": "VS Code",
-            "VSCode": "VS Code",
-            "VScode": "VS Code",
-            "VS Code": "VS Code",
-            "VS code": "VS Code",
-            "vs code": "VS Code",
-            "Visual Studio Code": "VS Code",
-            "junit": "JUnit",
-            "Junit": "JUnit",
-            "JUNIT": "JUnit",
-            "github": "GitHub",
-            "GITHUB": "GitHub",
-            "svn": "SVN",
-            "Svn": "SVN",
-            "TortoiseSVN": "TortoiseSVN",
-            "Tortoise SVN": "TortoiseSVN",
-            "winmerge": "WinMerge",
-            "WINMERGE": "WinMerge",
-            "teraterm": "TeraTerm",
-            "TERATERM": "TeraTerm",
-            "Tera Term": "TeraTerm",
-            # 协作工具
-            "slack": "Slack",
-            "SLACK": "Slack",
-            "teams": "Teams",
-            "TEAMS": "Teams",
-            "ovice": "oVice",
-            "Ovice": "oVice",
-            # 云服务
-            "aws": "AWS",
-            "Aws": "AWS",
-            "azure": "Azure",
-            "AZURE": "Azure",
-            "Azure SQL DB": "Azure SQL Database",
-            # AWS服务标准化
-            "glue": "AWS Glue",
-            "S3": "AWS S3",
-            "Lambda": "AWS Lambda",
-            "EC2": "AWS EC2",
-            "IAM": "AWS IAM",
-            "codecommit": "AWS CodeCommit",
-            # 其他
-            "dynamics365": "Dynamics 365",
-            "Dynamics365": "Dynamics 365",
-            "FO": "Finance and Operations",
-            "JP1": "JP1",
-            "jp1": "JP1",
-        }
-
         # 检查映射
-        if skill in skill_mapping:
-            return skill_mapping[skill]
+        if skill in SKILL_NAME_MAPPING:
+            return SKILL_NAME_MAPPING[skill]
 
         # 大小写不敏感查找
         skill_lower = skill.lower()
-        for k, v in skill_mapping.items():
-            if k.lower() == skill_lower:
-                return v
+        if skill_lower in SKILL_NAME_MAPPING_LOWER:
+            return SKILL_NAME_MAPPING_LOWER[skill_lower]
 
         # 检查有效技能列表
-        for valid_skill in VALID_SKILLS:
-            if valid_skill.lower() == skill_lower:
-                return valid_skill
-
-        return skill
+        return canonical_skill(skill) or skill
 
     def _process_and_deduplicate_skills(self, skills: List[str]) -> List[str]:
         """处理和去重技能列表"""
@@ -736,17 +728,8 @@ class SkillsExtractor(BaseExtractor):
                 final_skills.append(normalized)
 
         # 保持原始顺序，不进行排序
-        print(f"    最终提取技能数量: {len(final_skills)}")
-        if final_skills:
-            print(f"    前10个技能: {', '.join(final_skills[:10])}")
+        logger.debug("    最终提取技能数量: %s", len(final_skills))
+        if final_skills and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("    前10个技能: %s", ", ".join(final_skills[:10]))
 
         return final_skills
-
-    def _dataframe_to_text(self, df: pd.DataFrame) -> str:
-        """将DataFrame转换为文本"""
-        text_parts = []
-        for idx, row in df.iterrows():
-            row_text = " ".join([str(cell) for cell in row if pd.notna(cell)])
-            if row_text.strip():
-                text_parts.append(row_text)
-        return "\n".join(text_parts)
@@ -1,11 +1,66 @@
 # -*- coding: utf-8 -*-
 """作业范围提取器"""
 
-from typing import List, Dict, Any, Set
-import pandas as pd
-import re
+from typing import List, Dict, Any, Sequence, Set
 
 from base.base_extractor import BaseExtractor
+from base.deadline import check_deadline
+from base.sheet_grid import SheetGrid
+from base.constants import WORK_SCOPE_DESIGN_KEYWORDS
+from utils.log_utils import get_logger
+
+logger = get_logger(__name__)
+
+# 从工程阶段关键词向下搜索作业标记的最大行数
+MARK_SEARCH_ROWS = 999
+
+
+class _ColumnMarkIndex:
+    """工程阶段列的"下一个"位置数组
+
+    对每个包含工程阶段关键词的列，预先计算从每一行开始向下
+    第一个作业标记、第一个工程阶段关键词、第一个项目分隔单元格所在的行
+    （不存在时为行数），向下搜索时不再逐格检查。
+    """
+
+    def __init__(self, grid: SheetGrid, columns: Sequence[int], marks: Sequence[str]):
+        """构建数组
+
+        Args:
+            grid: SheetGrid对象
+            columns: 需要计算的列
+            marks: 作业标记符号
+        """
+        index = grid.keyword_index
+        layout = grid.project_layout
+        n_rows = grid.n_rows
+
+        # 列 -> 长度为 n_rows + 1 的数组，下标 n_rows 为哨兵
+        self.next_mark: Dict[int, List[int]] = {}
+        self.next_design: Dict[int, List[int]] = {}
+        self.next_separator: Dict[int, List[int]] = {}
+
+        for col in columns:
+            check_deadline()
+            next_mark = [n_rows] * (n_rows + 1)
+            next_design = [n_rows] * (n_rows + 1)
+            next_separator = [n_rows] * (n_rows + 1)
+            for row in range(n_rows - 1, -1, -1):
+                next_mark[row] = next_mark[row + 1]
+                next_design[row] = next_design[row + 1]
+                next_separator[row] = next_separator[row + 1]
+                if not grid.mask[row][col]:
+                    continue
+                cell_str = grid.strings[row][col]
+                if any(mark in cell_str for mark in marks):
+                    next_mark[row] = row
+                if index.has("work_scope_design", row, col):
+                    next_design[row] = row
+                if layout.is_separator(row, col):
+                    next_separator[row] = row
+            self.next_mark[col] = next_mark
+            self.next_design[col] = next_design
+            self.next_separator[col] = next_separator
 
 
 class WorkScopeExtractor(BaseExtractor):
@@ -14,25 +69,7 @@ class WorkScopeExtractor(BaseExtractor):
     def __init__(self):
         super().__init__()
         # 工程阶段关键词
-        self.design_keywords = [
-            "基本設計",
-            "詳細設計",
-            "製造",
-            "単体テスト",
-            "結合テスト",
-            "総合テスト",
-            "運用保守",
-            "要件定義",
-            "基本设计",
-            "详细设计",
-            "単体試験",
-            "結合試験",
-            "総合試験",
-            "運用",
-            "保守",
-            "要件",
-            "定義",
-        ]
+        self.design_keywords = WORK_SCOPE_DESIGN_KEYWORDS
 
         # 作业标记符号
         self.work_marks = ["●", "◯", "○", "◎"]
@@ -62,89 +99,77 @@ class WorkScopeExtractor(BaseExtractor):
         all_scopes = set()
 
         for data in all_data:
-            df = data["df"]
+            grid = data["grid"]
             sheet_name = data.get("sheet_name", "Unknown")
 
-            print(f"\n🔍 开始作业范围提取 - Sheet: {sheet_name}")
-            print(f"    表格大小: {df.shape[0]}行 x {df.shape[1]}列")
+            logger.debug("\n🔍 开始作业范围提取 - Sheet: %s", sheet_name)
+            logger.debug("    表格大小: %s行 x %s列", grid.n_rows, grid.n_cols)
 
             # 查找包含工程阶段关键词的位置
-            design_positions = self._find_design_positions(df)
+            design_positions = self._find_design_positions(grid)
 
             if design_positions:
-                print(f"    找到 {len(design_positions)} 个工程阶段位置")
+                logger.debug("    找到 %s 个工程阶段位置", len(design_positions))
 
                 # 对每个位置检查是否有作业标记
                 for pos in design_positions:
-                    scope = self._check_work_mark_in_column(df, pos)
+                    scope = self._check_work_mark_in_column(grid, pos)
                     if scope:
                         normalized_scope = self._normalize_scope(scope)
                         all_scopes.add(normalized_scope)
-                        print(f"    ✓ 发现作业范围: {normalized_scope}")
+                        logger.debug("    ✓ 发现作业范围: %s", normalized_scope)
             else:
-                print("    未找到工程阶段列")
+                logger.debug("    未找到工程阶段列")
 
         # 转换为列表并排序（按照预定义的顺序）
         final_scopes = self._sort_scopes(list(all_scopes))
 
-        print(f"\n✅ 最终提取的作业范围: {final_scopes}")
+        logger.debug("\n✅ 最终提取的作业范围: %s", final_scopes)
         return final_scopes
 
-    def _find_design_positions(self, df: pd.DataFrame) -> List[Dict]:
+    def _find_design_positions(self, grid: SheetGrid) -> List[Dict]:
         """查找包含工程阶段关键词的位置"""
-        positions = []
-
-        # 遍历整个表格查找关键词
-        for row in range(len(df)):
-            for col in range(len(df.columns)):
-                cell = df.iloc[row, col]
-                if pd.notna(cell):
-                    cell_str = str(cell).strip()
-
-                    # 检查是否包含工程阶段关键词
-                    for keyword in self.design_keywords:
-                        if keyword in cell_str:
-                            # 记录位置和具体的关键词
-                            positions.append(
-                                {
-                                    "row": row,
-                                    "col": col,
-                                    "value": cell_str,
-                                    "keyword": keyword,
-                                }
-                            )
-                            break
-
-        return positions
-
-    def _check_work_mark_in_column(self, df: pd.DataFrame, position: Dict) -> str:
-        """检查该列下方是否有作业标记"""
+        # 位置和具体的关键词在项目表布局中已经记录
+        return list(grid.project_layout.scope_positions)
+
+    def _check_work_mark_in_column(self, grid: SheetGrid, position: Dict) -> str:
+        """检查该列下方是否有作业标记
+
+        向下搜索（最多999行）第一个作业标记，在此之前遇到其他工程阶段关键词
+        或项目分隔（日期格式等）时停止。同一单元格中作业标记优先。
+        """
         row = position["row"]
         col = position["col"]
         keyword = position["keyword"]
 
-        # 搜索该列下方的内容（最多搜索999行）
-        search_limit = min(row + 999, len(df))
-
-        for check_row in range(row + 1, search_limit):
-            cell = df.iloc[check_row, col]
-            if pd.notna(cell):
-                cell_str = str(cell).strip()
-
-                # 检查是否包含作业标记
-                if any(mark in cell_str for mark in self.work_marks):
-                    # 返回原始的工程阶段关键词
-                    return keyword
-
-                # 如果遇到其他工程阶段关键词，停止搜索
-                if any(k in cell_str for k in self.design_keywords if k != keyword):
-                    break
-
-                # 如果遇到明显的项目分隔（日期格式等），停止搜索
-                if re.match(r"^\d{4}[年/]\d{1,2}[月/]", cell_str):
-                    break
-
-        return ""
+        columns = grid.cached(
+            "work_scope_marks",
+            lambda g: _ColumnMarkIndex(
+                g,
+                sorted({pos["col"] for pos in g.project_layout.scope_positions}),
+                self.work_marks,
+            ),
+        )
+
+        search_limit = min(row + MARK_SEARCH_ROWS, grid.n_rows)
+        mark_row = columns.next_mark[col][row + 1]
+        if mark_row >= search_limit:
+            return ""
+
+        # 作业标记之前出现项目分隔
+        if columns.next_separator[col][row + 1] < mark_row:
+            return ""
+
+        # 作业标记之前出现其他工程阶段关键词（与自身相同的关键词不算）
+        index = grid.keyword_index
+        design_row = columns.next_design[col][row + 1]
+        while design_row < mark_row:
+            if index.keywords_at("work_scope_design", design_row, col) - {keyword}:
+                return ""
+            design_row = columns.next_design[col][design_row + 1]
+
+        # 返回原始的工程阶段关键词
+        return keyword
 
     def _normalize_scope(self, scope: str) -> str:
         """标准化作业范围名称"""
@@ -5,6 +5,7 @@ import json
 import sys
 from pathlib import Path
 from extractor import ResumeExtractor
+from utils.log_utils import configure_logging
 
 
 def format_value(value):
@@ -23,10 +24,63 @@ def format_value(value):
 def main():
     """主函数"""
     if len(sys.argv) < 2:
-        print("用法: python main.py <Excel文件路径>")
+        print(
+            "用法: python main.py [-q|-v] [--timings] [--no-triage] [--profile 目录] "
+            "<Excel文件路径>"
+        )
+        print(
+            "      python main.py batch <文件|目录|glob>... [-j 进程数] [-f 文件列表]"
+        )
+        print("      python main.py serve [--port 端口] [--stdio] [-j 进程数]")
         sys.exit(1)
 
-    file_path = sys.argv[1]
+    # 批量模式：python main.py batch ...
+    if sys.argv[1] == "batch":
+        import batch
+
+        sys.exit(batch.main(sys.argv[2:]))
+
+    # 服务模式：python main.py serve ...
+    if sys.argv[1] == "serve":
+        import server
+
+        sys.exit(server.main(sys.argv[2:]))
+
+    # 缓存管理：python main.py cache ...
+    if sys.argv[1] == "cache":
+        from utils import result_cache
+
+        sys.exit(result_cache.main(sys.argv[2:]))
+
+    # -q 只输出结果，-v 输出各提取器的诊断信息
+    args = sys.argv[1:]
+    quiet = "-q" in args or "--quiet" in args
+    verbose = "-v" in args or "--verbose" in args
+    # --timings 在结果中附加各阶段耗时，--profile 目录 输出cProfile分析结果
+    timings = "--timings" in args
+    # --no-triage 不跳过任何sheet
+    triage = "--no-triage" not in args
+    profile_dir = None
+    if "--profile" in args:
+        index = args.index("--profile")
+        if index + 1 >= len(args):
+            print("--profile 需要指定输出目录")
+            sys.exit(1)
+        profile_dir = args.pop(index + 1)
+        args.pop(index)
+    args = [
+        arg
+        for arg in args
+        if arg not in ("-q", "--quiet", "-v", "--verbose", "--timings", "--no-triage")
+    ]
+    if not args:
+        print(
+            "用法: python main.py [-q|-v] [--timings] [--no-triage] [--profile 目录] "
+            "<Excel文件路径>"
+        )
+        sys.exit(1)
+
+    file_path = args[0]
     file_path_obj = Path(file_path)
 
     if not file_path_obj.exists():
@@ -40,11 +94,13 @@ def main():
         sys.exit(1)
 
     # 创建提取器实例
-    extractor = ResumeExtractor()
+    configure_logging(quiet=quiet, verbose=verbose)
+    extractor = ResumeExtractor(timings=timings, profile_dir=profile_dir, triage=triage)
 
     # 提取信息
-    print(f"正在处理文件: {file_path}")
-    print(f"文件格式: {file_path_obj.suffix}")
+    if not quiet:
+        print(f"正在处理文件: {file_path}")
+        print(f"文件格式: {file_path_obj.suffix}")
 
     result = extractor.extract_from_excel(file_path)
 
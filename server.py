@@ -0,0 +1,498 @@
+# -*- coding: utf-8 -*-
+"""提取服务 - 常驻的工作进程池，每个进程持有已初始化的提取器
+
+每次执行 python main.py 都要重新导入pandas/openpyxl/xlrd并创建全部提取器，
+小文件的提取本身反而比这些准备工作快。服务模式下工作进程启动时完成这些准备，
+之后的请求直接提取。
+
+两种接口：
+- HTTP（默认，只监听本机）:
+    POST /extract
+        Content-Type: application/json  {"path": "..."} 或
+                                        {"content": base64内容, "filename": "x.xlsx"}
+        其他Content-Type: 请求体为文件内容，?filename=x.xlsx 指定扩展名
+    GET /health  进程数和队列状态
+- --stdio: 从标准输入逐行读取JSON-RPC 2.0请求，结果逐行输出到标准输出
+    {"jsonrpc": "2.0", "id": 1, "method": "extract", "params": {"path": "..."}}
+    方法: extract（参数同HTTP的JSON请求体）、health
+
+返回的结果与批量模式的JSON行相同：{"file", "ok", "elapsed_ms", "result" 或 "error"}。
+正在处理和排队的请求总数超过 进程数+队列长度 时，新请求立即被拒绝（HTTP 503）。
+
+用法: python main.py serve [--host 127.0.0.1] [--port 8765] [-j 进程数]
+      [--queue-size N] [--stdio] [--loader pandas|native|streaming]
+"""
+
+import argparse
+import base64
+import binascii
+import json
+import os
+import sys
+import tempfile
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+from urllib.parse import parse_qs, urlparse
+
+from batch import SUPPORTED_SUFFIXES, _init_worker, _is_excel_file, process_file
+
+DEFAULT_PORT = 8765
+# 上传文件的大小上限（MB）
+DEFAULT_MAX_UPLOAD_MB = 20
+
+# JSON-RPC 错误码
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+INTERNAL_ERROR = -32603
+QUEUE_FULL = -32000
+
+
+class QueueFullError(Exception):
+    """请求队列已满"""
+
+
+class UploadTooLargeError(ValueError):
+    """上传的文件内容超过大小上限"""
+
+
+def process_content(content: bytes, filename: str) -> Dict:
+    """处理上传的文件内容（在工作进程中执行）
+
+    Args:
+        content: 文件内容
+        filename: 原文件名（用于判断格式和结果中的 file 字段）
+
+    Returns:
+        与 batch.process_file 相同格式的结果
+    """
+    suffix = Path(filename).suffix.lower()
+    with tempfile.NamedTemporaryFile(suffix=suffix, delete=False) as f:
+        f.write(content)
+    try:
+        record = process_file(f.name)
+    finally:
+        os.unlink(f.name)
+    record["file"] = filename
+    return record
+
+
+def _ping() -> int:
+    """预热用的空任务"""
+    return os.getpid()
+
+
+class ExtractionService:
+    """工作进程池和有界的请求队列"""
+
+    def __init__(
+        self,
+        workers: int = 1,
+        queue_size: int = 16,
+        max_upload_bytes: int = DEFAULT_MAX_UPLOAD_MB * 1024 * 1024,
+        **worker_options,
+    ):
+        """启动工作进程
+
+        Args:
+            workers: 工作进程数
+            queue_size: 等待中的请求数上限（不含正在处理的请求）
+            max_upload_bytes: 上传文件内容的大小上限（字节，HTTP和JSON-RPC共用）
+            worker_options: 传给 batch._init_worker 的参数
+                            （cache_path, cache_max_bytes, loader, timings, profile_dir,
+                            time_budget, triage, skill_cache_size）
+        """
+        self.workers = max(1, workers)
+        self.queue_size = max(0, queue_size)
+        self.max_upload_bytes = max_upload_bytes
+        self._worker_options = worker_options
+        self._slots = threading.BoundedSemaphore(self.workers + self.queue_size)
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._executor = self._start()
+
+    def _start(self) -> ProcessPoolExecutor:
+        """创建进程池，并等待所有工作进程完成初始化（导入依赖、创建全部提取器）"""
+        options = self._worker_options
+        executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=_init_worker,
+            initargs=(
+                options.get("cache_path"),
+                options.get("cache_max_bytes", 0),
+                options.get("loader", "pandas"),
+                options.get("timings", False),
+                options.get("profile_dir"),
+                True,
+                options.get("time_budget"),
+                options.get("triage", True),
+                options.get("skill_cache_size"),
+            ),
+        )
+        futures = [executor.submit(_ping) for _ in range(self.workers)]
+        for future in futures:
+            future.result()
+        return executor
+
+    def _run(self, name: str, func: Callable[..., Dict], *args: Any) -> Dict:
+        """在工作进程中执行，队列已满时抛出QueueFullError"""
+        if not self._slots.acquire(blocking=False):
+            raise QueueFullError(
+                f"请求队列已满（{self.workers}个进程，队列长度{self.queue_size}）"
+            )
+        with self._lock:
+            self._in_flight += 1
+            executor = self._executor
+        try:
+            return executor.submit(func, *args).result()
+        except BrokenProcessPool:
+            # 工作进程崩溃（内存不足、被kill等）：重建进程池，本次请求报告失败
+            with self._lock:
+                if self._executor is executor:
+                    print("工作进程异常退出，重新启动进程池", file=sys.stderr)
+                    self._executor = self._start()
+            return {"file": name, "ok": False, "error": "工作进程异常退出"}
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+            self._slots.release()
+
+    def extract_path(self, path: str) -> Dict:
+        """提取服务所在机器上的文件"""
+        if not _is_excel_file(Path(path)):
+            return {
+                "file": path,
+                "ok": False,
+                "error": "文件不存在或不是.xls/.xlsx文件",
+            }
+        return self._run(path, process_file, path)
+
+    def extract_content(self, content: bytes, filename: str) -> Dict:
+        """提取上传的文件内容
+
+        Raises:
+            UploadTooLargeError: 内容超过 max_upload_bytes
+            QueueFullError: 请求队列已满
+        """
+        if len(content) > self.max_upload_bytes:
+            raise UploadTooLargeError(
+                f"文件内容超过上限（{self.max_upload_bytes}字节）"
+            )
+        if Path(filename).suffix.lower() not in SUPPORTED_SUFFIXES:
+            return {
+                "file": filename,
+                "ok": False,
+                "error": f"不支持的文件格式: {Path(filename).suffix or filename}",
+            }
+        return self._run(filename, process_content, content, filename)
+
+    def extract(self, params: Dict) -> Dict:
+        """按请求参数提取
+
+        Args:
+            params: {"path": 路径} 或 {"content": base64内容, "filename": 文件名}
+
+        Raises:
+            ValueError: 参数不正确
+            UploadTooLargeError: 文件内容超过 max_upload_bytes
+            QueueFullError: 请求队列已满
+        """
+        if not isinstance(params, dict):
+            raise ValueError("参数必须是对象")
+        if "path" in params:
+            return self.extract_path(str(params["path"]))
+        if "content" in params:
+            encoded = params["content"]
+            # 解码前按base64长度估算，避免先分配超大的内容
+            if isinstance(encoded, (str, bytes)) and (
+                len(encoded) // 4 * 3 > self.max_upload_bytes + 2
+            ):
+                raise UploadTooLargeError(
+                    f"文件内容超过上限（{self.max_upload_bytes}字节）"
+                )
+            try:
+                content = base64.b64decode(encoded, validate=True)
+            except (binascii.Error, TypeError, ValueError):
+                raise ValueError("content 不是有效的base64")
+            return self.extract_content(content, str(params.get("filename", "")))
+        raise ValueError("需要 path 或 content 参数")
+
+    def health(self) -> Dict:
+        """服务状态"""
+        with self._lock:
+            in_flight = self._in_flight
+        return {
+            "workers": self.workers,
+            "queue_size": self.queue_size,
+            "in_flight": in_flight,
+        }
+
+    def close(self):
+        """停止工作进程"""
+        self._executor.shutdown()
+
+
+def make_handler(service: ExtractionService):
+    """创建绑定到服务的HTTP请求处理类"""
+    max_upload_bytes = service.max_upload_bytes
+
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, format, *args):
+            print(f"{self.address_string()} {format % args}", file=sys.stderr)
+
+        def _send(self, status: int, body: Dict):
+            data = json.dumps(body, ensure_ascii=False).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def do_GET(self):
+            if urlparse(self.path).path == "/health":
+                self._send(200, service.health())
+            else:
+                self._send(404, {"error": "not found"})
+
+        def do_POST(self):
+            url = urlparse(self.path)
+            if url.path != "/extract":
+                self._send(404, {"error": "not found"})
+                return
+
+            try:
+                length = int(self.headers.get("Content-Length") or 0)
+            except ValueError:
+                length = -1
+            if length < 0:
+                self._send(400, {"error": "无效的Content-Length"})
+                return
+            # JSON请求体是base64编码后的内容，比文件本身大约1/3
+            if length > max_upload_bytes * 4 // 3 + 1024:
+                self._send(413, {"error": f"请求体超过上限（{max_upload_bytes}字节）"})
+                return
+            body = self.rfile.read(length)
+
+            try:
+                content_type = self.headers.get("Content-Type", "")
+                if content_type.startswith("application/json"):
+                    record = service.extract(json.loads(body.decode("utf-8")))
+                else:
+                    query = parse_qs(url.query)
+                    filename = (query.get("filename") or [""])[0]
+                    record = service.extract_content(body, filename)
+            except QueueFullError as e:
+                self._send(503, {"error": str(e)})
+                return
+            except UploadTooLargeError as e:
+                self._send(413, {"error": str(e)})
+                return
+            except (ValueError, UnicodeDecodeError) as e:
+                self._send(400, {"error": str(e)})
+                return
+            except Exception as e:
+                self._send(500, {"error": f"内部错误: {e}"})
+                return
+
+            self._send(200 if record["ok"] else 422, record)
+
+    return Handler
+
+
+def serve_http(service: ExtractionService, host: str, port: int):
+    """启动HTTP服务（Ctrl+C 停止）"""
+    httpd = ThreadingHTTPServer((host, port), make_handler(service))
+    httpd.daemon_threads = True
+    print(
+        f"提取服务已启动: http://{host}:{httpd.server_address[1]} "
+        f"（{service.workers}个进程，队列长度{service.queue_size}）",
+        file=sys.stderr,
+    )
+    try:
+        httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        httpd.server_close()
+
+
+def _rpc_error(request_id: Any, code: int, message: str) -> Dict:
+    return {
+        "jsonrpc": "2.0",
+        "id": request_id,
+        "error": {"code": code, "message": message},
+    }
+
+
+def handle_rpc(service: ExtractionService, line: str) -> Optional[Dict]:
+    """处理一行JSON-RPC请求
+
+    Returns:
+        响应对象（通知，即没有id的请求，返回None）
+    """
+    try:
+        request = json.loads(line)
+    except ValueError as e:
+        return _rpc_error(None, PARSE_ERROR, f"JSON解析失败: {e}")
+    if not isinstance(request, dict) or "method" not in request:
+        return _rpc_error(None, INVALID_REQUEST, "无效的请求")
+
+    request_id = request.get("id")
+    method = request["method"]
+    try:
+        if method == "extract":
+            result = service.extract(request.get("params") or {})
+        elif method == "health":
+            result = service.health()
+        else:
+            return _rpc_error(request_id, METHOD_NOT_FOUND, f"未知的方法: {method}")
+    except QueueFullError as e:
+        return _rpc_error(request_id, QUEUE_FULL, str(e))
+    except ValueError as e:
+        return _rpc_error(request_id, INVALID_PARAMS, str(e))
+    except Exception as e:
+        # 临时文件写入失败（磁盘已满等）也要回应该id，否则客户端一直等待
+        return _rpc_error(request_id, INTERNAL_ERROR, f"内部错误: {e}")
+
+    if "id" not in request:
+        return None
+    return {"jsonrpc": "2.0", "id": request_id, "result": result}
+
+
+def serve_stdio(service: ExtractionService, stdin=None, stdout=None):
+    """从标准输入逐行读取JSON-RPC请求，并发处理，响应按完成顺序逐行输出"""
+    stdin = stdin or sys.stdin
+    stdout = stdout or sys.stdout
+    write_lock = threading.Lock()
+
+    def respond(line: str):
+        response = handle_rpc(service, line)
+        if response is None:
+            return
+        with write_lock:
+            stdout.write(
+                json.dumps(response, ensure_ascii=False, separators=(",", ":"))
+            )
+            stdout.write("\n")
+            stdout.flush()
+
+    # 线程数与可接受的请求数相同，超出部分由服务拒绝而不是在这里排队
+    with ThreadPoolExecutor(
+        max_workers=service.workers + service.queue_size + 1
+    ) as pool:
+        for line in stdin:
+            if line.strip():
+                pool.submit(respond, line)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """构建服务模式的命令行参数"""
+    parser = argparse.ArgumentParser(
+        prog="python main.py serve",
+        description="常驻提取服务（HTTP或标准输入输出JSON-RPC）",
+    )
+    parser.add_argument("--host", default="127.0.0.1", help="监听地址（默认127.0.0.1）")
+    parser.add_argument(
+        "--port", type=int, default=DEFAULT_PORT, help=f"端口（默认{DEFAULT_PORT}）"
+    )
+    parser.add_argument(
+        "--stdio", action="store_true", help="使用标准输入输出的JSON-RPC代替HTTP"
+    )
+    parser.add_argument(
+        "-j",
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="工作进程数（默认CPU核数）",
+    )
+    parser.add_argument(
+        "--queue-size",
+        type=int,
+        default=16,
+        help="等待处理的请求数上限，超出时拒绝新请求（默认16）",
+    )
+    parser.add_argument(
+        "--max-upload",
+        type=int,
+        default=DEFAULT_MAX_UPLOAD_MB,
+        metavar="MB",
+        help=f"上传文件大小上限（MB，HTTP和--stdio都适用，默认{DEFAULT_MAX_UPLOAD_MB}）",
+    )
+    parser.add_argument(
+        "--cache",
+        nargs="?",
+        const="",
+        default=None,
+        metavar="PATH",
+        help="启用结果缓存（可指定数据库路径，默认 ~/.cache/skills_extractor/）",
+    )
+    parser.add_argument(
+        "--cache-size",
+        type=int,
+        default=256,
+        metavar="MB",
+        help="缓存大小上限（MB，默认256）",
+    )
+    parser.add_argument(
+        "--skill-cache-size",
+        type=int,
+        metavar="N",
+        help="每个工作进程的技能文本缓存容量（条目数，0 表示不缓存，默认16384）",
+    )
+    parser.add_argument(
+        "--loader",
+        choices=("pandas", "native", "streaming"),
+        default="pandas",
+        help="工作簿读取方式（默认pandas）",
+    )
+    parser.add_argument(
+        "--timings", action="store_true", help="在结果的 _meta.timings 中附加耗时"
+    )
+    parser.add_argument(
+        "--time-budget",
+        type=float,
+        metavar="SECONDS",
+        help="每个请求的时间预算（秒），超时后返回已完成的字段，不再占用工作进程",
+    )
+    parser.add_argument(
+        "--no-triage",
+        dest="triage",
+        action="store_false",
+        help="不跳过任何sheet（默认跳过封面、说明等不像简历的sheet）",
+    )
+    return parser
+
+
+def main(argv: Optional[list] = None) -> int:
+    """服务模式入口"""
+    args = build_parser().parse_args(argv)
+
+    service = ExtractionService(
+        workers=args.workers,
+        queue_size=args.queue_size,
+        max_upload_bytes=args.max_upload * 1024 * 1024,
+        cache_path=args.cache,
+        cache_max_bytes=args.cache_size * 1024 * 1024,
+        loader=args.loader,
+        timings=args.timings,
+        time_budget=args.time_budget,
+        triage=args.triage,
+        skill_cache_size=args.skill_cache_size,
+    )
+    try:
+        if args.stdio:
+            serve_stdio(service)
+        else:
+            serve_http(service, args.host, args.port)
+    finally:
+        service.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,10 +1,18 @@
-from .date_utils import convert_excel_serial_to_date, calculate_age_from_birthdate
-from .text_utils import dataframe_to_text
-from .validation_utils import is_valid_name
-
-__all__ = [
-    "convert_excel_serial_to_date",
-    "calculate_age_from_birthdate",
-    "dataframe_to_text",
-    "is_valid_name",
-]
+# 工具函数在首次访问时才导入（validation_utils 会编译全部正则）
+_LAZY_EXPORTS = {
+    "convert_excel_serial_to_date": ".date_utils",
+    "calculate_age_from_birthdate": ".date_utils",
+    "dataframe_to_text": ".text_utils",
+    "is_valid_name": ".validation_utils",
+}
+
+__all__ = list(_LAZY_EXPORTS)
+
+
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        import importlib
+
+        module = importlib.import_module(_LAZY_EXPORTS[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
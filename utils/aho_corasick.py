@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+"""Aho-Corasick多模式匹配自动机"""
+
+from collections import deque
+from typing import Dict, FrozenSet, Iterable, List, Set
+
+
+class AhoCorasick:
+    """多模式子串匹配自动机
+
+    一次扫描文本即可找出所有出现的模式串（含重叠、互为子串的情况），
+    结果与逐个执行 ``pattern in text`` 完全一致。
+    """
+
+    def __init__(self, patterns: Iterable[str]):
+        """构建自动机
+
+        Args:
+            patterns: 模式串集合（空串会被忽略）
+        """
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[FrozenSet[str]] = []
+        outputs: List[Set[str]] = [set()]
+
+        # 构建Trie
+        for pattern in patterns:
+            if not pattern:
+                continue
+            state = 0
+            for char in pattern:
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][char] = next_state
+                    self._goto.append({})
+                    self._fail.append(0)
+                    outputs.append(set())
+                state = next_state
+            outputs[state].add(pattern)
+
+        # BFS计算失败指针，并合并输出
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[next_state] = self._goto[fail].get(char, 0)
+                outputs[next_state] |= outputs[self._fail[next_state]]
+
+        self._output = [frozenset(output) for output in outputs]
+        self.patterns = frozenset().union(*self._output)
+
+    def find_all(self, text: str) -> FrozenSet[str]:
+        """查找文本中出现的所有模式串
+
+        Args:
+            text: 待扫描文本
+
+        Returns:
+            出现过的模式串集合
+        """
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+        state = 0
+        found = None
+
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if output[state]:
+                if found is None:
+                    found = set(output[state])
+                else:
+                    found |= output[state]
+
+        return frozenset(found) if found else frozenset()
+
+    def contains_any(self, text: str) -> bool:
+        """文本中是否出现任一模式串（找到第一个即返回）
+
+        Args:
+            text: 待扫描文本
+
+        Returns:
+            是否出现
+        """
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+        state = 0
+
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if output[state]:
+                return True
+
+        return False
@@ -2,7 +2,10 @@
 """日期处理工具"""
 
 from datetime import datetime, timedelta
-from typing import Optional, Union
+from typing import List, Optional, Sequence, Union
+
+# Excel序列日期的上限（9999-12-31）
+EXCEL_SERIAL_MAX = 2958465
 
 
 def convert_excel_serial_to_date(
@@ -39,6 +42,38 @@ def convert_excel_serial_to_date(
     return None
 
 
+def convert_excel_serials_to_dates(
+    serial_numbers: Sequence[Union[int, float]],
+) -> List[Optional[datetime]]:
+    """批量将Excel序列数字转换为日期
+
+    与逐个调用 convert_excel_serial_to_date 结果的日期部分一致
+    （返回当天0点，不保留序列数字中的时间部分）。
+
+    Args:
+        serial_numbers: Excel序列日期数字
+
+    Returns:
+        与输入等长的列表，无法转换或不在1950～2030年的为None
+    """
+    import numpy as np
+
+    serials = np.asarray(serial_numbers, dtype=np.float64)
+    valid = np.isfinite(serials) & (serials >= 1) & (serials <= EXCEL_SERIAL_MAX)
+
+    # Excel的bug：1900年被错误地认为是闰年，1900年3月1日（61）之后减去1天
+    days = np.zeros(len(serials), dtype=np.int64)
+    days[valid] = np.floor(serials[valid] - 1 - (serials[valid] >= 61))
+    dates = np.datetime64("1900-01-01", "D") + days
+    years = dates.astype("datetime64[Y]").astype(np.int64) + 1970
+    valid &= (years >= 1950) & (years <= 2030)
+
+    return [
+        date if is_valid else None
+        for date, is_valid in zip(dates.astype("datetime64[us]").tolist(), valid)
+    ]
+
+
 def calculate_age_from_birthdate(birthdate: datetime) -> Optional[int]:
     """从生年月日计算年龄
 
@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+"""日志工具 - 提取过程的诊断信息统一经由logging输出
+
+各模块通过 get_logger(__name__) 获取日志记录器，全部挂在 "resume_extractor" 之下，
+由 configure_logging 统一设置输出级别：
+
+- quiet:   只输出警告和错误（批量处理用，逐单元格的诊断信息不做任何格式化）
+- 默认:    输出每个字段的提取进度（INFO）
+- verbose: 额外输出各提取器的候选、逐单元格诊断信息（DEBUG）
+"""
+
+import logging
+import sys
+
+LOGGER_NAME = "resume_extractor"
+
+
+class _StdoutHandler(logging.StreamHandler):
+    """输出到当前的 sys.stdout（兼容 contextlib.redirect_stdout）"""
+
+    def __init__(self):
+        super().__init__(sys.stdout)
+
+    @property
+    def stream(self):
+        return sys.stdout
+
+    @stream.setter
+    def stream(self, value):
+        pass
+
+
+def get_logger(name: str) -> logging.Logger:
+    """获取模块的日志记录器
+
+    Args:
+        name: 模块名（通常为 __name__）
+
+    Returns:
+        "resume_extractor.<name>" 日志记录器
+    """
+    return logging.getLogger(f"{LOGGER_NAME}.{name}")
+
+
+def configure_logging(quiet: bool = False, verbose: bool = False) -> logging.Logger:
+    """设置提取器日志的输出级别
+
+    非quiet模式下，如果还没有配置任何输出，添加一个输出到标准输出的处理器，
+    格式与原先的 print 输出一致。
+
+    Args:
+        quiet: 只输出警告和错误
+        verbose: 输出逐单元格的诊断信息
+
+    Returns:
+        提取器的根日志记录器
+    """
+    logger = logging.getLogger(LOGGER_NAME)
+    if quiet:
+        logger.setLevel(logging.WARNING)
+    elif verbose:
+        logger.setLevel(logging.DEBUG)
+    else:
+        logger.setLevel(logging.INFO)
+
+    if not quiet and not logger.handlers and not logging.getLogger().handlers:
+        handler = _StdoutHandler()
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        logger.addHandler(handler)
+        logger.propagate = False
+
+    return logger
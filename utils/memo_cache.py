@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+"""进程内的有界LRU缓存 - 跨文件复用按字符串计算的结果，带命中统计"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable
+
+
+class MemoCache:
+    """有界LRU缓存
+
+    与 functools.lru_cache 相比，容量可以在运行时调整，
+    并可随时读取命中统计，用于根据实际命中率确定容量。
+    """
+
+    def __init__(self, maxsize: int):
+        """初始化缓存
+
+        Args:
+            maxsize: 最大条目数（0 表示不缓存）
+        """
+        self.maxsize = max(0, maxsize)
+        self.hits = 0
+        self.misses = 0
+        self._data: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """获取缓存值，未命中时计算并保存
+
+        Args:
+            key: 缓存键
+            compute: 未命中时调用的计算函数（在锁外执行）
+
+        Returns:
+            缓存值或计算结果
+        """
+        with self._lock:
+            if key in self._data:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return self._data[key]
+            self.misses += 1
+
+        value = compute()
+        if self.maxsize:
+            with self._lock:
+                self._data[key] = value
+                self._data.move_to_end(key)
+                while len(self._data) > self.maxsize:
+                    self._data.popitem(last=False)
+        return value
+
+    def resize(self, maxsize: int):
+        """调整容量（缩小时淘汰最久未使用的条目）"""
+        with self._lock:
+            self.maxsize = max(0, maxsize)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        """清空缓存和命中统计"""
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def info(self) -> Dict[str, Any]:
+        """命中统计
+
+        Returns:
+            {"hits", "misses", "hit_rate", "size", "maxsize"}
+        """
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+        }
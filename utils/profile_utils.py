@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+"""性能分析工具 - 用cProfile包装一次提取，输出pstats和折叠栈
+
+- .pstats:    python -m pstats / snakeviz 等工具直接读取
+- .collapsed: 每行 "帧;帧;... 微秒数"，可直接交给 flamegraph.pl / speedscope 生成火焰图
+
+cProfile只记录调用者→被调用者的边，不记录完整调用栈，
+折叠栈按各条边占被调用函数总耗时的比例，从根函数向下分摊还原（近似值）。
+"""
+
+import cProfile
+import os
+import pstats
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Callable, Dict, Tuple
+
+# 折叠栈的最大深度（防止调用图过深时路径数爆炸）
+MAX_STACK_DEPTH = 64
+# 分摊后小于该耗时（秒）的分支不再展开
+MIN_BRANCH_SECONDS = 1e-6
+
+
+def _frame_label(func: Tuple[str, int, str]) -> str:
+    """函数标识转为火焰图的帧名（分号是折叠栈的帧分隔符，需要替换）"""
+    filename, lineno, name = func
+    if filename == "~":
+        # 内置函数：("~", 0, "<built-in method ...>")
+        label = name
+    else:
+        label = f"{name} ({Path(filename).name}:{lineno})"
+    return label.replace(";", ",")
+
+
+def collapsed_stacks(stats: pstats.Stats) -> Dict[str, float]:
+    """从pstats的调用图还原折叠栈
+
+    Args:
+        stats: pstats.Stats对象
+
+    Returns:
+        "帧;帧;..." -> 该栈的自身耗时（秒）
+    """
+    entries = stats.stats
+    callees = defaultdict(list)
+    for func, (_, _, _, _, callers) in entries.items():
+        for caller, edge in callers.items():
+            callees[caller].append((func, edge))
+
+    stacks: Dict[str, float] = defaultdict(float)
+
+    def walk(func, path, on_path, self_time, cumulative):
+        if self_time > 0:
+            stacks[";".join(path)] += self_time
+        total = entries[func][3]
+        if len(path) >= MAX_STACK_DEPTH or total <= 0:
+            return
+        share = cumulative / total
+        for callee, (_, _, edge_self, edge_cumulative) in callees.get(func, ()):
+            # 递归调用已经计入当前路径
+            if callee in on_path or edge_cumulative * share < MIN_BRANCH_SECONDS:
+                continue
+            on_path.add(callee)
+            walk(
+                callee,
+                path + [_frame_label(callee)],
+                on_path,
+                edge_self * share,
+                edge_cumulative * share,
+            )
+            on_path.discard(callee)
+
+    for func, (_, _, self_time, cumulative, callers) in entries.items():
+        if not callers:
+            walk(func, [_frame_label(func)], {func}, self_time, cumulative)
+
+    return stacks
+
+
+def write_profile(profiler: cProfile.Profile, output_dir: str, name: str) -> Path:
+    """保存分析结果
+
+    Args:
+        profiler: 已停止的cProfile.Profile
+        output_dir: 输出目录（不存在时创建）
+        name: 文件名（不含扩展名）
+
+    Returns:
+        .pstats文件路径（同目录下有同名的 .collapsed 文件）
+    """
+    output = Path(output_dir)
+    output.mkdir(parents=True, exist_ok=True)
+
+    pstats_path = output / f"{name}.pstats"
+    profiler.dump_stats(str(pstats_path))
+
+    stacks = collapsed_stacks(pstats.Stats(profiler))
+    with open(output / f"{name}.collapsed", "w", encoding="utf-8") as f:
+        for stack, seconds in sorted(stacks.items()):
+            microseconds = round(seconds * 1_000_000)
+            if microseconds > 0:
+                f.write(f"{stack} {microseconds}\n")
+
+    return pstats_path
+
+
+def profile_call(
+    func: Callable[..., Any], output_dir: str, name: str, *args, **kwargs
+) -> Tuple[Any, Path]:
+    """在cProfile下执行一次调用并保存结果
+
+    只记录调用线程（字段提取使用多个线程时，其他线程中的耗时不包含在内）。
+
+    Args:
+        func: 被分析的函数
+        output_dir: 输出目录
+        name: 文件名前缀（实际文件名追加时间戳和进程号，批量处理时不会冲突）
+
+    Returns:
+        (函数返回值, .pstats文件路径)
+    """
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        result = func(*args, **kwargs)
+    finally:
+        profiler.disable()
+    stamp = time.strftime("%Y%m%d-%H%M%S")
+    millis = int(time.time() * 1000) % 1000
+    path = write_profile(
+        profiler, output_dir, f"{name}-{stamp}.{millis:03d}-{os.getpid()}"
+    )
+    return result, path
@@ -0,0 +1,266 @@
+# -*- coding: utf-8 -*-
+"""提取结果缓存 - 按文件内容哈希和提取器版本持久化结果"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import time
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+
+# 项目根目录（utils的上一级）
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+# 参与版本指纹计算的源码：提取逻辑和常量有任何改动，旧缓存自动失效
+_FINGERPRINT_SOURCES = ("extractor.py", "base", "extractors", "utils")
+
+DEFAULT_CACHE_PATH = Path.home() / ".cache" / "skills_extractor" / "results.sqlite3"
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+
+@lru_cache(maxsize=1)
+def extractor_fingerprint() -> str:
+    """计算提取器代码和常量的版本指纹
+
+    Returns:
+        源码内容的SHA-256（十六进制）
+    """
+    digest = hashlib.sha256()
+    for source in _FINGERPRINT_SOURCES:
+        path = _PROJECT_ROOT / source
+        files = sorted(path.rglob("*.py")) if path.is_dir() else [path]
+        for file in files:
+            digest.update(file.relative_to(_PROJECT_ROOT).as_posix().encode("utf-8"))
+            digest.update(b"\0")
+            digest.update(file.read_bytes())
+            digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def file_sha256(file_path: str) -> str:
+    """计算文件内容的SHA-256
+
+    Args:
+        file_path: 文件路径
+
+    Returns:
+        十六进制哈希值
+    """
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ResultCache:
+    """基于SQLite的提取结果缓存
+
+    缓存键为 (工作簿内容SHA-256, 提取器版本指纹)，同一份简历无论文件名、
+    来源如何，只要内容不变就直接返回已保存的结果，不再打开工作簿。
+    总大小超过上限时按最近访问时间淘汰（LRU）。
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        version: Optional[str] = None,
+    ):
+        """初始化缓存
+
+        Args:
+            path: SQLite数据库路径（默认 ~/.cache/skills_extractor/results.sqlite3，
+                  可用环境变量 SKILLS_EXTRACTOR_CACHE 覆盖）
+            max_bytes: 缓存结果的总大小上限（字节）
+            version: 版本指纹（默认根据提取器源码计算）
+        """
+        if path is None:
+            path = os.environ.get("SKILLS_EXTRACTOR_CACHE", DEFAULT_CACHE_PATH)
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.version = version or extractor_fingerprint()
+        self.hits = 0
+        self.misses = 0
+        self._conn: Optional[sqlite3.Connection] = None
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        """数据库连接（首次使用时打开）"""
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            # 批量模式下多个进程共享同一个数据库
+            self._conn = sqlite3.connect(str(self.path), timeout=30)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS results (
+                    file_hash TEXT NOT NULL,
+                    version TEXT NOT NULL,
+                    result TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    created_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL,
+                    PRIMARY KEY (file_hash, version)
+                )
+                """)
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_results_accessed "
+                "ON results (accessed_at)"
+            )
+            self._conn.commit()
+        return self._conn
+
+    def get(self, file_hash: str) -> Optional[Dict]:
+        """查询缓存结果
+
+        Args:
+            file_hash: 工作簿内容的SHA-256
+
+        Returns:
+            缓存的结果字典，未命中时返回None
+        """
+        row = self.conn.execute(
+            "SELECT result FROM results WHERE file_hash = ? AND version = ?",
+            (file_hash, self.version),
+        ).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        with self.conn:
+            self.conn.execute(
+                "UPDATE results SET accessed_at = ? "
+                "WHERE file_hash = ? AND version = ?",
+                (time.time(), file_hash, self.version),
+            )
+        return json.loads(row[0])
+
+    def put(self, file_hash: str, result: Dict):
+        """保存结果，并在超出大小上限时淘汰最久未访问的条目
+
+        Args:
+            file_hash: 工作簿内容的SHA-256
+            result: 提取结果
+        """
+        payload = json.dumps(result, ensure_ascii=False)
+        now = time.time()
+        with self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?)",
+                (file_hash, self.version, payload, len(payload), now, now),
+            )
+            self._evict()
+
+    def _evict(self):
+        """按LRU淘汰条目直到总大小不超过上限"""
+        total = self.conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM results"
+        ).fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        rows = self.conn.execute(
+            "SELECT file_hash, version, size FROM results ORDER BY accessed_at"
+        )
+        stale = []
+        for file_hash, version, size in rows:
+            if total <= self.max_bytes:
+                break
+            stale.append((file_hash, version))
+            total -= size
+        self.conn.executemany(
+            "DELETE FROM results WHERE file_hash = ? AND version = ?", stale
+        )
+
+    def invalidate(self, file_hashes: Iterable[str]) -> int:
+        """删除指定工作簿的所有缓存（不区分版本、读取方式和筛选设置）
+
+        Returns:
+            删除的条目数
+        """
+        with self.conn:
+            cursor = self.conn.executemany(
+                "DELETE FROM results WHERE file_hash = ? OR file_hash LIKE ?",
+                [(file_hash, f"{file_hash}:%") for file_hash in file_hashes],
+            )
+        return cursor.rowcount
+
+    def prune(self) -> int:
+        """删除旧版本提取器产生的缓存
+
+        Returns:
+            删除的条目数
+        """
+        with self.conn:
+            cursor = self.conn.execute(
+                "DELETE FROM results WHERE version != ?", (self.version,)
+            )
+        return cursor.rowcount
+
+    def clear(self) -> int:
+        """清空缓存
+
+        Returns:
+            删除的条目数
+        """
+        with self.conn:
+            cursor = self.conn.execute("DELETE FROM results")
+        return cursor.rowcount
+
+    def stats(self) -> Dict:
+        """缓存统计信息"""
+        entries, total = self.conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM results"
+        ).fetchone()
+        current = self.conn.execute(
+            "SELECT COUNT(*) FROM results WHERE version = ?", (self.version,)
+        ).fetchone()[0]
+        return {
+            "path": str(self.path),
+            "version": self.version[:12],
+            "entries": entries,
+            "current_version_entries": current,
+            "bytes": total,
+            "max_bytes": self.max_bytes,
+        }
+
+    def close(self):
+        """关闭数据库连接"""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+
+def main(argv: Optional[list] = None) -> int:
+    """缓存管理命令入口：python main.py cache <stats|prune|clear|invalidate>"""
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        prog="python main.py cache", description="管理提取结果缓存"
+    )
+    parser.add_argument("--path", help="缓存数据库路径")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("stats", help="显示缓存统计")
+    commands.add_parser("prune", help="删除旧版本提取器的缓存")
+    commands.add_parser("clear", help="清空缓存")
+    invalidate_parser = commands.add_parser("invalidate", help="删除指定文件的缓存")
+    invalidate_parser.add_argument("files", nargs="+", help="Excel文件路径")
+    args = parser.parse_args(argv)
+
+    cache = ResultCache(args.path)
+    try:
+        if args.command == "stats":
+            print(json.dumps(cache.stats(), ensure_ascii=False, indent=2))
+        elif args.command == "prune":
+            print(f"已删除 {cache.prune()} 条旧版本缓存")
+        elif args.command == "clear":
+            print(f"已删除 {cache.clear()} 条缓存")
+        elif args.command == "invalidate":
+            hashes = [file_sha256(file) for file in args.files]
+            print(f"已删除 {cache.invalidate(hashes)} 条缓存")
+    finally:
+        cache.close()
+    return 0
@@ -1,27 +1,33 @@
 # -*- coding: utf-8 -*-
 """文本处理工具"""
 
-import pandas as pd
 from typing import List
 
 
-def dataframe_to_text(df: pd.DataFrame) -> str:
+def dataframe_to_text(df: "pd.DataFrame") -> str:
     """将DataFrame转换为文本
 
     Args:
         df: pandas DataFrame对象
 
     Returns:
-        转换后的文本字符串
+        转换后的文本字符串（格式同 grid_to_text）
     """
-    text_parts = []
+    from base.sheet_grid import SheetGrid
 
-    for idx, row in df.iterrows():
-        row_text = " ".join([str(cell) for cell in row if pd.notna(cell)])
-        if row_text.strip():
-            text_parts.append(row_text)
+    return SheetGrid.from_dataframe(df).text
 
-    return "\n".join(text_parts)
+
+def grid_to_text(grid) -> str:
+    """将SheetGrid转换为文本
+
+    Args:
+        grid: SheetGrid对象
+
+    Returns:
+        每行非空单元格用空格拼接、空行省略后的文本（缓存在网格上，见 base.row_text）
+    """
+    return grid.text
 
 
 def normalize_text(text: str) -> str: